@@ -0,0 +1,205 @@
+# avatars.py
+"""
+Ranking avatars.
+
+Every avatar is downloaded concurrently under a single deadline, so a slow
+or dead avatar host costs at most AVATAR_DEADLINE_SECONDS for the whole
+table instead of a full request timeout per row. Rows without a usable
+avatar (no URL, a failed download, a download still pending at the
+deadline) get an initials placeholder drawn locally with Pillow, so every
+row still shows an image.
+
+URLs that failed are kept in a negative cache for a short TTL and are not
+requested again meanwhile: not for the next rows, not for the next
+dashboards of the process (batch, daemon and load-test modes) and, when the
+cache has a file, not for the next runs either.
+"""
+import base64
+import json
+import os
+import re
+import threading
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor, wait
+from functools import lru_cache
+from io import BytesIO
+
+from PIL import Image, ImageDraw, ImageFont
+
+from config import (
+    AVATAR_DEADLINE_SECONDS, AVATAR_FETCH_WORKERS, AVATAR_REQUEST_TIMEOUT, AVATAR_MAX_RETRIES,
+    AVATAR_NEGATIVE_TTL_SECONDS, AVATAR_PLACEHOLDER_SIZE, AVATAR_PLACEHOLDER_COLORS,
+    AVATAR_PLACEHOLDER_TEXT_COLOR, WATERMARK_FONT_FAMILY
+)
+from image_utils import encode_image_from_url
+
+
+class NegativeCache:
+    """
+    URLs that failed recently, each one remembered for `ttl_seconds`.
+
+    Safe to use from the download threads. With a path, the entries are read
+    from and written to a JSON file so they carry over to the next runs
+    (persist it with actions/cache).
+    """
+
+    def __init__(self, path=None, ttl_seconds=AVATAR_NEGATIVE_TTL_SECONDS, clock=time.time):
+        """
+        Args:
+            path (str): JSON file of {url: expiry timestamp}. None keeps the cache in memory.
+            ttl_seconds (float): How long a failing URL is skipped.
+            clock (callable): Wall clock (the expiries are stored across runs), replaceable in tests.
+        """
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._expiries = self._load() if path else {}
+        self._dirty = False
+
+    def _load(self):
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            return {}  # No cache yet, or an unreadable one: start empty
+        if not isinstance(entries, dict):
+            return {}
+        now = self._clock()
+        return {url: expiry for url, expiry in entries.items()
+                if isinstance(expiry, (int, float)) and expiry > now}
+
+    def __contains__(self, url):
+        with self._lock:
+            expiry = self._expiries.get(url)
+            if expiry is None:
+                return False
+            if expiry <= self._clock():
+                del self._expiries[url]
+                return False
+            return True
+
+    def __len__(self):
+        now = self._clock()
+        with self._lock:
+            return sum(1 for expiry in self._expiries.values() if expiry > now)
+
+    def add(self, url):
+        """Skips `url` for the next `ttl_seconds`."""
+        with self._lock:
+            self._expiries[url] = self._clock() + self.ttl_seconds
+            self._dirty = True
+
+    def save(self):
+        """Writes the live entries to the file, if the cache has one and changed."""
+        if not self.path or not self._dirty:
+            return
+        now = self._clock()
+        with self._lock:
+            entries = {url: expiry for url, expiry in self._expiries.items() if expiry > now}
+            self._dirty = False
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(entries, f)
+        os.replace(tmp_path, self.path)
+
+
+# Failures seen by this process, used when no cache is passed
+FAILED_AVATAR_URLS = NegativeCache()
+
+
+def _initials(name):
+    words = re.findall(r"[^\W_]+", name or "")
+    if not words:
+        return "?"
+    if len(words) == 1:
+        return words[0][0].upper()
+    return (words[0][0] + words[-1][0]).upper()
+
+
+@lru_cache(maxsize=256)
+def placeholder_avatar(name, size=AVATAR_PLACEHOLDER_SIZE):
+    """
+    Initials avatar drawn locally, for rows without a downloaded avatar.
+
+    The background color is derived from the name, so a developer keeps the
+    same placeholder from one dashboard to the next.
+
+    Args:
+        name (str): Developer name, e.g. "Jane Doe" gives "JD".
+        size (int): Width and height in pixels.
+
+    Returns:
+        str: PNG data URI to use in layout_image (Plotly).
+    """
+    color = AVATAR_PLACEHOLDER_COLORS[zlib.crc32((name or "").encode("utf-8")) % len(AVATAR_PLACEHOLDER_COLORS)]
+    img = Image.new("RGBA", (size, size), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(img)
+    draw.ellipse((0, 0, size - 1, size - 1), fill=color)
+    try:
+        font = ImageFont.truetype(WATERMARK_FONT_FAMILY, size * 2 // 5)
+    except OSError:
+        font = ImageFont.load_default()
+
+    # Center the text box explicitly; bitmap fonts do not support anchors
+    text = _initials(name)
+    left, top, right, bottom = draw.textbbox((0, 0), text, font=font)
+    position = ((size - (right - left)) / 2 - left, (size - (bottom - top)) / 2 - top)
+    draw.text(position, text, fill=AVATAR_PLACEHOLDER_TEXT_COLOR, font=font)
+
+    buffer = BytesIO()
+    img.save(buffer, format="PNG")
+    encoded = base64.b64encode(buffer.getvalue()).decode("ascii")
+    return f"data:image/png;base64,{encoded}"
+
+
+def fetch_avatars(devs, budget=None, deadline_seconds=AVATAR_DEADLINE_SECONDS, negative_cache=None):
+    """
+    Downloads the avatars of the ranking concurrently, with placeholders for the missing ones.
+
+    Downloads still pending after `deadline_seconds` (or when the run budget
+    runs out) are abandoned: their rows get the placeholder and their URLs are
+    added to the negative cache like failed ones.
+
+    Args:
+        devs (list): Developers (payload_model.Developer) in ranking order.
+        budget (http_utils.DeadlineBudget): Shared run budget, None for unlimited.
+        deadline_seconds (float): Time allowed for all the downloads together.
+        negative_cache (NegativeCache): Recently failed URLs. Defaults to the
+            process-wide FAILED_AVATAR_URLS.
+
+    Returns:
+        list: One image source (data URI) per developer.
+    """
+    cache = FAILED_AVATAR_URLS if negative_cache is None else negative_cache
+    urls = {dev.avatar for dev in devs if dev.avatar and dev.avatar not in cache}
+    sources = {}
+    if urls:
+        if budget is not None:
+            deadline_seconds = min(deadline_seconds, budget.remaining())
+        executor = ThreadPoolExecutor(max_workers=min(AVATAR_FETCH_WORKERS, len(urls)))
+        futures = {
+            executor.submit(encode_image_from_url, url, budget, cache, AVATAR_REQUEST_TIMEOUT, AVATAR_MAX_RETRIES): url
+            for url in urls
+        }
+        done, pending = wait(futures, timeout=deadline_seconds)
+        # Do not wait for the stragglers; their requests end at AVATAR_REQUEST_TIMEOUT anyway
+        executor.shutdown(wait=False, cancel_futures=True)
+        for future in done:
+            sources[futures[future]] = future.result()
+        if pending:
+            print(f"Avatar deadline reached after {deadline_seconds:.1f}s: "
+                  f"{len(pending)} avatars replaced by placeholders")
+            for future in pending:
+                cache.add(futures[future])
+        try:
+            cache.save()
+        except OSError as e:
+            print(f"Error saving the avatar cache: {e}")
+
+    placeholders = sum(1 for dev in devs if not sources.get(dev.avatar))
+    if placeholders:
+        print(f"Using placeholder avatars for {placeholders} of {len(devs)} developers")
+    return [sources.get(dev.avatar) or placeholder_avatar(dev.name) for dev in devs]
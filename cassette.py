@@ -0,0 +1,202 @@
+# cassette.py
+"""
+Record and replay of the dashboard's network traffic.
+
+Record mode saves every GET response of a real run (the data API payload,
+the avatars and the Gitlights logo) to a cassette directory. Replay mode
+serves those responses from a local stand-in server, together with a fake
+upload endpoint that answers with an `image_url`, so generate_dashboard runs
+fully offline and deterministically. This is meant for benchmarking and
+profiling the build/render path without network variance.
+
+Usage:
+    with use_cassette("cassettes/demo", mode="record"):
+        generate_dashboard(owner="octo", repo="demo")
+
+    with use_cassette("cassettes/demo", mode="replay"):
+        generate_dashboard(owner="octo", repo="demo")
+
+or CASSETTE_MODE=record|replay and CASSETTE_DIR=... when running main.py.
+"""
+import hashlib
+import json
+import os
+import threading
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from http_utils import set_request_hook
+
+CASSETTE_MODES = ("record", "replay")
+INDEX_FILE = "index.json"
+
+
+def request_key(method, url, params=None):
+    """
+    Stable identifier of a request: its method and full URL, query string included.
+    """
+    full_url = requests.Request(method.upper(), url, params=params).prepare().url
+    return hashlib.sha1(f"{method.upper()} {full_url}".encode("utf-8")).hexdigest()[:20]
+
+
+class CassetteRecorder:
+    """Request hook saving every GET response to a cassette directory."""
+
+    def __init__(self, cassette_dir):
+        self.cassette_dir = cassette_dir
+        os.makedirs(cassette_dir, exist_ok=True)
+        self._index_path = os.path.join(cassette_dir, INDEX_FILE)
+        self._lock = threading.Lock()
+        self.index = {}
+        if os.path.exists(self._index_path):
+            with open(self._index_path) as f:
+                self.index = json.load(f)
+
+    def before_request(self, method, url, kwargs):
+        return url, kwargs
+
+    def after_response(self, method, url, kwargs, response):
+        if method != "get":
+            return  # Uploads are sent for real but not replayed from the cassette
+        self.save(method, url, response.content, params=kwargs.get("params"), status=response.status_code,
+                  content_type=response.headers.get("Content-Type", "application/octet-stream"))
+
+    def save(self, method, url, content, params=None, status=200, content_type="application/octet-stream"):
+        """
+        Stores one response in the cassette, replacing any previous recording of the request.
+
+        Args:
+            method (str): HTTP method of the request.
+            url (str): Request URL, without the query string passed in `params`.
+            content (bytes): Response body.
+            params (dict): Query parameters of the request.
+            status (int): Response status code.
+            content_type (str): Response Content-Type.
+        """
+        key = request_key(method, url, params)
+        with self._lock:
+            with open(os.path.join(self.cassette_dir, f"{key}.bin"), "wb") as f:
+                f.write(content)
+            self.index[key] = {"method": method.upper(), "url": url, "status": status, "content_type": content_type}
+            with open(self._index_path, "w") as f:
+                json.dump(self.index, f, indent=2, sort_keys=True)
+
+
+class ReplayServer:
+    """
+    Local HTTP server answering recorded requests and fake uploads.
+
+    GET /cassette/<key> returns the recorded response; POST /upload accepts
+    any upload and returns {"image_url": ...}. Unknown keys return 404.
+    """
+
+    def __init__(self, cassette_dir, host="127.0.0.1", port=0):
+        with open(os.path.join(cassette_dir, INDEX_FILE)) as f:
+            index = json.load(f)
+        self.cassette_dir = cassette_dir
+        self.uploads = []
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                key = self.path.rsplit("/", 1)[-1]
+                entry = index.get(key)
+                if not self.path.startswith("/cassette/") or entry is None:
+                    self._reply(404, "application/json", b'{"detail": "not in cassette"}')
+                    return
+                with open(os.path.join(cassette_dir, f"{key}.bin"), "rb") as f:
+                    self._reply(entry["status"], entry["content_type"], f.read())
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                server.uploads.append(len(self.rfile.read(length)))
+                image_url = f"{server.url}/uploads/{len(server.uploads)}"
+                self._reply(200, "application/json", json.dumps({"image_url": image_url}).encode("utf-8"))
+
+            def _reply(self, status, content_type, body):
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass  # Keep benchmark output quiet
+
+        self._httpd = ThreadingHTTPServer((host, port), Handler)
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="cassette-replay", daemon=True)
+        self._thread.start()
+        return self
+
+    def close(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class ReplayHook:
+    """
+    Request hook sending GETs to the replay server's recording and POSTs to its upload endpoint.
+
+    Takes the server's base URL, so other processes can replay from a shared server.
+    """
+
+    def __init__(self, base_url):
+        self.base_url = base_url
+
+    def before_request(self, method, url, kwargs):
+        if method == "get":
+            key = request_key(method, url, kwargs.get("params"))
+            kwargs = {k: v for k, v in kwargs.items() if k != "params"}
+            return f"{self.base_url}/cassette/{key}", kwargs
+        return f"{self.base_url}/upload", kwargs
+
+    def after_response(self, method, url, kwargs, response):
+        if response.status_code == 404 and method == "get":
+            print(f"Cassette has no recording for {url}")
+
+
+@contextmanager
+def use_cassette(cassette_dir, mode="replay"):
+    """
+    Records or replays every request sent through http_utils.request_with_retries.
+
+    Args:
+        cassette_dir (str): Directory holding the recorded responses.
+        mode (str): "record" or "replay".
+
+    Yields:
+        CassetteRecorder or ReplayServer: The active recorder or replay server.
+    """
+    if mode not in CASSETTE_MODES:
+        raise ValueError(f"Unknown cassette mode '{mode}', expected one of {CASSETTE_MODES}")
+    if mode == "record":
+        recorder = CassetteRecorder(cassette_dir)
+        previous = set_request_hook(recorder)
+        try:
+            yield recorder
+        finally:
+            set_request_hook(previous)
+        print(f"Recorded {len(recorder.index)} responses to {cassette_dir}")
+    else:
+        with ReplayServer(cassette_dir) as server:
+            previous = set_request_hook(ReplayHook(server.url))
+            try:
+                yield server
+            finally:
+                set_request_hook(previous)
@@ -0,0 +1,99 @@
+# categories.py
+"""
+Long-tail folding of chart categories.
+
+Backends can return many small categories: every pie slice gets its own
+label layout in the renderer and the smallest ones end up as unreadable
+slivers. The reducers below fold categories below a minimum share, or
+beyond the top K, into a single "Other" category before the figures are
+built, so the render cost stays flat however many categories come in.
+"""
+import numpy as np
+
+from config import (
+    PIE_MAX_SLICES, PIE_MIN_SHARE, BAR_MAX_SERIES, BAR_MIN_SHARE, OTHER_CATEGORY_LABEL
+)
+from payload_model import BAR_SERIES_KEYS
+
+
+def fold_long_tail(labels, values, max_categories=None, min_share=0.0, other_label=OTHER_CATEGORY_LABEL):
+    """
+    Folds the smallest categories into an "Other" category.
+
+    A category is folded when its share of the total is below `min_share`,
+    or when it is not among the largest `max_categories - 1` (the "Other"
+    category takes the last place). Nothing is folded unless at least two
+    categories qualify, since replacing one category by "Other" gains nothing.
+    An existing category named `other_label` is always folded into "Other".
+
+    Args:
+        labels (list): Category labels.
+        values (list): One value per category, or one row of values per category
+            (e.g. a series per period); shares use the row totals.
+        max_categories (int): Maximum number of categories kept, "Other" included.
+            None or 0 disables the limit.
+        min_share (float): Minimum share of the total, as a fraction (0.02 is 2%).
+        other_label (str): Label of the folded category.
+
+    Returns:
+        tuple: (labels, values) with the kept categories in their original order
+        and "Other" last. Values have the shape of the input rows.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    totals = values.reshape(len(labels), -1).sum(axis=1) if len(labels) else np.zeros(0)
+    grand_total = totals.sum()
+
+    folded = np.zeros(len(labels), dtype=bool)
+    if min_share and grand_total > 0:
+        folded |= totals / grand_total < min_share
+    if max_categories and len(labels) > max_categories:
+        # Positions of the largest categories first; ties keep the original order
+        ranked = np.argsort(-totals, kind="stable")
+        folded[ranked[max_categories - 1:]] = True
+    existing_other = np.array([label == other_label for label in labels], dtype=bool)
+    if folded.sum() < 2 and not (existing_other.any() and folded.any()):
+        return list(labels), values.tolist()
+    folded |= existing_other
+
+    kept_labels = [label for label, fold in zip(labels, folded) if not fold]
+    other = values[folded].sum(axis=0)
+    return kept_labels + [other_label], values[~folded].tolist() + [other.tolist()]
+
+
+def _as_numbers(values):
+    # Counts stay integers in the payload
+    return [int(v) if float(v).is_integer() else v for v in values]
+
+
+def reduce_pie_categories(cfg_pie, max_slices=PIE_MAX_SLICES, min_share=PIE_MIN_SHARE):
+    """
+    Pie chart config with its long tail folded into "Other" (see fold_long_tail).
+
+    Returns:
+        dict: A new config; `cfg_pie` is not modified.
+    """
+    labels, values = fold_long_tail(cfg_pie["labels"], cfg_pie["values"], max_slices, min_share)
+    if len(labels) == len(cfg_pie["labels"]):
+        return cfg_pie
+    return dict(cfg_pie, labels=labels, values=_as_numbers(values))
+
+
+def reduce_bar_series(cfg_bar, max_series=BAR_MAX_SERIES, min_share=BAR_MIN_SHARE):
+    """
+    Bar chart config with its smallest series folded into an "other" series.
+
+    Folded series are set to None, which the bar chart builders skip, and
+    their sum per period is stored under the "other" key.
+
+    Returns:
+        dict: A new config; `cfg_bar` is not modified.
+    """
+    keys = [key for key in BAR_SERIES_KEYS if cfg_bar.get(key) is not None]
+    if not keys:
+        return cfg_bar
+    labels, values = fold_long_tail(keys, [cfg_bar[key] for key in keys], max_series, min_share)
+    if len(labels) == len(keys):
+        return cfg_bar
+    reduced = dict(cfg_bar, other=_as_numbers(values[-1]))
+    reduced.update({key: None for key in keys if key not in labels})
+    return reduced
@@ -1,36 +1,22 @@
 # charts.py
 import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 
 # Import configuration values from config.py
 from config import (
-    # Indicator chart config
-    INDICATOR_WIDTH, INDICATOR_HEIGHT, INDICATOR_NUMBER_FONT_SIZE,
-    INDICATOR_FONT_FAMILY, INDICATOR_FONT_SIZE, INDICATOR_FONT_COLOR,
-    INDICATOR_INCREASING_COLOR, INDICATOR_DECREASING_COLOR,
-    
-    # Bar chart config
-    BAR_CHART_WIDTH, BAR_CHART_HEIGHT, BAR_CHART_TITLE_FONT_SIZE,
-    BAR_CHART_LEGEND_FONT_SIZE, BAR_CHART_FONT_SIZE, BAR_CHART_FONT_FAMILY,
-    BAR_CHART_FONT_COLOR, BAR_COLOR_COMMITS, BAR_COLOR_PRS, BAR_COLOR_ISSUES,
-    BAR_CHART_LEGEND_Y_OFFSET,
-    
-    # Pie chart config
-    PIE_CHART_WIDTH, PIE_CHART_HEIGHT, PIE_TEXTINFO, PIE_INSIDE_TEXT_ORIENTATION,
-    
     # Ranking table config
-    RANKING_AXIS_RANGE, RANKING_COLUMN_POSITIONS,
-    RANKING_TITLE_FONT_SIZE, RANKING_TITLE_FONT_COLOR, RANKING_HEADERS,
+    RANKING_COLUMN_POSITIONS, RANKING_HEADERS,
     RANKING_HEADER_FONT_SIZE, RANKING_HEADER_FONT_COLOR,
     RANKING_CELL_FONT_SIZE, RANKING_CELL_FONT_COLOR,
-    RANKING_MEDAL_COLORS, RANKING_AVATAR_SIZE,
-    
-    # General plotly config
-    PLOTLY_TEMPLATE, BACKGROUND_COLOR
+    RANKING_MEDAL_COLORS, RANKING_AVATAR_SIZE
 )
 
 # Import function to convert image URLs to base64
-from image_utils import encode_image_from_url
+from avatars import fetch_avatars
+
+# Figure dicts built from the shared panel templates
+from fast_charts import build_indicators_dict, build_bar_dict, build_pie_dict
+from panel_templates import PANEL_TEMPLATES
+from payload_model import Ranking
 
 def create_indicators_figure(titles, values, deltas):
     """
@@ -45,47 +31,15 @@ def create_indicators_figure(titles, values, deltas):
     Returns:
         plotly.graph_objs._figure.Figure: Figure with the 4 indicators.
     """
-    fig_ind = make_subplots(
-        rows=1, cols=4,
-        subplot_titles=titles,
-        specs=[[{"type": "indicator"}]*4]
-    )
-
-    for i in range(4):
-        base_val = values[i]
-        delta_val = deltas[i]  # fracción de cambio
-        ref_val = base_val / (1 + delta_val) if delta_val != -1 else 0
-
-        fig_ind.add_trace(
-            go.Indicator(
-                mode="number+delta",
-                value=base_val,
-                delta={
-                    "reference": ref_val,
-                    "valueformat": ".1f",
-                    "increasing": {"color": INDICATOR_INCREASING_COLOR},
-                    "decreasing": {"color": INDICATOR_DECREASING_COLOR}
-                },
-                number={"font": {"size": INDICATOR_NUMBER_FONT_SIZE, "color": INDICATOR_FONT_COLOR}}
-            ),
-            row=1, col=i+1
-        )
-
-    fig_ind.update_layout(
-        template=PLOTLY_TEMPLATE,
-        width=INDICATOR_WIDTH,
-        height=INDICATOR_HEIGHT,
-        font=dict(family=INDICATOR_FONT_FAMILY, size=INDICATOR_FONT_SIZE, color=INDICATOR_FONT_COLOR),
-        paper_bgcolor=BACKGROUND_COLOR,
-        plot_bgcolor=BACKGROUND_COLOR
-    )
+    fig_ind = go.Figure(build_indicators_dict(titles, values, deltas))
     return fig_ind
 
 
 def create_bar_figure(cfg_bar):
     """
     Creates a stacked bar chart.
-    cfg_bar is a dictionary with keys: "title", "months", "commits", "prs", "comments", "reviews".
+    cfg_bar is a dictionary with keys: "title", "months", "commits", "prs", "comments", "reviews",
+    or a payload_model.BarChart.
 
     Args:
         cfg_bar (dict): Parameters for the bar chart. Must contain:
@@ -99,61 +53,14 @@ def create_bar_figure(cfg_bar):
     Returns:
         plotly.graph_objs._figure.Figure: Stacked bar chart figure.
     """
-    fig_bar = go.Figure()
-
-    fig_bar.add_trace(go.Bar(
-        name="Commits",
-        x=cfg_bar["months"],
-        y=cfg_bar["commits"],
-        marker_color=BAR_COLOR_COMMITS
-    ))
-    fig_bar.add_trace(go.Bar(
-        name="Pull Requests",
-        x=cfg_bar["months"],
-        y=cfg_bar["prs"],
-        marker_color=BAR_COLOR_PRS
-    ))
-    fig_bar.add_trace(go.Bar(
-        name="Comments",
-        x=cfg_bar["months"],
-        y=cfg_bar["comments"],
-        marker_color=BAR_COLOR_ISSUES
-    ))
-    fig_bar.add_trace(go.Bar(
-        name="Reviews",
-        x=cfg_bar["months"],
-        y=cfg_bar["reviews"],
-        marker_color="#6a329f"  # Using a purple color for reviews
-    ))
-
-    fig_bar.update_layout(
-        template=PLOTLY_TEMPLATE,
-        title={
-            "text": cfg_bar["title"],
-            "font": {"size": BAR_CHART_TITLE_FONT_SIZE, "color": BAR_CHART_FONT_COLOR}
-        },
-        legend=dict(
-            orientation="h",
-            yanchor="bottom",
-            y=BAR_CHART_LEGEND_Y_OFFSET,
-            xanchor="center",
-            x=0.5,
-            font=dict(size=BAR_CHART_LEGEND_FONT_SIZE, color=BAR_CHART_FONT_COLOR)
-        ),
-        barmode="stack",
-        paper_bgcolor=BACKGROUND_COLOR,
-        plot_bgcolor=BACKGROUND_COLOR,
-        width=BAR_CHART_WIDTH,
-        height=BAR_CHART_HEIGHT,
-        font=dict(family=BAR_CHART_FONT_FAMILY, size=BAR_CHART_FONT_SIZE, color=BAR_CHART_FONT_COLOR)
-    )
+    fig_bar = go.Figure(build_bar_dict(cfg_bar))
     return fig_bar
 
 
 def create_pie_figure(cfg_pie):
     """
     Creates a pie chart.
-    cfg_pie is a dictionary with keys: "title", "labels", "values".
+    cfg_pie is a dictionary with keys: "title", "labels", "values", or a payload_model.PieChart.
 
     Args:
         cfg_pie (dict): Parameters for the pie chart. Must contain:
@@ -164,30 +71,11 @@ def create_pie_figure(cfg_pie):
     Returns:
         plotly.graph_objs._figure.Figure: Pie chart figure.
     """
-    fig_pie = go.Figure()
-    fig_pie.add_trace(go.Pie(
-        labels=cfg_pie["labels"],
-        values=cfg_pie["values"],
-        textinfo=PIE_TEXTINFO,
-        insidetextorientation=PIE_INSIDE_TEXT_ORIENTATION
-    ))
-
-    fig_pie.update_layout(
-        template=PLOTLY_TEMPLATE,
-        title={
-            "text": cfg_pie["title"],
-            "font": {"size": BAR_CHART_TITLE_FONT_SIZE, "color": BAR_CHART_FONT_COLOR}
-        },
-        paper_bgcolor=BACKGROUND_COLOR,
-        plot_bgcolor=BACKGROUND_COLOR,
-        width=PIE_CHART_WIDTH,
-        height=PIE_CHART_HEIGHT,
-        font=dict(family=BAR_CHART_FONT_FAMILY, size=BAR_CHART_FONT_SIZE, color=BAR_CHART_FONT_COLOR)
-    )
+    fig_pie = go.Figure(build_pie_dict(cfg_pie))
     return fig_pie
 
 
-def create_ranking_figure(cfg_rank):
+def create_ranking_figure(cfg_rank, budget=None, avatars=None):
     """
     Creates the developer ranking table (with avatar and metrics).
     cfg_rank: {
@@ -205,29 +93,20 @@ def create_ranking_figure(cfg_rank):
             ...
         ]
     }
+    cfg_rank can also be a payload_model.Ranking.
+    budget (http_utils.DeadlineBudget): Optional run budget for the avatar downloads.
+    avatars (list): Image source of each avatar, from avatars.fetch_avatars. Fetched here when None.
 
     Returns:
         plotly.graph_objs._figure.Figure: Figure with the ranking table.
     """
-    fig_rank = go.Figure()
-
-    # Configure invisible axes
-    fig_rank.update_xaxes(range=RANKING_AXIS_RANGE, visible=False)
-    fig_rank.update_yaxes(range=RANKING_AXIS_RANGE, visible=False)
-
-    fig_rank.update_layout(
-        template=PLOTLY_TEMPLATE,
-        title={
-            "text": cfg_rank["title"],
-            "font": {"size": RANKING_TITLE_FONT_SIZE, "color": RANKING_TITLE_FONT_COLOR}
-        },
-        paper_bgcolor=BACKGROUND_COLOR,
-        plot_bgcolor=BACKGROUND_COLOR,
-        width=1200,
-        height=800
-    )
-
-    devs = cfg_rank["devs"]
+    ranking = Ranking.coerce(cfg_rank)
+    # Invisible axes, title and size come from the shared ranking template
+    fig_rank = go.Figure(PANEL_TEMPLATES.new_figure("ranking", [], title=ranking.title))
+
+    devs = ranking.devs
+    if avatars is None:
+        avatars = fetch_avatars(devs, budget=budget)
     # Row calculation
     n_rows = len(devs) + 2
     row_height = 1.0 / n_rows
@@ -265,7 +144,7 @@ def create_ranking_figure(cfg_rank):
         row_index = i + 2
         y_pos = 1 - row_height * row_index + row_height / 2
 
-        dev_name = dev["name"]
+        dev_name = dev.name
         font_color = RANKING_CELL_FONT_COLOR
 
         # Medals for top 3
@@ -293,7 +172,7 @@ def create_ranking_figure(cfg_rank):
         fig_rank.add_annotation(
             x=col_positions["commits"],
             y=y_pos,
-            text=str(dev["commits"]),
+            text=str(dev.commits),
             xref="x", yref="y",
             showarrow=False,
             font=dict(color=RANKING_CELL_FONT_COLOR, size=RANKING_CELL_FONT_SIZE)
@@ -303,7 +182,7 @@ def create_ranking_figure(cfg_rank):
         fig_rank.add_annotation(
             x=col_positions["prs"],
             y=y_pos,
-            text=str(dev["prs"]),
+            text=str(dev.prs),
             xref="x", yref="y",
             showarrow=False,
             font=dict(color=RANKING_CELL_FONT_COLOR, size=RANKING_CELL_FONT_SIZE)
@@ -313,7 +192,7 @@ def create_ranking_figure(cfg_rank):
         fig_rank.add_annotation(
             x=col_positions["issues"],
             y=y_pos,
-            text=str(dev["comments"]),
+            text=str(dev.comments),
             xref="x", yref="y",
             showarrow=False,
             font=dict(color=RANKING_CELL_FONT_COLOR, size=RANKING_CELL_FONT_SIZE)
@@ -323,17 +202,16 @@ def create_ranking_figure(cfg_rank):
         fig_rank.add_annotation(
             x=col_positions["reviews"],
             y=y_pos,
-            text=str(dev["reviews"]),
+            text=str(dev.reviews),
             xref="x", yref="y",
             showarrow=False,
             font=dict(color=RANKING_CELL_FONT_COLOR, size=RANKING_CELL_FONT_SIZE)
         )
 
         # Avatar
-        avatar_encoded = encode_image_from_url(dev["avatar"])
         fig_rank.add_layout_image(
             dict(
-                source=avatar_encoded,
+                source=avatars[i],
                 x=col_positions["dev"] - RANKING_AVATAR_SIZE,
                 y=y_pos + 0.05,
                 xref="x",
@@ -24,6 +24,11 @@ BAR_CHART_FONT_COLOR = "black"
 BAR_COLOR_COMMITS = "#AEC6CF"
 BAR_COLOR_PRS = "#FFDAB9"
 BAR_COLOR_ISSUES = "#FFB5E8"
+BAR_COLOR_OTHER = "#C8C8C8"
+# Long tail of the bar series folded into "Other": at most BAR_MAX_SERIES series ("Other" included,
+# None for no limit) and series below BAR_MIN_SHARE of the total. Both disabled by default
+BAR_MAX_SERIES = None
+BAR_MIN_SHARE = 0.0
 BAR_CHART_LEGEND_Y_OFFSET = -0.2
 
 # Pie chart configuration
@@ -31,6 +36,11 @@ PIE_CHART_WIDTH = 1200
 PIE_CHART_HEIGHT = 800
 PIE_TEXTINFO = "label+percent"
 PIE_INSIDE_TEXT_ORIENTATION = "radial"
+# Long tail of the pie folded into "Other": at most PIE_MAX_SLICES slices ("Other" included,
+# None for no limit) and slices below PIE_MIN_SHARE of the total. Both disabled by default
+PIE_MAX_SLICES = None
+PIE_MIN_SHARE = 0.0
+OTHER_CATEGORY_LABEL = "Other"
 
 # Ranking table configuration
 RANKING_WIDTH = 1200
@@ -57,6 +67,23 @@ RANKING_AVATAR_SIZE = 0.08
 DASHBOARD_WIDTH = 2400
 DASHBOARD_HEIGHT = 300 + 800 + 800  # 1900
 DASHBOARD_BACKGROUND_COLOR = (255, 255, 255)  # White
+# Top-left corner of each panel on the full resolution canvas
+DASHBOARD_PANEL_POSITIONS = {
+    "indicators": (0, 0),       # (2400×300)
+    "bars":       (0, 300),     # (2400×800)
+    "pie":        (0, 1100),    # (1200×800)
+    "ranking":    (1200, 1100)  # (1200×800)
+}
+# Downscaled copies of the final image, as {name: width in pixels},
+# e.g. {"readme": 1000, "social": 1280}. Each is saved next to the output as <output>_<name>.png
+DASHBOARD_VARIANTS = {}
+# Where the dashboard data comes from: "api" (Gitlights data API), "git" (local git history)
+# or "events" (raw activity events file)
+DATA_SOURCE = "api"
+# "png" composites raster panels with Pillow, "svg" assembles vector panels into one SVG document
+OUTPUT_FORMAT = "png"
+# How the SVG output embeds the logo: "inline" (data URI) or "link" (GITLIGHTS_LOGO_URL)
+SVG_LOGO_MODE = "inline"
 
 # General plotly configuration
 PLOTLY_TEMPLATE = "plotly_white"
@@ -74,5 +101,84 @@ LOGO_MAX_SIZE = (75, 75)
 LOGO_POSITION_X = 20
 LOGO_POSITION_Y = 20
 
+# JSON configuration
+# "auto" uses orjson when installed and falls back to the standard json module
+JSON_ENGINE = "auto"
+
+# Figure construction
+# When True, panels are built as plain figure dicts and exported without Plotly's validators.
+# The dicts are validated against reference figures in the tests (tests/test_fast_charts.py)
+FAST_FIGURES = True
+
+# Render watchdog
+# When True, panels are rendered in a supervised worker process
+RENDER_WATCHDOG = False
+RENDER_PANEL_TIMEOUT = 60  # seconds per panel render attempt
+RENDER_MEMORY_LIMIT_MB = 2048  # worker + Chromium RSS
+RENDER_RETRIES = 1  # extra attempts in a fresh worker
+# Start the renderer in the background while the dashboard data is fetched
+RENDER_WARM_UP = True
+
+# Memory
+# Parallel generations (threads or processes) are limited to what fits under this ceiling,
+# assuming each one needs GENERATION_MEMORY_ESTIMATE_MB (compare with the reported peak RSS).
+# None disables the ceiling
+GENERATION_MEMORY_CEILING_MB = None
+GENERATION_MEMORY_ESTIMATE_MB = 600
+RSS_SAMPLE_INTERVAL = 0.1  # seconds between RSS samples while a dashboard is generated
+
+# Profiling
+# None disables profiling; "cprofile" (deterministic) or "sampling" writes reports next to the dashboard
+PROFILE_MODE = None
+PROFILE_TOP_N = 30  # hotspots listed in profile_hotspots.txt
+PROFILE_SAMPLE_INTERVAL = 0.005  # seconds between samples in sampling mode
+
+# Latency history (enabled by the history_file input)
+HISTORY_MAX_RUNS = 500  # records kept in the history file
+HISTORY_WINDOW = 30  # latest successful runs used for the rolling percentiles
+HISTORY_MIN_RUNS = 5  # previous runs a stage needs before regressions are reported
+HISTORY_REGRESSION_THRESHOLD = 0.5  # flag stages more than 50% slower than their rolling median
+HISTORY_MIN_REGRESSION_MS = 100  # ...and slower by at least this much
+
+# Local git analytics (data_source "git")
+GIT_ANALYTICS_WINDOW_DAYS = 30  # days shown in the bar chart, compared with the previous window
+GIT_ANALYTICS_TOP_DEVS = 10  # developers listed in the ranking
+GIT_ANALYTICS_CHECKPOINT_DIR = ".gitlights-cache/git-analytics"  # persist with actions/cache
+GIT_ANALYTICS_WATERMARK = "Powered by Gitlights"
+
+# Raw event aggregation (data_source "events")
+EVENTS_WINDOW_DAYS = 30  # days shown in the bar chart, compared with the previous window
+EVENTS_TOP_DEVS = 10  # developers listed in the ranking
+EVENTS_CHUNK_ROWS = 250000  # events read per chunk, bounds memory while reading
+EVENTS_WATERMARK = "Powered by Gitlights"
+
+# Organization-wide dashboard (several repositories merged into one)
+ORG_FETCH_WORKERS = 8  # repository payloads fetched concurrently
+ORG_TOP_DEVS = 10  # developers listed in the merged ranking
+
+# Local trend store of indicator values and bar series (SQLite, persist with actions/cache)
+TREND_DELTA_DAYS = 30  # local deltas compare with the run recorded this many days earlier
+
+# Ranking avatars
+AVATAR_DEADLINE_SECONDS = 5  # avatars still downloading after this get the placeholder
+AVATAR_FETCH_WORKERS = 8  # avatars downloaded concurrently
+AVATAR_REQUEST_TIMEOUT = 4  # upper bound for a single avatar request
+AVATAR_MAX_RETRIES = 1  # a placeholder is cheaper than a long retry loop
+AVATAR_NEGATIVE_TTL_SECONDS = 15 * 60  # failing avatar URLs are not requested again for this long
+AVATAR_PLACEHOLDER_SIZE = 80  # pixels, the size of the downloaded avatars (?s=80)
+AVATAR_PLACEHOLDER_COLORS = ["#AEC6CF", "#FFDAB9", "#FFB5E8", "#B5EAD7", "#C7CEEA", "#E2F0CB", "#FFDAC1"]
+AVATAR_PLACEHOLDER_TEXT_COLOR = (60, 60, 60)
+
+# Network configuration
+RUN_DEADLINE_SECONDS = 300  # budget shared by every network call of a run
+HTTP_REQUEST_TIMEOUT = 30  # upper bound for a single request attempt
+HTTP_MAX_RETRIES = 3  # retries for idempotent requests
+HTTP_BACKOFF_BASE = 0.5  # seconds, doubled on every retry
+HTTP_BACKOFF_CAP = 8  # seconds, maximum backoff before jitter
+HTTP_RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+OPTIONAL_ASSET_RESERVE_SECONDS = 20  # avatars and logo are skipped when less time remains
+# Where CASSETTE_MODE=record|replay keeps recorded responses (local benchmarking only)
+CASSETTE_DIR = "cassettes/default"
+
 # API configuration
 API_URL = "https://api.gitlights.com/api/gitlights-action/get-main-dashboard-data/"
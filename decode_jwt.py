@@ -10,16 +10,36 @@ import requests
 import jwt  # Requires: pip install PyJWT[crypto]
 from jwt.api_jwk import PyJWK
 
+from singleflight import SingleFlight, SingleFlightTimeout
+
+# Las verificaciones concurrentes del mismo emisor comparten una sola descarga de claves
+_PUBLIC_KEY_FETCHES = SingleFlight()
+# Espera máxima a la descarga en curso de otra llamada (dos peticiones de 5 segundos)
+PUBLIC_KEY_WAIT_SECONDS = 10
+
 def get_github_public_keys(issuer=None):
     """
     Obtiene las claves públicas de GitHub para verificar los tokens JWT.
     
+    Las llamadas concurrentes para el mismo endpoint (JWKS de GitHub Actions o
+    API meta) esperan a la petición en curso y reciben su resultado, en lugar de
+    repetirla. Si tarda más de PUBLIC_KEY_WAIT_SECONDS, descargan las claves ellas mismas.
+    
     Args:
         issuer (str, optional): El emisor del token para determinar qué claves obtener
     
     Returns:
         dict: Un diccionario con los "kid" como claves y las claves públicas como valores
     """
+    is_actions = bool(issuer and 'actions.githubusercontent.com' in issuer)
+    try:
+        return _PUBLIC_KEY_FETCHES.do(is_actions, lambda: _fetch_github_public_keys(issuer),
+                                      timeout=PUBLIC_KEY_WAIT_SECONDS)
+    except SingleFlightTimeout:
+        # La descarga en curso no termina: descargar las claves directamente
+        return _fetch_github_public_keys(issuer)
+
+def _fetch_github_public_keys(issuer=None):
     # Para tokens de GitHub Actions, necesitamos obtener las claves del emisor correcto
     if issuer and 'actions.githubusercontent.com' in issuer:
         # GitHub Actions usa un endpoint JWKS estándar
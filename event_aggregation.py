@@ -0,0 +1,254 @@
+# event_aggregation.py
+"""
+Client-side aggregation of raw activity events.
+
+Computes the four dashboard sections from per-event records instead of the
+pre-aggregated API payload. Each record has a `type` (commit, pr, comment or
+review), an `author` and a `timestamp` (ISO 8601 or Unix seconds), and
+optionally an `avatar` URL and a `category` (shown in the pie chart; without
+it the pie shows the share of each event type).
+
+Files are read in chunks (JSONL, CSV, or Parquet through pyarrow) and every
+chunk is reduced with vectorized group-bys to partial counts per day and type
+and per author and type. Only those partials are kept between chunks, so
+memory depends on the number of days and authors, not on the number of
+events, and millions of events fit in a small, fixed budget.
+"""
+import os
+
+import pandas as pd
+
+from config import EVENTS_WINDOW_DAYS, EVENTS_TOP_DEVS, EVENTS_CHUNK_ROWS, EVENTS_WATERMARK
+
+EVENT_TYPES = ["commit", "pr", "comment", "review"]
+# Spellings accepted in the `type` column
+EVENT_TYPE_ALIASES = {
+    "commit": "commit", "commits": "commit",
+    "pr": "pr", "prs": "pr", "pull_request": "pr", "pull_requests": "pr",
+    "comment": "comment", "comments": "comment", "issue_comment": "comment",
+    "review": "review", "reviews": "review", "pull_request_review": "review",
+}
+EVENT_TYPE_LABELS = {"commit": "Commits", "pr": "Pull Requests", "comment": "Comments", "review": "Reviews"}
+EVENT_COLUMNS = ["type", "author", "timestamp", "avatar", "category"]
+
+
+def relative_delta(current, previous):
+    """
+    Change from `previous` to `current` as a fraction, the format of the indicator deltas.
+    Growth from zero counts as +100%.
+    """
+    if previous == 0:
+        return 0.0 if current == 0 else 1.0
+    return round((current - previous) / previous, 3)
+
+
+def detect_format(path):
+    """
+    Event file format from its extension: "jsonl", "csv" or "parquet" (compression suffixes allowed).
+    """
+    name = path.lower()
+    for suffix in (".gz", ".bz2", ".xz", ".zst"):
+        if name.endswith(suffix):
+            name = name[: -len(suffix)]
+    ext = os.path.splitext(name)[1]
+    if ext in (".jsonl", ".ndjson", ".json"):
+        return "jsonl"
+    if ext in (".csv", ".tsv"):
+        return "csv"
+    if ext in (".parquet", ".pq"):
+        return "parquet"
+    raise ValueError(f"Unknown event file format for '{path}', expected JSONL, CSV or Parquet")
+
+
+def iter_event_chunks(path, chunk_rows=EVENTS_CHUNK_ROWS, file_format=None):
+    """
+    Reads an event file in chunks of at most `chunk_rows` rows.
+
+    Yields:
+        pandas.DataFrame: The known event columns present in the file.
+    """
+    file_format = file_format or detect_format(path)
+    if file_format == "csv":
+        sep = "\t" if ".tsv" in path.lower() else ","
+        reader = pd.read_csv(path, sep=sep, chunksize=chunk_rows, usecols=lambda column: column in EVENT_COLUMNS,
+                             dtype={"type": str, "author": str, "avatar": str, "category": str})
+        yield from reader
+    elif file_format == "jsonl":
+        with pd.read_json(path, lines=True, chunksize=chunk_rows, dtype=False) as reader:
+            for chunk in reader:
+                yield chunk[[column for column in EVENT_COLUMNS if column in chunk.columns]]
+    elif file_format == "parquet":
+        try:
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError("Reading Parquet event files requires pyarrow (pip install pyarrow)") from e
+        parquet_file = pq.ParquetFile(path)
+        columns = [column for column in EVENT_COLUMNS if column in parquet_file.schema_arrow.names]
+        for batch in parquet_file.iter_batches(batch_size=chunk_rows, columns=columns):
+            yield batch.to_pandas()
+    else:
+        raise ValueError(f"Unknown event file format '{file_format}'")
+
+
+def _timestamps(column):
+    if pd.api.types.is_numeric_dtype(column):
+        return pd.to_datetime(column, unit="s", utc=True, errors="coerce")
+    try:
+        return pd.to_datetime(column, utc=True, errors="coerce", format="mixed")
+    except (TypeError, ValueError):
+        # pandas < 2.0 has no format="mixed" but already parses each value on its own
+        return pd.to_datetime(column, utc=True, errors="coerce")
+
+
+def _add(total, partial):
+    return partial if total is None else total.add(partial, fill_value=0)
+
+
+class EventAggregator:
+    """
+    Incrementally reduces event chunks to the counts the dashboard needs.
+
+    Usage:
+        aggregator = EventAggregator(end=pd.Timestamp.now(tz="UTC"))
+        for chunk in iter_event_chunks("events.jsonl"):
+            aggregator.add_chunk(chunk)
+        payload = aggregator.payload()
+    """
+
+    def __init__(self, end=None, window_days=EVENTS_WINDOW_DAYS, top_devs=EVENTS_TOP_DEVS):
+        """
+        Args:
+            end (pandas.Timestamp): Last day of the reporting window. Defaults to now (UTC).
+            window_days (int): Days shown in the bar chart and compared in the indicators.
+            top_devs (int): Developers listed in the ranking.
+        """
+        end = pd.Timestamp(end) if end is not None else pd.Timestamp.now(tz="UTC")
+        if end.tzinfo is None:
+            end = end.tz_localize("UTC")
+        self.end_day = end.floor("D")
+        self.window_days = window_days
+        self.top_devs = top_devs
+        self.window_start = self.end_day - pd.Timedelta(days=window_days - 1)
+        self.previous_start = self.window_start - pd.Timedelta(days=window_days)
+
+        self.events = 0
+        self.skipped = 0
+        self._previous_totals = None  # type -> count
+        self._daily = None            # (day, type) -> count
+        self._authors = None          # (author, type) -> count
+        self._categories = None       # category -> count
+        self._avatars = {}
+
+    def add_chunk(self, chunk):
+        """Reduces one chunk of events into the running counts."""
+        self.events += len(chunk)
+        frame = pd.DataFrame({
+            "type": chunk["type"].astype(str).str.strip().str.lower().map(EVENT_TYPE_ALIASES),
+            "author": chunk["author"],
+            "day": _timestamps(chunk["timestamp"]).dt.floor("D"),
+        })
+        for optional in ("avatar", "category"):
+            if optional in chunk.columns:
+                frame[optional] = chunk[optional]
+        valid = frame["type"].notna() & frame["author"].notna() & frame["day"].notna()
+        self.skipped += int((~valid).sum())
+        frame = frame[valid]
+
+        previous = frame[(frame["day"] >= self.previous_start) & (frame["day"] < self.window_start)]
+        self._previous_totals = _add(self._previous_totals, previous["type"].value_counts())
+
+        current = frame[(frame["day"] >= self.window_start) & (frame["day"] <= self.end_day)]
+        if current.empty:
+            return
+        self._daily = _add(self._daily, current.groupby(["day", "type"]).size())
+        self._authors = _add(self._authors, current.groupby(["author", "type"]).size())
+        if "category" in current.columns:
+            self._categories = _add(self._categories, current["category"].dropna().value_counts())
+        if "avatar" in current.columns:
+            avatars = current.dropna(subset=["avatar"]).drop_duplicates("author", keep="last")
+            self._avatars.update(zip(avatars["author"], avatars["avatar"]))
+
+    def _type_table(self, counts, index, index_name):
+        # Unstack (key, type) counts into one column per event type
+        if counts is None:
+            table = pd.DataFrame(0, index=index if index is not None else [], columns=EVENT_TYPES)
+        else:
+            table = counts.unstack("type", fill_value=0).reindex(columns=EVENT_TYPES, fill_value=0)
+            if index is not None:
+                table = table.reindex(index, fill_value=0)
+        table.index.name = index_name
+        return table.astype(int)
+
+    def payload(self):
+        """
+        Returns:
+            dict: Payload with the same structure as the data API response.
+        """
+        days = pd.date_range(self.window_start, self.end_day, freq="D")
+        daily = self._type_table(self._daily, days, "day")
+        totals = daily.sum()
+        previous = (self._previous_totals if self._previous_totals is not None else pd.Series(dtype=int))
+        previous = previous.reindex(EVENT_TYPES, fill_value=0)
+
+        authors = self._type_table(self._authors, None, "author")
+        ranking = authors.sort_values(["commit", "pr", "review", "comment"], ascending=False).head(self.top_devs)
+
+        if self._categories is not None and not self._categories.empty:
+            pie = self._categories.sort_values(ascending=False)
+            pie_labels, pie_values = [str(label) for label in pie.index], [int(v) for v in pie.values]
+        else:
+            pie_labels = [EVENT_TYPE_LABELS[t] for t in EVENT_TYPES if totals[t] > 0]
+            pie_values = [int(totals[t]) for t in EVENT_TYPES if totals[t] > 0]
+
+        window = f"Last {self.window_days} days"
+        return {
+            "indicators": {
+                "titles": ["Commits", "PRs", "Comments", "Reviews"],
+                "values": [int(totals[t]) for t in EVENT_TYPES],
+                "deltas": [relative_delta(int(totals[t]), int(previous[t])) for t in EVENT_TYPES],
+            },
+            "bar_chart": {
+                "title": f"Daily Activity ({window})",
+                "months": [d.strftime("%Y-%m-%d") for d in days],
+                "commits": daily["commit"].tolist(),
+                "prs": daily["pr"].tolist(),
+                "comments": daily["comment"].tolist(),
+                "reviews": daily["review"].tolist(),
+            },
+            "pie_chart": {
+                "title": f"Activity Balance ({window})",
+                "labels": pie_labels,
+                "values": pie_values,
+            },
+            "ranking": {
+                "title": f"Top Contributors ({window})",
+                "devs": [
+                    {"name": author, "avatar": self._avatars.get(author, ""), "commits": int(row["commit"]),
+                     "prs": int(row["pr"]), "comments": int(row["comment"]), "reviews": int(row["review"])}
+                    for author, row in ranking.iterrows()
+                ],
+            },
+            "watermark_text": EVENTS_WATERMARK,
+        }
+
+
+def aggregate_event_file(path, end=None, window_days=EVENTS_WINDOW_DAYS, top_devs=EVENTS_TOP_DEVS,
+                         chunk_rows=EVENTS_CHUNK_ROWS):
+    """
+    Builds the dashboard payload from a raw event file.
+
+    Args:
+        path (str): JSONL, CSV or Parquet file of events.
+        end (pandas.Timestamp): Last day of the reporting window. Defaults to now (UTC).
+        window_days (int): Days in the reporting window.
+        top_devs (int): Developers listed in the ranking.
+        chunk_rows (int): Events read per chunk; bounds the memory used while reading.
+
+    Returns:
+        dict: Payload with the same structure as the data API response.
+    """
+    aggregator = EventAggregator(end=end, window_days=window_days, top_devs=top_devs)
+    for chunk in iter_event_chunks(path, chunk_rows=chunk_rows):
+        aggregator.add_chunk(chunk)
+    print(f"Aggregated {aggregator.events} events from {path} ({aggregator.skipped} skipped)")
+    return aggregator.payload()
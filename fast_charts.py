@@ -0,0 +1,196 @@
+# fast_charts.py
+"""
+Validator-free figure construction.
+
+The functions in this module build each dashboard panel as a plain Plotly
+figure dict instead of a `go.Figure`. The static part of every layout comes
+from the panel template registry, so a build only fills in the payload data.
+The dicts are handed straight to Kaleido through `write_figure_image`,
+skipping Plotly's property validators entirely.
+
+charts.py wraps the same dicts in validated `go.Figure` objects; tests
+validate every dict built here.
+"""
+import plotly.io as pio
+
+from config import (
+    # Indicator chart config
+    INDICATOR_NUMBER_FONT_SIZE, INDICATOR_FONT_COLOR,
+    INDICATOR_INCREASING_COLOR, INDICATOR_DECREASING_COLOR,
+
+    # Bar chart config
+    BAR_COLOR_COMMITS, BAR_COLOR_PRS, BAR_COLOR_ISSUES, BAR_COLOR_OTHER, OTHER_CATEGORY_LABEL,
+
+    # Pie chart config
+    PIE_TEXTINFO, PIE_INSIDE_TEXT_ORIENTATION,
+
+    # Ranking table config
+    RANKING_COLUMN_POSITIONS, RANKING_HEADERS,
+    RANKING_HEADER_FONT_SIZE, RANKING_HEADER_FONT_COLOR,
+    RANKING_CELL_FONT_SIZE, RANKING_CELL_FONT_COLOR,
+    RANKING_MEDAL_COLORS, RANKING_AVATAR_SIZE
+)
+
+from avatars import fetch_avatars
+from panel_templates import PANEL_TEMPLATES
+from payload_model import BarChart, PieChart, Ranking
+
+# Same spacing make_subplots uses for a 1x4 grid (0.2 / cols)
+INDICATOR_COLUMNS = 4
+INDICATOR_HORIZONTAL_SPACING = 0.2 / INDICATOR_COLUMNS
+# Font size make_subplots gives to subplot titles
+SUBPLOT_TITLE_FONT_SIZE = 16
+
+BAR_SERIES = [
+    ("Commits", "commits", BAR_COLOR_COMMITS),
+    ("Pull Requests", "prs", BAR_COLOR_PRS),
+    ("Comments", "comments", BAR_COLOR_ISSUES),
+    ("Reviews", "reviews", "#6a329f"),  # Using a purple color for reviews
+    # Only present when categories.reduce_bar_series folded the smallest series
+    (OTHER_CATEGORY_LABEL, "other", BAR_COLOR_OTHER),
+]
+
+
+def _indicator_domains():
+    # Computed the way make_subplots does, so the domains match a 1x4 subplot grid
+    width = (1 - INDICATOR_HORIZONTAL_SPACING * (INDICATOR_COLUMNS - 1)) / INDICATOR_COLUMNS
+    domains = []
+    for col in range(INDICATOR_COLUMNS):
+        start = sum([width] * col) + col * INDICATOR_HORIZONTAL_SPACING
+        domains.append([max(0.0, start), min(1.0, start + width)])
+    return domains
+
+
+def build_indicators_dict(titles, values, deltas):
+    """
+    Builds the indicators panel (1 row, 4 columns) as a plain figure dict.
+    See charts.create_indicators_figure for the arguments.
+    """
+    domains = _indicator_domains()
+    number = {"font": {"size": INDICATOR_NUMBER_FONT_SIZE, "color": INDICATOR_FONT_COLOR}}
+
+    data = []
+    annotations = []
+    for i in range(INDICATOR_COLUMNS):
+        base_val = values[i]
+        delta_val = deltas[i]
+        ref_val = base_val / (1 + delta_val) if delta_val != -1 else 0
+        data.append({
+            "type": "indicator",
+            "mode": "number+delta",
+            "value": base_val,
+            "delta": {
+                "reference": ref_val,
+                "valueformat": ".1f",
+                "increasing": {"color": INDICATOR_INCREASING_COLOR},
+                "decreasing": {"color": INDICATOR_DECREASING_COLOR}
+            },
+            "number": number,
+            "domain": {"x": domains[i], "y": [0.0, 1.0]},
+        })
+        annotations.append({
+            "text": titles[i],
+            "x": (domains[i][0] + domains[i][1]) / 2,
+            "y": 1.0,
+            "xref": "paper", "yref": "paper",
+            "xanchor": "center", "yanchor": "bottom",
+            "showarrow": False,
+            "font": {"size": SUBPLOT_TITLE_FONT_SIZE},
+        })
+    return PANEL_TEMPLATES.new_figure("indicators", data, annotations=annotations)
+
+
+def build_bar_dict(cfg_bar):
+    """
+    Builds the stacked bar chart as a plain figure dict.
+    cfg_bar is a payload_model.BarChart, or a dict with the keys listed in charts.create_bar_figure.
+    """
+    bar = BarChart.coerce(cfg_bar)
+    months = list(bar.months)
+    # Series folded into "other" are None, and "other" only exists after folding
+    data = []
+    for name, key, color in BAR_SERIES:
+        series = getattr(bar, key)
+        if series is not None:
+            data.append({"type": "bar", "name": name, "x": months, "y": series, "marker": {"color": color}})
+    return PANEL_TEMPLATES.new_figure("bars", data, title=bar.title)
+
+
+def build_pie_dict(cfg_pie):
+    """
+    Builds the pie chart as a plain figure dict.
+    cfg_pie is a payload_model.PieChart, or a dict with the keys listed in charts.create_pie_figure.
+    """
+    pie = PieChart.coerce(cfg_pie)
+    data = [{
+        "type": "pie",
+        "labels": list(pie.labels),
+        "values": pie.values,
+        "textinfo": PIE_TEXTINFO,
+        "insidetextorientation": PIE_INSIDE_TEXT_ORIENTATION,
+    }]
+    return PANEL_TEMPLATES.new_figure("pie", data, title=pie.title)
+
+
+def build_ranking_dict(cfg_rank, budget=None, avatars=None):
+    """
+    Builds the same figure as charts.create_ranking_figure, as a plain dict.
+    cfg_rank is a payload_model.Ranking or the ranking dict of the payload.
+    avatars are the image sources from avatars.fetch_avatars, fetched here when None.
+    """
+    ranking = Ranking.coerce(cfg_rank)
+    if avatars is None:
+        avatars = fetch_avatars(ranking.devs, budget=budget)
+    col_positions = RANKING_COLUMN_POSITIONS
+    header_font = {"color": RANKING_HEADER_FONT_COLOR, "size": RANKING_HEADER_FONT_SIZE}
+    cell_font = {"color": RANKING_CELL_FONT_COLOR, "size": RANKING_CELL_FONT_SIZE}
+
+    devs = ranking.devs
+    n_rows = len(devs) + 2
+    row_height = 1.0 / n_rows
+    y_header = 1 - row_height + row_height / 2
+
+    header_columns = ["dev", "commits", "prs", "issues", "reviews"]
+    annotations = [
+        {"x": col_positions[column], "y": y_header, "text": f"<b>{header}</b>",
+         "xref": "x", "yref": "y", "showarrow": False, "font": header_font}
+        for column, header in zip(header_columns, RANKING_HEADERS)
+    ]
+    images = []
+
+    for i, (dev, avatar) in enumerate(zip(devs, avatars)):
+        y_pos = 1 - row_height * (i + 2) + row_height / 2
+
+        dev_name = dev.name
+        name_font = cell_font
+        if i < len(RANKING_MEDAL_COLORS):
+            dev_name = f"<b>{dev_name}</b>"
+            name_font = {"color": RANKING_MEDAL_COLORS[i], "size": RANKING_CELL_FONT_SIZE}
+
+        annotations.append({"x": col_positions["dev"] + 0.05, "y": y_pos, "text": dev_name,
+                            "xref": "x", "yref": "y", "showarrow": False, "font": name_font})
+        for column, key in (("commits", "commits"), ("prs", "prs"), ("issues", "comments"), ("reviews", "reviews")):
+            annotations.append({"x": col_positions[column], "y": y_pos, "text": str(getattr(dev, key)),
+                                "xref": "x", "yref": "y", "showarrow": False, "font": cell_font})
+
+        images.append({
+            "source": avatar,
+            "x": col_positions["dev"] - RANKING_AVATAR_SIZE,
+            "y": y_pos + 0.05,
+            "xref": "x",
+            "yref": "y",
+            "sizex": RANKING_AVATAR_SIZE,
+            "sizey": RANKING_AVATAR_SIZE,
+            "xanchor": "left",
+            "yanchor": "top"
+        })
+
+    return PANEL_TEMPLATES.new_figure("ranking", [], title=ranking.title,
+                                      annotations=annotations, images=images)
+
+
+def write_figure_image(fig_dict, path, **kwargs):
+    """
+    Exports a figure dict built by this module without running Plotly's validators.
+    """
+    pio.write_image(fig_dict, path, validate=False, **kwargs)
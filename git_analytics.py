@@ -0,0 +1,252 @@
+# git_analytics.py
+"""
+Local analytics from the checked-out repository.
+
+Builds the dashboard payload from `git log` instead of the data API:
+commits are streamed from git, kept in a small per-commit table and
+aggregated per day and per author with pandas group-bys. The table and the
+last processed commit are checkpointed in a directory that workflows persist
+with actions/cache, so later runs only read the commits added since.
+
+Git only knows commits, so the other series are derived from them: merge
+and squash-merge commits stand in for merged pull requests, comments and
+reviews are zero, and the pie chart shows the conventional-commit type mix.
+The checkout needs enough history (actions/checkout with fetch-depth: 0).
+"""
+import hashlib
+import json
+import os
+import re
+import subprocess
+
+import numpy as np
+import pandas as pd
+
+from config import (
+    GIT_ANALYTICS_WINDOW_DAYS, GIT_ANALYTICS_TOP_DEVS, GIT_ANALYTICS_CHECKPOINT_DIR,
+    GIT_ANALYTICS_WATERMARK
+)
+from event_aggregation import relative_delta
+
+COMMIT_COLUMNS = ["sha", "timestamp", "author", "email", "is_merge", "lines", "type"]
+CHECKPOINT_FILE = "checkpoint.json"
+COMMITS_FILE = "commits.csv.gz"
+
+# Field and record separators of the `git log` format
+_FIELD = "\x1f"
+_RECORD = "\x1e"
+_LOG_FORMAT = _RECORD + _FIELD.join(["%H", "%at", "%aN", "%aE", "%P", "%s"])
+
+COMMIT_TYPES = ["feat", "fix", "refactor", "docs", "test", "chore", "other"]
+_COMMIT_TYPE_PATTERN = re.compile(r"^(feat|fix|refactor|docs|test|chore)(\(.+?\))?!?:", re.IGNORECASE)
+# Merge commits of pull requests, and squash merges titled "... (#123)"
+_PULL_REQUEST_PATTERN = re.compile(r"^Merge pull request #\d+|\(#\d+\)$")
+_NOREPLY_PATTERN = re.compile(r"^(\d+)\+[^@]+@users\.noreply\.github\.com$")
+
+
+def _git(repo_path, *args):
+    # safe.directory: the workspace is owned by another user inside the action container
+    return ["git", "-c", f"safe.directory={os.path.abspath(repo_path)}", "-C", repo_path, *args]
+
+
+def _commit_type(subject):
+    match = _COMMIT_TYPE_PATTERN.match(subject)
+    return match.group(1).lower() if match else "other"
+
+
+def iter_commits(repo_path, revision_range="HEAD", since=None):
+    """
+    Streams commits from `git log`, one dict per commit, without loading the whole log.
+
+    Args:
+        repo_path (str): Path of the git checkout.
+        revision_range (str): Revisions to list, e.g. "HEAD" or "<sha>..HEAD".
+        since (int): Stop at commits committed before this Unix timestamp.
+
+    Yields:
+        dict: sha, timestamp, author, email, is_merge, lines (added + deleted) and type.
+    """
+    args = ["log", f"--format={_LOG_FORMAT}", "--numstat", "--no-renames", revision_range]
+    if since is not None:
+        args.append(f"--since=@{int(since)}")
+    process = subprocess.Popen(_git(repo_path, *args), stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                               text=True, encoding="utf-8", errors="replace")
+    commit = None
+    for line in process.stdout:
+        line = line.rstrip("\n")
+        if line.startswith(_RECORD):
+            if commit is not None:
+                yield commit
+            sha, timestamp, author, email, parents, subject = line[1:].split(_FIELD, 5)
+            is_merge = len(parents.split()) > 1
+            commit = {
+                "sha": sha, "timestamp": int(timestamp), "author": author, "email": email,
+                "is_merge": is_merge or bool(_PULL_REQUEST_PATTERN.search(subject)),
+                "lines": 0, "type": _commit_type(subject),
+            }
+        elif line and commit is not None:
+            added, deleted, _ = line.split("\t", 2)
+            # Binary files show "-" instead of line counts
+            commit["lines"] += (int(added) if added.isdigit() else 0) + (int(deleted) if deleted.isdigit() else 0)
+    if commit is not None:
+        yield commit
+    _, stderr = process.communicate()
+    if process.returncode != 0:
+        raise RuntimeError(f"git log failed: {stderr.strip()}")
+
+
+def _head(repo_path):
+    return subprocess.run(_git(repo_path, "rev-parse", "HEAD"), capture_output=True, text=True,
+                          check=True).stdout.strip()
+
+
+def _is_ancestor(repo_path, sha):
+    return subprocess.run(_git(repo_path, "merge-base", "--is-ancestor", sha, "HEAD"),
+                          capture_output=True).returncode == 0
+
+
+def _commits_frame(commits):
+    frame = pd.DataFrame(commits, columns=COMMIT_COLUMNS)
+    return frame.astype({"timestamp": "int64", "is_merge": "bool", "lines": "int64"})
+
+
+def load_commits(repo_path, checkpoint_dir=GIT_ANALYTICS_CHECKPOINT_DIR, window_days=GIT_ANALYTICS_WINDOW_DAYS,
+                 now=None):
+    """
+    Commits of the last two windows, read incrementally from the checkpoint.
+
+    Only commits after the checkpointed HEAD are read from git. The checkpoint
+    is discarded (and the window rescanned) when its HEAD is no longer an
+    ancestor of the current HEAD, e.g. after a force push.
+
+    Args:
+        repo_path (str): Path of the git checkout.
+        checkpoint_dir (str): Directory of the checkpoint. None disables checkpointing.
+        window_days (int): Length of the reporting window.
+        now (int): Current Unix timestamp, replaceable in tests.
+
+    Returns:
+        pandas.DataFrame: One row per commit with the COMMIT_COLUMNS.
+    """
+    now = int(now if now is not None else pd.Timestamp.now(tz="UTC").timestamp())
+    # The previous window is needed for the indicator deltas
+    since = now - 2 * window_days * 86400
+    head = _head(repo_path)
+
+    cached, revision_range = None, "HEAD"
+    checkpoint_path = os.path.join(checkpoint_dir, CHECKPOINT_FILE) if checkpoint_dir else None
+    if checkpoint_path and os.path.exists(checkpoint_path):
+        with open(checkpoint_path) as f:
+            checkpoint = json.load(f)
+        if checkpoint.get("head") == head:
+            revision_range = None
+        elif checkpoint.get("head") and _is_ancestor(repo_path, checkpoint["head"]):
+            revision_range = f"{checkpoint['head']}..HEAD"
+        if revision_range != "HEAD":
+            cached = pd.read_csv(os.path.join(checkpoint_dir, COMMITS_FILE), keep_default_na=False,
+                                 dtype={"author": str, "email": str, "type": str})
+
+    new = _commits_frame(list(iter_commits(repo_path, revision_range, since=since)) if revision_range else [])
+    frames = [frame for frame in (cached, new) if frame is not None and not frame.empty]
+    commits = pd.concat(frames, ignore_index=True) if frames else _commits_frame([])
+    commits = commits.drop_duplicates("sha")
+    commits = commits[commits["timestamp"] >= since].reset_index(drop=True)
+
+    if checkpoint_path:
+        os.makedirs(checkpoint_dir, exist_ok=True)
+        commits.to_csv(os.path.join(checkpoint_dir, COMMITS_FILE), index=False)
+        with open(checkpoint_path, "w") as f:
+            json.dump({"head": head, "commits": len(commits)}, f)
+    print(f"Git analytics: {len(new)} new commits read, {len(commits)} in the last {2 * window_days} days")
+    return commits
+
+
+def avatar_url(email):
+    """
+    Avatar for a commit email: the GitHub avatar for noreply addresses, else a Gravatar identicon.
+    """
+    match = _NOREPLY_PATTERN.match(email or "")
+    if match:
+        return f"https://avatars.githubusercontent.com/u/{match.group(1)}?s=80"
+    digest = hashlib.md5((email or "").strip().lower().encode("utf-8")).hexdigest()
+    return f"https://www.gravatar.com/avatar/{digest}?s=80&d=identicon"
+
+
+def build_local_payload(commits, window_days=GIT_ANALYTICS_WINDOW_DAYS, top_devs=GIT_ANALYTICS_TOP_DEVS, now=None):
+    """
+    Aggregates a commit table into the dashboard payload.
+
+    Args:
+        commits (pandas.DataFrame): Commits as returned by load_commits.
+        window_days (int): Days shown in the bar chart and compared in the indicators.
+        top_devs (int): Developers listed in the ranking.
+        now (int): Current Unix timestamp, replaceable in tests.
+
+    Returns:
+        dict: Payload with the same structure as the data API response.
+    """
+    now = pd.Timestamp(now, unit="s", tz="UTC") if now is not None else pd.Timestamp.now(tz="UTC")
+    window_start = (now - pd.Timedelta(days=window_days - 1)).floor("D")
+    previous_start = window_start - pd.Timedelta(days=window_days)
+
+    day = pd.to_datetime(commits["timestamp"], unit="s", utc=True).dt.floor("D")
+    current = commits[day >= window_start]
+    previous = commits[(day >= previous_start) & (day < window_start)]
+    current_day = day[day >= window_start]
+
+    def totals(frame):
+        return np.array([len(frame), int(frame["is_merge"].sum()), frame["author"].nunique(), int(frame["lines"].sum())])
+
+    values, previous_values = totals(current), totals(previous)
+
+    # Daily series over the whole window, days without commits included
+    days = pd.date_range(window_start, now.floor("D"), freq="D")
+    daily = current.assign(day=current_day).groupby("day").agg(commits=("sha", "size"), prs=("is_merge", "sum"))
+    daily = daily.reindex(days, fill_value=0)
+
+    per_author = current.groupby("author").agg(
+        commits=("sha", "size"), prs=("is_merge", "sum"), email=("email", "last")
+    ).sort_values(["commits", "prs"], ascending=False).head(top_devs)
+
+    types = current["type"].value_counts().reindex(COMMIT_TYPES, fill_value=0)
+    types = types[types > 0]
+
+    window = f"Last {window_days} days"
+    return {
+        "indicators": {
+            "titles": ["Commits", "Merged PRs", "Active authors", "Lines changed"],
+            "values": [int(v) for v in values],
+            "deltas": [relative_delta(cur, prev) for cur, prev in zip(values, previous_values)],
+        },
+        "bar_chart": {
+            "title": f"Daily Activity ({window})",
+            "months": [d.strftime("%Y-%m-%d") for d in days],
+            "commits": daily["commits"].astype(int).tolist(),
+            "prs": daily["prs"].astype(int).tolist(),
+            "comments": [0] * len(days),
+            "reviews": [0] * len(days),
+        },
+        "pie_chart": {
+            "title": f"Commit Types ({window})",
+            "labels": types.index.tolist(),
+            "values": [int(v) for v in types.values],
+        },
+        "ranking": {
+            "title": f"Top Contributors ({window})",
+            "devs": [
+                {"name": author, "avatar": avatar_url(row["email"]), "commits": int(row["commits"]),
+                 "prs": int(row["prs"]), "comments": 0, "reviews": 0}
+                for author, row in per_author.iterrows()
+            ],
+        },
+        "watermark_text": GIT_ANALYTICS_WATERMARK,
+    }
+
+
+def local_dashboard_payload(repo_path=".", checkpoint_dir=GIT_ANALYTICS_CHECKPOINT_DIR,
+                            window_days=GIT_ANALYTICS_WINDOW_DAYS):
+    """
+    Builds the dashboard payload from the local repository (see load_commits and build_local_payload).
+    """
+    commits = load_commits(repo_path, checkpoint_dir=checkpoint_dir, window_days=window_days)
+    return build_local_payload(commits, window_days=window_days)
@@ -0,0 +1,173 @@
+# history.py
+"""
+Cross-run latency history.
+
+Every run appends one compact JSON line (stage timings, payload size,
+output bytes and peak RSS) to a history file that workflows persist with
+actions/cache. The previous runs give a rolling p50/p95 per stage, and
+stages that got slower than their rolling median by more than a threshold
+are reported as regressions in the step summary and as workflow warnings.
+"""
+import json
+import os
+import time
+
+from config import (
+    HISTORY_MAX_RUNS, HISTORY_WINDOW, HISTORY_MIN_RUNS,
+    HISTORY_REGRESSION_THRESHOLD, HISTORY_MIN_REGRESSION_MS
+)
+from timing import percentile
+
+
+def run_record(result):
+    """
+    Builds the history record of one run.
+
+    Args:
+        result (main.DashboardResult): Result of the run.
+
+    Returns:
+        dict: JSON serializable record.
+    """
+    output_bytes = None
+    if result.success and os.path.exists(result.output_path):
+        output_bytes = os.path.getsize(result.output_path)
+    return {
+        "ts": int(time.time()),
+        "ok": bool(result.success),
+        "stages": {name: round(seconds, 4) for name, seconds in result.timings.items()},
+        "payload": result.payload_size,
+        "output_bytes": output_bytes,
+        "peak_rss_mb": round(result.peak_rss_mb, 1) if result.peak_rss_mb is not None else None,
+    }
+
+
+def load_history(history_path):
+    """
+    Reads the records of a history file, skipping lines that cannot be parsed.
+
+    Returns:
+        list: Records, oldest first. Empty when the file does not exist.
+    """
+    if not os.path.exists(history_path):
+        return []
+    records = []
+    with open(history_path) as f:
+        for line in f:
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                continue  # A run interrupted while writing
+    return records
+
+
+def append_record(history_path, record, max_runs=HISTORY_MAX_RUNS):
+    """
+    Appends a record to the history file, keeping only the latest `max_runs` records.
+    """
+    directory = os.path.dirname(history_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    records = load_history(history_path)
+    records.append(record)
+    records = records[-max_runs:]
+    tmp_path = f"{history_path}.tmp"
+    with open(tmp_path, "w") as f:
+        for entry in records:
+            f.write(json.dumps(entry, separators=(",", ":")) + "\n")
+    os.replace(tmp_path, history_path)
+
+
+def rolling_stats(records, window=HISTORY_WINDOW):
+    """
+    Rolling p50/p95 per stage over the latest successful runs.
+
+    Returns:
+        dict: Stage name to {"p50": seconds, "p95": seconds, "runs": count}.
+    """
+    recent = [record for record in records if record.get("ok")][-window:]
+    samples = {}
+    for record in recent:
+        for stage, seconds in record.get("stages", {}).items():
+            samples.setdefault(stage, []).append(seconds)
+    return {
+        stage: {"p50": percentile(values, 50), "p95": percentile(values, 95), "runs": len(values)}
+        for stage, values in samples.items()
+    }
+
+
+def detect_regressions(record, stats, threshold=HISTORY_REGRESSION_THRESHOLD,
+                       min_runs=HISTORY_MIN_RUNS, min_ms=HISTORY_MIN_REGRESSION_MS):
+    """
+    Stages of `record` slower than their rolling median by more than `threshold`.
+
+    Stages with fewer than `min_runs` previous runs, or that got slower by less
+    than `min_ms` milliseconds, are ignored to avoid flagging noise.
+
+    Returns:
+        list: (stage, seconds, p50, ratio) tuples, worst first.
+    """
+    regressions = []
+    for stage, seconds in record.get("stages", {}).items():
+        baseline = stats.get(stage)
+        if not baseline or baseline["runs"] < min_runs or not baseline["p50"]:
+            continue
+        ratio = seconds / baseline["p50"]
+        if ratio > 1 + threshold and (seconds - baseline["p50"]) * 1000 >= min_ms:
+            regressions.append((stage, seconds, baseline["p50"], ratio))
+    return sorted(regressions, key=lambda item: item[3], reverse=True)
+
+
+def summary_markdown(record, stats, regressions):
+    """
+    Step summary section with this run's stage timings next to the rolling percentiles.
+
+    Returns:
+        str: Markdown text.
+    """
+    regressed = {stage for stage, _, _, _ in regressions}
+    lines = ["### Dashboard stage timings", "",
+             "| Stage | This run | Rolling p50 | Rolling p95 | |", "|---|---:|---:|---:|---|"]
+    for stage, seconds in record.get("stages", {}).items():
+        baseline = stats.get(stage)
+        p50 = f"{baseline['p50'] * 1000:.0f} ms" if baseline else "–"
+        p95 = f"{baseline['p95'] * 1000:.0f} ms" if baseline else "–"
+        flag = "⚠️ regression" if stage in regressed else ""
+        lines.append(f"| {stage} | {seconds * 1000:.0f} ms | {p50} | {p95} | {flag} |")
+    if record.get("peak_rss_mb") is not None:
+        lines.append("")
+        lines.append(f"Peak RSS: {record['peak_rss_mb']:.0f} MB")
+    for stage, seconds, p50, ratio in regressions:
+        lines.append("")
+        lines.append(f"> ⚠️ **{stage}** took {seconds * 1000:.0f} ms, {ratio:.1f}x its rolling median of "
+                     f"{p50 * 1000:.0f} ms")
+    return "\n".join(lines) + "\n"
+
+
+def record_run(history_path, result, summary_path=None, threshold=HISTORY_REGRESSION_THRESHOLD):
+    """
+    Compares a run with the history, reports regressions and appends the run.
+
+    Args:
+        history_path (str): History file (JSON lines), usually inside a cached directory.
+        result (main.DashboardResult): Result of the run.
+        summary_path (str): GITHUB_STEP_SUMMARY file to append the timings table to.
+        threshold (float): Fraction above the rolling median that counts as a regression.
+
+    Returns:
+        list: The detected regressions (see detect_regressions).
+    """
+    records = load_history(history_path)
+    record = run_record(result)
+    stats = rolling_stats(records)
+    regressions = detect_regressions(record, stats, threshold=threshold) if record["ok"] else []
+
+    for stage, seconds, p50, ratio in regressions:
+        print(f"::warning title=Dashboard stage regression::{stage} took {seconds * 1000:.0f} ms, "
+              f"{ratio:.1f}x its rolling median of {p50 * 1000:.0f} ms")
+    if summary_path and record["ok"]:
+        with open(summary_path, "a") as f:
+            f.write(summary_markdown(record, stats, regressions))
+
+    append_record(history_path, record)
+    return regressions
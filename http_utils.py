@@ -0,0 +1,207 @@
+# http_utils.py
+"""
+Network helpers shared by every HTTP call of the dashboard generation.
+
+All requests of a run draw from one DeadlineBudget: each request gets the time
+that is left (capped per request) as its timeout, and idempotent requests are
+retried with capped, jittered exponential backoff while the budget allows it.
+"""
+import random
+import threading
+import time
+
+import requests
+
+from singleflight import SingleFlight, SingleFlightTimeout
+from config import (
+    HTTP_REQUEST_TIMEOUT, HTTP_MAX_RETRIES, HTTP_BACKOFF_BASE, HTTP_BACKOFF_CAP,
+    HTTP_RETRY_STATUS_CODES
+)
+
+IDEMPOTENT_METHODS = ("get", "head", "options", "put", "delete")
+
+# Optional hook that sees every request (see cassette.py); None in normal runs
+_request_hook = None
+
+
+def set_request_hook(hook):
+    """
+    Installs a hook around every request sent through request_with_retries.
+
+    The hook must provide `before_request(method, url, kwargs)`, returning the
+    (url, kwargs) to actually send, and `after_response(method, url, kwargs, response)`,
+    called with the original url and kwargs. Pass None to remove it.
+
+    Returns:
+        The previously installed hook.
+    """
+    global _request_hook
+    previous, _request_hook = _request_hook, hook
+    return previous
+
+
+class BudgetExhausted(requests.exceptions.Timeout):
+    """Raised when the run deadline leaves no time for another request."""
+
+
+class DeadlineBudget:
+    """
+    Run-level time budget shared by all network calls.
+
+    Also accounts where network time went: waiting on responses versus sleeping
+    between retries.
+    """
+
+    def __init__(self, total_seconds=None, clock=time.monotonic):
+        """
+        Args:
+            total_seconds (float): Budget for the whole run. None means unlimited.
+            clock (callable): Monotonic clock, replaceable in tests.
+        """
+        self.total_seconds = total_seconds
+        self._clock = clock
+        self._start = clock()
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.retries = 0
+        self.wait_seconds = 0.0
+        self.retry_seconds = 0.0
+
+    def remaining(self):
+        """
+        Returns:
+            float: Seconds left in the budget (infinite when unlimited, never negative).
+        """
+        if self.total_seconds is None:
+            return float("inf")
+        return max(0.0, self.total_seconds - (self._clock() - self._start))
+
+    def nearly_exhausted(self, reserve_seconds):
+        """True when less than `reserve_seconds` remain."""
+        return self.remaining() < reserve_seconds
+
+    def record_request(self, seconds):
+        with self._lock:
+            self.requests += 1
+            self.wait_seconds += seconds
+
+    def record_retry(self, seconds):
+        with self._lock:
+            self.retries += 1
+            self.retry_seconds += seconds
+
+    def summary(self):
+        """
+        Returns:
+            str: One line describing network time spent waiting and retrying.
+        """
+        line = (f"Network: {self.requests} requests, {self.retries} retries, "
+                f"waiting {self.wait_seconds * 1000:.1f} ms, retry backoff {self.retry_seconds * 1000:.1f} ms")
+        if self.total_seconds is not None:
+            line += f", budget remaining {self.remaining():.1f}s of {self.total_seconds}s"
+        return line
+
+
+def backoff_delay(attempt, base=HTTP_BACKOFF_BASE, cap=HTTP_BACKOFF_CAP):
+    """
+    Full-jitter exponential backoff: a random delay in [0, min(cap, base * 2**attempt)].
+    """
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+def request_with_retries(method, url, budget=None, retries=HTTP_MAX_RETRIES, timeout=HTTP_REQUEST_TIMEOUT,
+                         idempotent=None, **kwargs):
+    """
+    Sends an HTTP request with a budget-bound timeout and retries.
+
+    Connection errors, timeouts and the status codes in
+    config.HTTP_RETRY_STATUS_CODES are retried for idempotent requests only.
+    When retries run out, the last response is returned (so callers can inspect
+    its status) or the last exception is raised.
+
+    Args:
+        method (str): HTTP method name, e.g. "get" or "post".
+        url (str): Request URL.
+        budget (DeadlineBudget): Shared run budget. None means unlimited.
+        retries (int): Maximum number of retries after the first attempt.
+        timeout (float): Upper bound for the timeout of each attempt, in seconds.
+        idempotent (bool): Whether the request may be retried. Defaults to True
+            for GET, HEAD, OPTIONS, PUT and DELETE.
+        **kwargs: Passed through to requests (params, headers, files...).
+
+    Returns:
+        requests.Response: The response of the last attempt.
+
+    Raises:
+        BudgetExhausted: If no time is left for an attempt.
+        requests.exceptions.RequestException: If the last attempt failed.
+    """
+    method = method.lower()
+    if budget is None:
+        budget = DeadlineBudget()
+    if idempotent is None:
+        idempotent = method in IDEMPOTENT_METHODS
+    max_attempts = 1 + (retries if idempotent else 0)
+    send = getattr(requests, method)
+    hook = _request_hook
+    send_url, send_kwargs = hook.before_request(method, url, kwargs) if hook is not None else (url, kwargs)
+
+    for attempt in range(max_attempts):
+        attempt_timeout = min(timeout, budget.remaining())
+        if attempt_timeout <= 0:
+            raise BudgetExhausted(f"Run deadline reached before requesting {url}")
+
+        response, error = None, None
+        start = time.monotonic()
+        try:
+            response = send(send_url, timeout=attempt_timeout, **send_kwargs)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+            error = e
+        budget.record_request(time.monotonic() - start)
+        if hook is not None and response is not None:
+            hook.after_response(method, url, kwargs, response)
+
+        if response is not None and response.status_code not in HTTP_RETRY_STATUS_CODES:
+            return response
+
+        delay = backoff_delay(attempt)
+        if attempt + 1 >= max_attempts or delay >= budget.remaining():
+            # Out of attempts or out of time: surface the last outcome
+            if response is not None:
+                return response
+            raise error
+        time.sleep(delay)
+        budget.record_retry(delay)
+
+
+# Concurrent GETs of the same shared asset (logo, avatars) share one request
+SHARED_GETS = SingleFlight()
+
+
+def coalesced_get(url, budget=None, **kwargs):
+    """
+    GET through request_with_retries, sharing one in-flight request per URL.
+
+    Concurrent callers for the same URL (other generations of a batch, daemon
+    or load test) wait for the request already in flight and receive the same
+    response, so only use it for public resources whose response does not
+    depend on the caller: the request is sent with the first caller's budget
+    and options. A waiting caller gives up when its own budget runs out.
+
+    Args:
+        url (str): Request URL.
+        budget (DeadlineBudget): Shared run budget. None means unlimited.
+        **kwargs: Passed through to request_with_retries (timeout, retries...).
+
+    Returns:
+        requests.Response: The shared response; treat it as read-only.
+
+    Raises:
+        BudgetExhausted: If the budget runs out while waiting for another caller's request.
+    """
+    remaining = budget.remaining() if budget is not None else float("inf")
+    try:
+        return SHARED_GETS.do(url, lambda: request_with_retries("get", url, budget=budget, **kwargs),
+                              timeout=remaining if remaining != float("inf") else None)
+    except SingleFlightTimeout as e:
+        raise BudgetExhausted(f"Run deadline reached while waiting for the shared request to {url}") from e
@@ -1,37 +1,125 @@
 # image_utils.py
 import base64
-import requests
+import os
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 
 from PIL import Image, ImageDraw, ImageFont
 
 # Import configuration values
 from config import (
-    DASHBOARD_WIDTH, DASHBOARD_HEIGHT, DASHBOARD_BACKGROUND_COLOR,
+    DASHBOARD_WIDTH, DASHBOARD_HEIGHT, DASHBOARD_BACKGROUND_COLOR, DASHBOARD_PANEL_POSITIONS,
+    DASHBOARD_VARIANTS,
     WATERMARK_FONT_SIZE, WATERMARK_FONT_FAMILY, WATERMARK_TEXT_COLOR,
     WATERMARK_POSITION_OFFSET_X, WATERMARK_POSITION_OFFSET_Y,
-    GITLIGHTS_LOGO_URL, LOGO_MAX_SIZE, LOGO_POSITION_X, LOGO_POSITION_Y
+    GITLIGHTS_LOGO_URL, LOGO_MAX_SIZE, LOGO_POSITION_X, LOGO_POSITION_Y,
+    OPTIONAL_ASSET_RESERVE_SECONDS, HTTP_REQUEST_TIMEOUT, HTTP_MAX_RETRIES
 )
+from http_utils import coalesced_get
 
-def encode_image_from_url(url):
+def encode_image_from_url(url, budget=None, negative_cache=None, timeout=HTTP_REQUEST_TIMEOUT,
+                          retries=HTTP_MAX_RETRIES):
     """
     Downloads the image from the URL and returns it in base64 to use in layout_image (Plotly).
+
+    Avatars are optional: when the run budget is nearly used up the download is
+    skipped and an empty source is returned. Concurrent downloads of the same URL
+    share one request (see http_utils.coalesced_get).
+
+    Args:
+        url (str): Image URL.
+        budget (http_utils.DeadlineBudget): Shared run budget, None for unlimited.
+        negative_cache (avatars.NegativeCache): URLs that failed recently. They are
+            not requested again, and a failing URL is added to it.
+        timeout (float): Upper bound for each request attempt, in seconds.
+        retries (int): Retries after the first attempt.
     """
+    if budget is not None and budget.nearly_exhausted(OPTIONAL_ASSET_RESERVE_SECONDS):
+        print("Skipping image download: run deadline nearly reached")
+        return ""
+    if negative_cache is not None and url in negative_cache:
+        return ""
     try:
-        resp = requests.get(url)
+        resp = coalesced_get(url, budget=budget, timeout=timeout, retries=retries)
         resp.raise_for_status()
         encoded = base64.b64encode(resp.content).decode('ascii')
         return f"data:image/png;base64,{encoded}"
     except Exception as e:
         print(f"Error downloading image: {e}")
+        if negative_cache is not None:
+            negative_cache.add(url)
         return ""
 
+def dashboard_scale(target_width=None):
+    """
+    Render scale that produces a dashboard `target_width` pixels wide.
+
+    Args:
+        target_width (int): Desired width of the final image. None or 0 keeps
+            the full DASHBOARD_WIDTH resolution.
+
+    Returns:
+        float: Scale factor for Kaleido and for the compositing offsets.
+    """
+    if not target_width:
+        return 1.0
+    if target_width <= 0:
+        raise ValueError(f"target_width must be positive, got {target_width}")
+    return target_width / DASHBOARD_WIDTH
+
+
+def _scaled(value, scale):
+    return max(1, int(round(value * scale))) if value else 0
+
+
+def parse_dashboard_variants(spec):
+    """
+    Parses a variants specification such as "readme:1000,social:1280".
+
+    Args:
+        spec (str): Comma separated name:width pairs. Empty means no variants.
+
+    Returns:
+        dict: Variant name to width in pixels.
+    """
+    variants = {}
+    for item in (spec or "").split(","):
+        item = item.strip()
+        if not item:
+            continue
+        name, sep, width = item.partition(":")
+        if not sep or not name.strip() or not width.strip().isdigit() or int(width) <= 0:
+            raise ValueError(f"Invalid dashboard variant '{item}', expected name:width")
+        variants[name.strip()] = int(width)
+    return variants
+
+
+def dashboard_variant_path(output_path, name):
+    """Path of the `name` variant of the image saved at `output_path`."""
+    root, ext = os.path.splitext(output_path)
+    return f"{root}_{name}{ext or '.png'}"
+
+
+def _save_variant(dashboard_img, width, path):
+    # reducing_gap shrinks by an integer factor with a box filter first, so the
+    # resampling filter only runs on an image close to the target size
+    height = max(1, int(round(dashboard_img.height * width / dashboard_img.width)))
+    variant = dashboard_img.resize((width, height), Image.Resampling.BICUBIC, reducing_gap=2.0)
+    variant.save(path)
+
+
 def combine_dashboard_images(indicators_path, bar_path, pie_path, ranking_path,
-                             watermark_text, output_path="images/all_in_one.png"):
+                             watermark_text, output_path="images/all_in_one.png", budget=None, scale=1.0,
+                             variants=None):
     """
     Combines the 4 generated images (indicators, bars, pie chart, and ranking)
     into a single dashboard and adds the watermark and logo.
 
+    Panels are decoded, pasted and released one at a time, so only one decoded
+    panel is held next to the canvas. Downscaled variants are resized from the
+    composited canvas and encoded in parallel threads together with the full
+    size image, and the canvas is released once everything is saved.
+
     Args:
         indicators_path (str): Path to the indicators image.
         bar_path (str): Path to the bar chart image.
@@ -39,50 +127,79 @@ def combine_dashboard_images(indicators_path, bar_path, pie_path, ranking_path,
         ranking_path (str): Path to the ranking image.
         watermark_text (str): Text for the watermark.
         output_path (str): Path where the final image will be saved.
+        budget (http_utils.DeadlineBudget): Shared run budget for the logo download.
+        scale (float): Scale the panels were rendered at (see dashboard_scale).
+            Canvas size, offsets, watermark and logo are scaled to match.
+        variants (dict): Variant name to width in pixels. Defaults to
+            config.DASHBOARD_VARIANTS. Variants not smaller than the canvas are skipped.
+
+    Returns:
+        dict: Variant name to the path of the saved variant image.
     """
-    final_width = DASHBOARD_WIDTH
-    final_height = DASHBOARD_HEIGHT
+    final_width = _scaled(DASHBOARD_WIDTH, scale)
+    final_height = _scaled(DASHBOARD_HEIGHT, scale)
 
     # Create empty canvas
     dashboard_img = Image.new("RGB", (final_width, final_height), color=DASHBOARD_BACKGROUND_COLOR)
 
-    # Load individual images
-    ind_img = Image.open(indicators_path).convert("RGB")
-    bar_img = Image.open(bar_path).convert("RGB")
-    pie_img = Image.open(pie_path).convert("RGB")
-    rank_img = Image.open(ranking_path).convert("RGB")
-
-    # Paste images in their positions
-    # Adjust coordinates according to your dimensions
-    dashboard_img.paste(ind_img, (0, 0))        # (2400×300)
-    dashboard_img.paste(bar_img, (0, 300))      # (2400×800)
-    dashboard_img.paste(pie_img, (0, 1100))     # (1200×800)
-    dashboard_img.paste(rank_img, (1200, 1100)) # (1200×800)
+    # Paste each panel in its position, scaled to the render scale, releasing its buffers before the next one
+    for panel, path in (("indicators", indicators_path), ("bars", bar_path), ("pie", pie_path),
+                        ("ranking", ranking_path)):
+        x, y = DASHBOARD_PANEL_POSITIONS[panel]
+        with Image.open(path) as panel_img:
+            rgb_img = panel_img.convert("RGB")
+        dashboard_img.paste(rgb_img, (_scaled(x, scale), _scaled(y, scale)))
+        rgb_img.close()
+        del rgb_img
 
     # Add watermark in the bottom right corner
     draw = ImageDraw.Draw(dashboard_img)
-    text_x = final_width - WATERMARK_POSITION_OFFSET_X
-    text_y = final_height - WATERMARK_POSITION_OFFSET_Y
+    text_x = final_width - _scaled(WATERMARK_POSITION_OFFSET_X, scale)
+    text_y = final_height - _scaled(WATERMARK_POSITION_OFFSET_Y, scale)
 
     try:
-        font = ImageFont.truetype(WATERMARK_FONT_FAMILY, WATERMARK_FONT_SIZE)
+        font = ImageFont.truetype(WATERMARK_FONT_FAMILY, _scaled(WATERMARK_FONT_SIZE, scale))
     except Exception:
         font = ImageFont.load_default()
 
     draw.text((text_x, text_y), watermark_text, fill=WATERMARK_TEXT_COLOR, font=font)
 
-    # Add Gitlights logo in the bottom left corner
+    # Add Gitlights logo in the bottom left corner (optional, skipped when out of time)
     try:
-        resp = requests.get(GITLIGHTS_LOGO_URL)
+        if budget is not None and budget.nearly_exhausted(OPTIONAL_ASSET_RESERVE_SECONDS):
+            raise TimeoutError("run deadline nearly reached")
+        resp = coalesced_get(GITLIGHTS_LOGO_URL, budget=budget)
         resp.raise_for_status()
         logo = Image.open(BytesIO(resp.content)).convert("RGBA")
-        logo.thumbnail(LOGO_MAX_SIZE, Image.Resampling.LANCZOS)
+        logo.thumbnail(tuple(_scaled(v, scale) for v in LOGO_MAX_SIZE), Image.Resampling.LANCZOS)
 
         # Paste the logo at the fixed position
-        dashboard_img.paste(logo, (LOGO_POSITION_X, LOGO_POSITION_Y), logo)
+        dashboard_img.paste(logo, (_scaled(LOGO_POSITION_X, scale), _scaled(LOGO_POSITION_Y, scale)), logo)
+        logo.close()
     except Exception as e:
         print(f"Error downloading or pasting the Gitlights logo: {e}")
 
-    # Finally, save the combined image
-    dashboard_img.save(output_path)
+    if variants is None:
+        variants = DASHBOARD_VARIANTS
+    variant_paths = {}
+    for name, width in variants.items():
+        if width >= final_width:
+            print(f"Skipping dashboard variant '{name}': {width} px is not smaller than {final_width} px")
+            continue
+        variant_paths[name] = dashboard_variant_path(output_path, name)
+
+    # Finally, save the combined image (and its variants, encoded in parallel)
+    if variant_paths:
+        with ThreadPoolExecutor(max_workers=len(variant_paths) + 1) as executor:
+            futures = [executor.submit(dashboard_img.save, output_path)]
+            futures += [executor.submit(_save_variant, dashboard_img, variants[name], path)
+                        for name, path in variant_paths.items()]
+            for future in futures:
+                future.result()
+    else:
+        dashboard_img.save(output_path)
+    dashboard_img.close()
     print(f"Final image generated: {output_path}")
+    for name, path in variant_paths.items():
+        print(f"Dashboard variant '{name}' generated: {path}")
+    return variant_paths
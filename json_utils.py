@@ -0,0 +1,79 @@
+# json_utils.py
+import json
+
+import requests
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, the stdlib is always available
+    orjson = None
+
+JSON_ENGINES = ("auto", "orjson", "json")
+
+
+def resolve_json_engine(preference="auto"):
+    """
+    Resolves the JSON engine to use for parsing and figure serialization.
+
+    Args:
+        preference (str): "auto", "orjson" or "json". "auto" picks orjson when it
+            is installed and the stdlib otherwise.
+
+    Returns:
+        str: "orjson" or "json".
+    """
+    preference = (preference or "auto").lower()
+    if preference not in JSON_ENGINES:
+        print(f"Unknown JSON engine '{preference}', using auto")
+        preference = "auto"
+
+    if preference in ("auto", "orjson") and orjson is not None:
+        return "orjson"
+    if preference == "orjson":
+        print("orjson is not installed, falling back to the standard json module")
+    return "json"
+
+
+def loads(data, engine="json"):
+    """
+    Parses a JSON document with the given engine.
+
+    Args:
+        data (bytes or str): JSON document.
+        engine (str): "orjson" or "json".
+
+    Returns:
+        The decoded Python object.
+    """
+    if engine == "orjson" and orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, (bytes, bytearray)):
+        data = data.decode("utf-8")
+    return json.loads(data)
+
+
+def parse_response_json(response, engine="json"):
+    """
+    Parses the body of a `requests` response as JSON.
+
+    With the stdlib engine this is just `response.json()`. With orjson the raw
+    body bytes are parsed directly, skipping the text decoding step.
+    Decode errors are raised as `requests.exceptions.JSONDecodeError` in both
+    cases so callers handle a single exception type.
+    """
+    if engine != "orjson" or orjson is None:
+        return response.json()
+    try:
+        return orjson.loads(response.content)
+    except orjson.JSONDecodeError as e:
+        raise requests.exceptions.JSONDecodeError(e.msg, e.doc, e.pos)
+
+
+def configure_plotly_json(engine="json"):
+    """
+    Sets the JSON engine Plotly uses to serialize figures (this is also the
+    serialization Kaleido performs before rendering each image).
+    """
+    import plotly.io as pio
+
+    pio.json.config.default_engine = engine
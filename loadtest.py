@@ -0,0 +1,246 @@
+# loadtest.py
+"""
+Load generator for dashboard generation.
+
+Runs many generate_dashboard invocations at increasing concurrency levels
+against a local stub data API and stub upload endpoint (a replay server
+serving a synthetic cassette, see cassette.py). Invocations run in worker
+processes, like separate action runs sharing a runner host. For every
+level it reports throughput, latency percentiles, peak RSS of all workers
+(Kaleido/Chromium included) and CPU utilization, which shows where Kaleido
+and Pillow saturate the host's cores.
+
+Usage:
+    python loadtest.py --concurrency 1,2,4 --runs 8 --devs 10 --months 12
+"""
+import argparse
+import contextlib
+import json
+import multiprocessing
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+
+from PIL import Image
+
+from cassette import CassetteRecorder, ReplayHook, ReplayServer
+from config import API_URL, GITLIGHTS_LOGO_URL
+from memory_gate import MemoryGate
+from render_supervisor import RssSampler
+from timing import percentile
+
+LOADTEST_OWNER = "loadtest"
+LOADTEST_REPO = "dashboard"
+MONTH_NAMES = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+# How often the RSS of the worker processes is sampled
+RSS_SAMPLE_INTERVAL = 0.2
+
+
+def synthetic_payload(devs=10, months=12):
+    """
+    Builds a data API payload of a given size.
+
+    Args:
+        devs (int): Number of developers in the ranking (one avatar each).
+        months (int): Number of months in the bar chart.
+
+    Returns:
+        dict: Payload in the format returned by the data API.
+    """
+    month_labels = [f"{MONTH_NAMES[i % 12]} {2020 + i // 12}" for i in range(months)]
+    return {
+        "indicators": {
+            "titles": ["Commits", "Pull Requests", "Comments", "Reviews"],
+            "values": [120, 45, 230, 60],
+            "deltas": [0.1, -0.05, 0.2, 0.0],
+        },
+        "bar_chart": {
+            "title": "Activity per month",
+            "months": month_labels,
+            "commits": [10 + i % 7 for i in range(months)],
+            "prs": [3 + i % 4 for i in range(months)],
+            "comments": [20 + i % 9 for i in range(months)],
+            "reviews": [5 + i % 3 for i in range(months)],
+        },
+        "pie_chart": {
+            "title": "Activity share",
+            "labels": ["Commits", "Pull Requests", "Comments", "Reviews"],
+            "values": [120, 45, 230, 60],
+        },
+        "ranking": {
+            "title": "Top developers",
+            "devs": [
+                {"name": f"dev-{i}", "avatar": f"https://avatars.example.com/u/{i}.png",
+                 "commits": 50 - i, "prs": 20 - i % 20, "comments": 80 - i, "reviews": 10 + i % 5}
+                for i in range(devs)
+            ],
+        },
+        "watermark_text": "Load test",
+    }
+
+
+def _png_bytes(size, color):
+    buffer = BytesIO()
+    Image.new("RGB", size, color=color).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def write_stub_cassette(cassette_dir, payload):
+    """
+    Writes a cassette answering the data API request, every avatar and the logo.
+
+    Args:
+        cassette_dir (str): Directory of the cassette.
+        payload (dict): Payload served for the data API request (see synthetic_payload).
+    """
+    recorder = CassetteRecorder(cassette_dir)
+    recorder.save("get", API_URL, json.dumps(payload).encode("utf-8"),
+                  params={"owner": LOADTEST_OWNER, "repo": LOADTEST_REPO}, content_type="application/json")
+    avatar = _png_bytes((96, 96), (120, 160, 220))
+    for dev in payload["ranking"]["devs"]:
+        recorder.save("get", dev["avatar"], avatar, content_type="image/png")
+    recorder.save("get", GITLIGHTS_LOGO_URL, _png_bytes((400, 400), (30, 30, 30)), content_type="image/png")
+
+
+def _run_invocation(base_url, generate_kwargs):
+    """
+    One generate_dashboard invocation in a worker process, with its own output directory.
+
+    Returns:
+        tuple: (success, seconds, peak RSS of the dashboard in MB).
+    """
+    from http_utils import set_request_hook
+    from main import generate_dashboard
+
+    set_request_hook(ReplayHook(base_url))
+    with tempfile.TemporaryDirectory(prefix="loadtest-") as work_dir:
+        output_path = os.path.join(work_dir, "dashboard.png")
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            start = time.perf_counter()
+            try:
+                result = generate_dashboard(owner=LOADTEST_OWNER, repo=LOADTEST_REPO,
+                                            output_path=output_path, **generate_kwargs)
+                success, peak_rss_mb = bool(result), result.peak_rss_mb or 0.0
+            except Exception:
+                success, peak_rss_mb = False, 0.0
+            seconds = time.perf_counter() - start
+    return success, seconds, peak_rss_mb
+
+
+def run_level(base_url, concurrency, runs, generate_kwargs=None, memory_ceiling_mb=None):
+    """
+    Runs `runs` invocations with `concurrency` worker processes.
+
+    Worker processes are fresh for each level and reused within it, so later
+    invocations of a worker find Kaleido already started. With a memory
+    ceiling, the pool is capped to the workers that fit under it (see
+    memory_gate.MemoryGate.max_parallel).
+
+    Returns:
+        dict: Throughput, latency percentiles, peak RSS and CPU utilization of the level.
+    """
+    generate_kwargs = generate_kwargs or {}
+    workers = concurrency
+    max_parallel = MemoryGate(ceiling_mb=memory_ceiling_mb).max_parallel()
+    if max_parallel is not None and max_parallel < concurrency:
+        print(f"Memory ceiling of {memory_ceiling_mb} MB limits concurrency {concurrency} to {max_parallel} workers")
+        workers = max_parallel
+    context = multiprocessing.get_context("spawn")
+    cpu_before = os.times()
+    start = time.perf_counter()
+    with RssSampler(interval=RSS_SAMPLE_INTERVAL) as sampler:
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+            futures = [executor.submit(_run_invocation, base_url, generate_kwargs) for _ in range(runs)]
+            results = [future.result() for future in futures]
+    wall = time.perf_counter() - start
+    cpu_after = os.times()
+
+    # Children times cover the workers and the Kaleido processes they waited for
+    cpu_seconds = ((cpu_after.children_user - cpu_before.children_user)
+                   + (cpu_after.children_system - cpu_before.children_system)
+                   + (cpu_after.user - cpu_before.user) + (cpu_after.system - cpu_before.system))
+    latencies = [seconds for _, seconds, _ in results]
+    return {
+        "concurrency": concurrency,
+        "runs": runs,
+        "workers": workers,
+        "failures": sum(1 for success, _, _ in results if not success),
+        "wall_seconds": wall,
+        "per_minute": runs / wall * 60 if wall else 0.0,
+        "p50": percentile(latencies, 50),
+        "p95": percentile(latencies, 95),
+        "p99": percentile(latencies, 99),
+        "peak_rss_mb": sampler.peak_mb,
+        "dashboard_peak_rss_mb": max(peak for _, _, peak in results) if results else 0.0,
+        "cpu_percent": cpu_seconds / (wall * (os.cpu_count() or 1)) * 100 if wall else 0.0,
+    }
+
+
+def format_report(levels):
+    """
+    Formats level results as a table.
+
+    Returns:
+        str: One header line and one line per concurrency level.
+    """
+    lines = [f"{'conc':>4} {'runs':>5} {'fail':>4} {'dash/min':>9} {'p50 s':>7} {'p95 s':>7} "
+             f"{'p99 s':>7} {'peak MB':>8} {'dash MB':>8} {'cpu %':>6}"]
+    for level in levels:
+        lines.append(
+            f"{level['concurrency']:>4} {level['runs']:>5} {level['failures']:>4} {level['per_minute']:>9.1f} "
+            f"{level['p50']:>7.2f} {level['p95']:>7.2f} {level['p99']:>7.2f} "
+            f"{level['peak_rss_mb']:>8.0f} {level['dashboard_peak_rss_mb']:>8.0f} {level['cpu_percent']:>6.1f}"
+        )
+    return "\n".join(lines)
+
+
+def run_load_test(concurrency_levels, runs_per_level=None, devs=10, months=12, generate_kwargs=None,
+                  memory_ceiling_mb=None):
+    """
+    Runs the load test at every concurrency level against one shared stub server.
+
+    Args:
+        concurrency_levels (list): Numbers of concurrent invocations to test.
+        runs_per_level (int): Invocations per level. Defaults to 4 per worker.
+        devs (int): Developers in the synthetic payload.
+        months (int): Months in the synthetic payload.
+        generate_kwargs (dict): Extra generate_dashboard arguments (fast_figures, output_format...).
+        memory_ceiling_mb (float): Caps the workers of each level to those that fit under it.
+
+    Returns:
+        list: Result dict of each level (see run_level).
+    """
+    levels = []
+    with tempfile.TemporaryDirectory(prefix="loadtest-cassette-") as cassette_dir:
+        write_stub_cassette(cassette_dir, synthetic_payload(devs=devs, months=months))
+        with ReplayServer(cassette_dir) as server:
+            for concurrency in concurrency_levels:
+                runs = runs_per_level or concurrency * 4
+                print(f"Running {runs} dashboards with concurrency {concurrency}...")
+                levels.append(run_level(server.url, concurrency, runs, generate_kwargs, memory_ceiling_mb))
+    return levels
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test concurrent dashboard generation.")
+    parser.add_argument("--concurrency", default="1,2,4", help="Comma separated concurrency levels")
+    parser.add_argument("--runs", type=int, default=None, help="Invocations per level (default: 4 per worker)")
+    parser.add_argument("--devs", type=int, default=10, help="Developers in the synthetic payload")
+    parser.add_argument("--months", type=int, default=12, help="Months in the synthetic payload")
+    parser.add_argument("--fast-figures", action="store_true", help="Build panels without Plotly validation")
+    parser.add_argument("--output-format", default="png", choices=("png", "svg"))
+    parser.add_argument("--memory-ceiling", type=float, default=None,
+                        help="Memory in MB available to the workers; caps the concurrency of each level")
+    args = parser.parse_args()
+
+    levels = [int(level) for level in args.concurrency.split(",") if level.strip()]
+    generate_kwargs = {"fast_figures": args.fast_figures, "output_format": args.output_format}
+    results = run_load_test(levels, args.runs, args.devs, args.months, generate_kwargs, args.memory_ceiling)
+    print(f"Host cores: {os.cpu_count()}")
+    print(format_report(results))
+
+
+if __name__ == "__main__":
+    main()
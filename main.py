@@ -2,6 +2,8 @@
 import json
 import os
 import sys
+import tempfile
+from contextlib import nullcontext
 import requests
 # Removing excessive logging imports
 
@@ -13,14 +15,96 @@ from charts import (
     create_ranking_figure
 )
 # Import function to combine images
-from image_utils import combine_dashboard_images
+from image_utils import combine_dashboard_images, dashboard_scale, parse_dashboard_variants
+from fast_charts import (
+    build_indicators_dict,
+    build_bar_dict,
+    build_pie_dict,
+    build_ranking_dict,
+    write_figure_image
+)
+from svg_utils import combine_dashboard_svg
+from cassette import use_cassette
+from stage_profiler import RunProfiler
+from history import record_run
+from git_analytics import local_dashboard_payload
+from event_aggregation import aggregate_event_file
+from org_dashboard import org_dashboard_payload, parse_repo_list
+from trend_store import TrendStore, apply_trends
+from categories import reduce_pie_categories, reduce_bar_series
+from payload_validation import check_payload, PayloadValidationError
+from payload_model import DashboardPayload
+from avatars import NegativeCache, fetch_avatars
+from render_supervisor import RenderSupervisor, RssSampler, warm_up_in_process
+from memory_gate import GENERATION_GATE, MemoryGate
+from http_utils import DeadlineBudget, request_with_retries
+from json_utils import resolve_json_engine, parse_response_json, configure_plotly_json
+from timing import StageTimer
 
 # Import configuration constants
-from config import API_URL
+from config import (
+    API_URL, JSON_ENGINE, FAST_FIGURES, RENDER_WATCHDOG, RENDER_PANEL_TIMEOUT, RENDER_WARM_UP,
+    RUN_DEADLINE_SECONDS, OUTPUT_FORMAT, DATA_SOURCE, GIT_ANALYTICS_CHECKPOINT_DIR, CASSETTE_DIR, PROFILE_MODE, HISTORY_REGRESSION_THRESHOLD
+)
+
+# Variants with their own dashboard_image_<name> output in action.yml
+DECLARED_VARIANT_OUTPUTS = ("readme",)
+
+class DashboardResult:
+    """
+    Outcome of one generate_dashboard call.
+
+    Truthy when the dashboard was generated and uploaded, so it can be used
+    wherever the former boolean return value was.
+
+    Attributes:
+        success (bool): Whether the whole pipeline succeeded.
+        output_path (str): Path of the final image (or SVG document).
+        image_url (str): URL returned by the backend after the upload, if any.
+        variant_paths (dict): Variant name to the path of each downscaled copy.
+        timings (dict): Stage name to seconds, as recorded by timing.StageTimer.
+        memory_peaks (dict): Stage name to peak Python memory in bytes (only while
+            tracemalloc is tracing, e.g. when profiling). Stages that overlapped a
+            stage of another generation have no entry.
+        payload_size (dict): Number of devs, months and pie slices of the payload.
+        peak_rss_mb (float): Peak resident memory of this process and its renderer
+            processes during the generation, in MB. Includes any generation running
+            in parallel in the same process.
+        error (str): Why the generation failed, None on success.
+    """
 
-def generate_dashboard(owner=None, repo=None, run_id=None, output_path="images/all_in_one.png", actions_runtime_token=None):
+    def __init__(self, output_path, success=False, image_url=None, variant_paths=None, timings=None,
+                 memory_peaks=None, payload_size=None, error=None, peak_rss_mb=None):
+        self.output_path = output_path
+        self.success = success
+        self.image_url = image_url
+        self.variant_paths = variant_paths or {}
+        self.timings = timings or {}
+        self.memory_peaks = memory_peaks or {}
+        self.payload_size = payload_size or {}
+        self.error = error
+        self.peak_rss_mb = peak_rss_mb
+
+    def __bool__(self):
+        return self.success
+
+    def __repr__(self):
+        status = "ok" if self.success else f"failed: {self.error}"
+        return f"DashboardResult({self.output_path!r}, {status})"
+
+
+def generate_dashboard(owner=None, repo=None, run_id=None, output_path="images/all_in_one.png", actions_runtime_token=None,
+                       json_engine=None, fast_figures=None, render_watchdog=None, render_timeout=None,
+                       run_deadline=None, warm_up=None, target_width=None, variants=None, output_format=None,
+                       data_source=None, repo_path=".", events_path=None, repos=None,
+                       trend_db=None, trend_key=None, trend_periods=None, local_deltas=False, memory_gate=None,
+                       avatar_cache=None):
     """
     Generates the dashboard image with the given parameters.
+
+    Intermediate panel images live in a temporary workspace private to the
+    call, and results are returned instead of written to the environment, so
+    concurrent calls only need distinct output paths.
     
     Args:
         actions_runtime_token (str): GitHub Actions runtime token for API authentication.
@@ -28,82 +112,324 @@ def generate_dashboard(owner=None, repo=None, run_id=None, output_path="images/a
         repo (str): Repository name.
         run_id (str): Optional run ID for the GitHub Actions workflow.
         output_path (str): Path where the final dashboard image will be saved.
+        json_engine (str): JSON engine for response parsing and figure serialization
+            ("auto", "orjson" or "json"). Defaults to config.JSON_ENGINE.
+        fast_figures (bool): Build panels as plain figure dicts and export them without
+            Plotly's validators. Defaults to config.FAST_FIGURES.
+        render_watchdog (bool): Render panels in a supervised worker process with a
+            per-panel deadline, memory limit and one retry. Defaults to config.RENDER_WATCHDOG.
+        render_timeout (float): Per-panel deadline in seconds for the watchdog.
+            Defaults to config.RENDER_PANEL_TIMEOUT.
+        run_deadline (float): Time budget in seconds shared by every network call of the run.
+            Defaults to config.RUN_DEADLINE_SECONDS.
+        warm_up (bool): Start the renderer in the background while the data is fetched.
+            Defaults to config.RENDER_WARM_UP.
+        target_width (int): Width in pixels of the final image. Panels are rendered at the
+            matching scale. None keeps the full DASHBOARD_WIDTH resolution.
+        variants (dict): Downscaled copies of the final image to produce, as
+            {name: width in pixels}. Defaults to config.DASHBOARD_VARIANTS. main() exposes
+            them all in the `dashboard_variants` JSON output, and the names in
+            DECLARED_VARIANT_OUTPUTS as `dashboard_image_<name>` too.
+        output_format (str): "png" or "svg". SVG exports every panel as vector and
+            assembles them into one SVG document (the output path gets a .svg
+            extension); variants are not produced. Defaults to config.OUTPUT_FORMAT.
+        data_source (str): "api" fetches the payload from the data API, "git" computes it
+            from the local history of `repo_path` (see git_analytics), "events" aggregates the
+            raw events of `events_path`. Defaults to config.DATA_SOURCE.
+        repo_path (str): Git checkout used by the "git" data source.
+        events_path (str): JSONL, CSV or Parquet file of raw activity events used by the
+            "events" data source (see event_aggregation).
+        repos (list): Repositories of `owner` to merge into one organization-wide dashboard
+            with the "api" data source (see org_dashboard). None renders `repo` alone.
+        trend_db (str): SQLite trend store recording each run's indicators and bar series
+            (see trend_store). None disables it.
+        trend_key (str): Key of the dashboard in the trend store. Defaults to "owner/repo",
+            or the owner alone for organization dashboards.
+        trend_periods (int): Draw the bar chart from the latest stored periods, reaching
+            further back than the window served by the API.
+        local_deltas (bool): Compute the indicator deltas against the run recorded
+            config.TREND_DELTA_DAYS days earlier in the trend store.
+        memory_gate (memory_gate.MemoryGate): Memory ceiling shared by parallel generations.
+            Defaults to the process-wide gate configured by config.GENERATION_MEMORY_CEILING_MB.
+            A warning is printed when the peak RSS of the generation exceeds its ceiling.
+        avatar_cache (str): JSON file remembering avatar URLs that failed, so later runs skip
+            them for config.AVATAR_NEGATIVE_TTL_SECONDS. None keeps them in memory for this process.
         
     Returns:
-        bool: True if the dashboard was generated successfully, False otherwise.
+        DashboardResult: Paths, image URL and timings of the run; falsy on failure.
     """
+    output_format = (output_format or OUTPUT_FORMAT).lower()
+    data_source = (data_source or DATA_SOURCE).lower()
+    if data_source not in ("api", "git", "events"):
+        raise ValueError(f"Unknown data source '{data_source}', expected 'api', 'git' or 'events'")
+    if data_source == "events" and not events_path:
+        raise ValueError("The 'events' data source needs an events file")
+    if output_format not in ("png", "svg"):
+        raise ValueError(f"Unknown output format '{output_format}', expected 'png' or 'svg'")
+    if output_format == "svg":
+        output_path = os.path.splitext(output_path)[0] + ".svg"
+
     # Ensure the images directory exists
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
+
+    # Wait for room under the memory ceiling, then measure the peak RSS of this generation
+    gate = GENERATION_GATE if memory_gate is None else memory_gate
+    with gate.admit(), RssSampler() as rss_sampler:
+        timer = StageTimer()
+        scale = dashboard_scale(target_width)
+        budget = DeadlineBudget(run_deadline or RUN_DEADLINE_SECONDS)
+        engine = resolve_json_engine(json_engine or JSON_ENGINE)
+        configure_plotly_json(engine)
+
+        supervisor = None
+        if RENDER_WATCHDOG if render_watchdog is None else render_watchdog:
+            supervisor = RenderSupervisor(panel_timeout=render_timeout or RENDER_PANEL_TIMEOUT, json_engine=engine)
+
+        # Take Chromium's cold start off the critical path by overlapping it with the API request
+        if RENDER_WARM_UP if warm_up is None else warm_up:
+            if supervisor is not None:
+                supervisor.warm_up()
+            else:
+                warm_up_in_process()
+
+        result = DashboardResult(output_path)
+        try:
+            with tempfile.TemporaryDirectory(prefix="gitlights-") as workspace:
+                result.success = _generate_dashboard(
+                    timer, supervisor, budget, owner, repo, run_id, output_path, actions_runtime_token,
+                    engine, FAST_FIGURES if fast_figures is None else fast_figures, scale,
+                    variants, output_format, workspace, result, data_source, repo_path, events_path, repos,
+                    trends=_trend_options(trend_db, trend_key, trend_periods, local_deltas, owner, repo, repos),
+                    avatar_failures=NegativeCache(avatar_cache) if avatar_cache else None
+                )
+        finally:
+            result.timings = dict(timer.durations)
+            result.memory_peaks = dict(timer.memory_peaks)
+            if supervisor is not None:
+                supervisor.close()
+                if supervisor.failures:
+                    print(f"Render failures: {supervisor.failures}")
+            timer.print_summary()
+            print(budget.summary())
+    result.peak_rss_mb = rss_sampler.peak_mb
+    print(f"Peak RSS: {result.peak_rss_mb:.0f} MB (this process and its renderers)")
+    if gate.ceiling_mb and result.peak_rss_mb > gate.ceiling_mb:
+        print(f"::warning title=Memory ceiling exceeded::Peak RSS of {result.peak_rss_mb:.0f} MB "
+              f"is above the {gate.ceiling_mb:.0f} MB memory ceiling")
+    return result
+
+
+def _trend_options(trend_db, trend_key, trend_periods, local_deltas, owner, repo, repos):
+    """Trend store settings of a run, None when the store is disabled."""
+    if not trend_db:
+        return None
+    if not trend_key:
+        trend_key = owner if repos else (f"{owner}/{repo}" if owner and repo else "local")
+    return {"path": trend_db, "key": trend_key, "periods": trend_periods, "local_deltas": local_deltas}
+
+
+def _set_output(name, value):
+    """Sets a GitHub Actions output, falling back to the old syntax outside GITHUB_OUTPUT."""
+    github_output = os.environ.get('GITHUB_OUTPUT')
+    if github_output:
+        with open(github_output, 'a') as f:
+            f.write(f"{name}={value}\n")
+    else:
+        print(f"::set-output name={name}::{value}")
+
+
+def _render_panel(supervisor, panel, fig, path, scale=1.0):
+    """Renders one panel, through the render watchdog when it is enabled."""
+    if supervisor is not None:
+        supervisor.render(panel, fig, path, scale=scale)
+    elif isinstance(fig, dict):
+        write_figure_image(fig, path, scale=scale)
+    else:
+        fig.write_image(path, scale=scale)
+
+
+def _generate_dashboard(timer, supervisor, budget, owner, repo, run_id, output_path, actions_runtime_token,
+                        engine, fast_figures, scale, variants, output_format, workspace, result,
+                        data_source="api", repo_path=".", events_path=None, repos=None, trends=None,
+                        avatar_failures=None):
+    """
+    Runs the generation pipeline, recording each stage in `timer`.
+
+    Panel images are written to `workspace`; image URL, variant paths and
+    the failure reason are stored on `result`.
+    """
     
-    # 1) API Call
-    url = API_URL
-    params = {}
+    if data_source == "git":
+        # 1) Local analytics from the checked-out repository, no API round trip
+        try:
+            with timer.stage("fetch", label="git"):
+                data = local_dashboard_payload(repo_path, checkpoint_dir=GIT_ANALYTICS_CHECKPOINT_DIR)
+        except Exception as e:
+            print(f"Git analytics error: {e}")
+            result.error = f"Git analytics error: {e}"
+            return False
+    elif data_source == "events":
+        # 1) Client-side aggregation of raw activity events
+        try:
+            with timer.stage("fetch", label="events"):
+                data = aggregate_event_file(events_path)
+        except Exception as e:
+            print(f"Event aggregation error: {e}")
+            result.error = f"Event aggregation error: {e}"
+            return False
+    elif repos:
+        # 1) One API call per repository, merged into an organization-wide payload
+        try:
+            with timer.stage("fetch", label=f"{len(repos)} repos"):
+                data = org_dashboard_payload(owner, repos, run_id, actions_runtime_token, budget, engine)
+        except Exception as e:
+            print(f"Organization aggregation error: {e}")
+            result.error = f"Organization aggregation error: {e}"
+            return False
+    else:
+        # 1) API Call
+        url = API_URL
+        params = {}
     
-    # Add GitHub-related parameters
-    if owner and repo:
-        params.update({
-            'owner': owner,
-            'repo': repo,
-            'run_id': run_id
-        })
-        # Include GitHub data silently
+        # Add GitHub-related parameters
+        if owner and repo:
+            params.update({
+                'owner': owner,
+                'repo': repo,
+                'run_id': run_id
+            })
+            # Include GitHub data silently
 
 
-    try:
-        headers = {}
-        if actions_runtime_token:
-            headers['Authorization'] = f"{actions_runtime_token}"
+        try:
+            headers = {}
+            if actions_runtime_token:
+                headers['Authorization'] = f"{actions_runtime_token}"
         
-        response = requests.get(url, params=params, headers=headers)
-        response.raise_for_status()  # Raise an exception for 4XX/5XX responses
-        data = response.json()
-    except requests.exceptions.RequestException as e:
-        print(f"Request error: {e}")
-        return False
-    except requests.exceptions.JSONDecodeError:
-        print("Error: Response is not valid JSON")
+            with timer.stage("fetch"):
+                response = request_with_retries("get", url, budget=budget, params=params, headers=headers)
+                response.raise_for_status()  # Raise an exception for 4XX/5XX responses
+            with timer.stage("parse_json", label=engine):
+                data = parse_response_json(response, engine)
+        except requests.exceptions.RequestException as e:
+            print(f"Request error: {e}")
+            result.error = f"Request error: {e}"
+            return False
+        except requests.exceptions.JSONDecodeError:
+            print("Error: Response is not valid JSON")
+            result.error = "Response is not valid JSON"
+            return False
+
+    # Fail fast on a malformed payload, before any figure is built or avatar downloaded
+    try:
+        with timer.stage("validate"):
+            check_payload(data)
+    except PayloadValidationError as e:
+        print(f"Invalid dashboard payload ({len(e.problems)} problems):\n{e}")
+        result.error = f"Invalid dashboard payload: {'; '.join(f'{path}: {message}' for path, message in e.problems)}"
         return False
 
+    if trends:
+        # Record the run and enrich the payload from the stored history; never fatal
+        try:
+            with timer.stage("trends"):
+                with TrendStore(trends["path"]) as store:
+                    apply_trends(store, trends["key"], data, periods=trends["periods"],
+                                 local_deltas=trends["local_deltas"])
+        except Exception as e:
+            print(f"Trend store error: {e}")
+
     try:
-        # 2) Extract necessary information from JSON
-        indicators_cfg = data["indicators"]
-        bar_cfg        = data["bar_chart"]
-        pie_cfg        = data["pie_chart"]
-        rank_cfg       = data["ranking"]
-        watermark_text = data["watermark_text"]
+        # 2) Parse the JSON once into the slotted payload model the chart builders read,
+        #    with the long tail of small categories folded into "Other"
+        payload = DashboardPayload.from_dict(dict(
+            data,
+            pie_chart=reduce_pie_categories(data["pie_chart"]),
+            bar_chart=reduce_bar_series(data["bar_chart"]),
+        ))
+        indicators = payload.indicators
+        watermark_text = payload.watermark_text
+        result.payload_size = {
+            "devs": len(payload.ranking.devs),
+            "months": len(payload.bar_chart.months),
+            "pie_slices": len(data["pie_chart"]["labels"]),
+        }
+
+        # Avatars download concurrently under one deadline; missing ones get an initials placeholder
+        with timer.stage("avatars", label=f"{len(payload.ranking.devs)} devs"):
+            avatars = fetch_avatars(payload.ranking.devs, budget=budget, negative_cache=avatar_failures)
 
         # 3) Create figures with Plotly
-        fig_indicators = create_indicators_figure(
-            titles=indicators_cfg["titles"],
-            values=indicators_cfg["values"],
-            deltas=indicators_cfg["deltas"]
-        )
-        fig_bars = create_bar_figure(bar_cfg)
-        fig_pie = create_pie_figure(pie_cfg)
-        fig_rank = create_ranking_figure(rank_cfg)
-
-        # 4) Export each figure to PNG
-        indicators_path = "images/indicators.png"
-        bar_path = "images/bars.png"
-        pie_path = "images/pie.png"
-        ranking_path = "images/ranking.png"
+        if fast_figures:
+            # Plain figure dicts, exported without Plotly's validators
+            with timer.stage("build_figures", label="fast"):
+                fig_indicators = build_indicators_dict(
+                    titles=indicators.titles,
+                    values=indicators.values,
+                    deltas=indicators.deltas
+                )
+                fig_bars = build_bar_dict(payload.bar_chart)
+                fig_pie = build_pie_dict(payload.pie_chart)
+                fig_rank = build_ranking_dict(payload.ranking, avatars=avatars)
+        else:
+            with timer.stage("build_figures", label="validated"):
+                fig_indicators = create_indicators_figure(
+                    titles=indicators.titles,
+                    values=indicators.values,
+                    deltas=indicators.deltas
+                )
+                fig_bars = create_bar_figure(payload.bar_chart)
+                fig_pie = create_pie_figure(payload.pie_chart)
+                fig_rank = create_ranking_figure(payload.ranking, avatars=avatars)
+
+        # 4) Export each figure to PNG (or SVG; the format follows the extension)
+        indicators_path = os.path.join(workspace, f"indicators.{output_format}")
+        bar_path = os.path.join(workspace, f"bars.{output_format}")
+        pie_path = os.path.join(workspace, f"pie.{output_format}")
+        ranking_path = os.path.join(workspace, f"ranking.{output_format}")
+        # Vector panels are scaled through the document size instead
+        render_scale = 1.0 if output_format == "svg" else scale
         
-        fig_indicators.write_image(indicators_path)
-        fig_bars.write_image(bar_path)
-        fig_pie.write_image(pie_path)
-        fig_rank.write_image(ranking_path)
+        panels = [
+            ("indicators", fig_indicators, indicators_path),
+            ("bars", fig_bars, bar_path),
+            ("pie", fig_pie, pie_path),
+            ("ranking", fig_rank, ranking_path),
+        ]
+        # Render timings include serializing each figure with the selected JSON engine
+        for panel, fig, path in panels:
+            with timer.stage(f"render_{panel}", label=engine):
+                _render_panel(supervisor, panel, fig, path, render_scale)
 
         print(f"Individual images generated: {indicators_path}, {bar_path}, {pie_path}, {ranking_path}")
 
         # 5) Combine images into a single dashboard
-        combine_dashboard_images(
-            indicators_path=indicators_path,
-            bar_path=bar_path,
-            pie_path=pie_path,
-            ranking_path=ranking_path,
-            watermark_text=watermark_text,
-            output_path=output_path
-        )
+        with timer.stage("combine", label=output_format):
+            if output_format == "svg":
+                if variants:
+                    print("Dashboard variants are not produced for SVG output; scale the SVG instead")
+                combine_dashboard_svg(
+                    indicators_path=indicators_path,
+                    bar_path=bar_path,
+                    pie_path=pie_path,
+                    ranking_path=ranking_path,
+                    watermark_text=watermark_text,
+                    output_path=output_path,
+                    budget=budget,
+                    scale=scale
+                )
+            else:
+                result.variant_paths = combine_dashboard_images(
+                    indicators_path=indicators_path,
+                    bar_path=bar_path,
+                    pie_path=pie_path,
+                    ranking_path=ranking_path,
+                    watermark_text=watermark_text,
+                    output_path=output_path,
+                    budget=budget,
+                    scale=scale,
+                    variants=variants
+                ) or {}
         
         print(f"Final dashboard image generated: {output_path}")
         
@@ -114,7 +440,8 @@ def generate_dashboard(owner=None, repo=None, run_id=None, output_path="images/a
             # Open the image file in binary mode
             with open(output_path, 'rb') as img_file:
                 # Prepare the payload
-                files = {'image': (os.path.basename(output_path), img_file, 'image/png')}
+                content_type = 'image/svg+xml' if output_format == "svg" else 'image/png'
+                files = {'image': (os.path.basename(output_path), img_file, content_type)}
                 payload = {
                     'owner': owner,
                     'repo': repo,
@@ -126,13 +453,16 @@ def generate_dashboard(owner=None, repo=None, run_id=None, output_path="images/a
                 if actions_runtime_token:
                     headers['Authorization'] = f"{actions_runtime_token}"
                 
-                # Send the request
-                response = requests.post(backend_url, files=files, data=payload, headers=headers)
+                # Send the request (uploads are not idempotent, so they are never retried)
+                with timer.stage("upload"):
+                    response = request_with_retries("post", backend_url, budget=budget,
+                                                    files=files, data=payload, headers=headers)
                 
                 # Check for any non-200 status code
                 if response.status_code != 200:
                     error_msg = f"Backend request failed with status code: {response.status_code}"
                     print(error_msg)
+                    result.error = error_msg
                     # Fail the whole process when backend returns non-200 status
                     return False
                 
@@ -141,33 +471,20 @@ def generate_dashboard(owner=None, repo=None, run_id=None, output_path="images/a
                 if image_url:
                     # Print that upload was successful without showing the full URL (to avoid masking)
                     print(f"Dashboard image uploaded successfully")
-                    
-                    # Simply output the image URL
-                    # Use GitHub Actions output mechanism
-                    github_output = os.environ.get('GITHUB_OUTPUT')
-                    if github_output:
-                        with open(github_output, 'a') as f:
-                            f.write(f"image_url={image_url}\n")
-                    else:
-                        # Fall back to old syntax for backward compatibility
-                        print(f"::set-output name=image_url::{image_url}")
-
-                    print(f"Dashboard image uploaded successfully")
-
-                    
-                    # Store the URL for local reference
-                    os.environ['DASHBOARD_IMAGE_URL'] = image_url
+                    result.image_url = image_url
                 else:
                     print("Dashboard image uploaded to backend but URL not returned")
                     
         except Exception as e:
             print(f"Error uploading dashboard to backend: {e}")
+            result.error = f"Error uploading dashboard to backend: {e}"
             # Fail the process when backend requests fail
             return False
         
         return True
     except Exception as e:
         print(f"Error generating dashboard: {e}")
+        result.error = f"Error generating dashboard: {e}"
         return False
 
 
@@ -186,16 +503,79 @@ def main():
     repo = os.environ.get('INPUT_REPO', os.environ.get('REPO', None))
     run_id = os.environ.get('INPUT_RUN_ID', os.environ.get('RUN_ID', None))
     output_path = os.environ.get('INPUT_OUTPUT_PATH', os.environ.get('OUTPUT_PATH', 'images/all_in_one.png'))
+    json_engine = os.environ.get('INPUT_JSON_ENGINE', os.environ.get('JSON_ENGINE', None))
+    fast_figures = os.environ.get('INPUT_FAST_FIGURES', os.environ.get('FAST_FIGURES', 'true')).lower() == 'true'
+    render_watchdog = os.environ.get('INPUT_RENDER_WATCHDOG', os.environ.get('RENDER_WATCHDOG', 'false')).lower() == 'true'
+    render_timeout = os.environ.get('INPUT_RENDER_TIMEOUT', os.environ.get('RENDER_TIMEOUT', None))
+    run_deadline = os.environ.get('INPUT_RUN_DEADLINE', os.environ.get('RUN_DEADLINE', None))
+    warm_up = os.environ.get('INPUT_WARM_UP', os.environ.get('WARM_UP', 'true')).lower() == 'true'
+    target_width = os.environ.get('INPUT_TARGET_WIDTH', os.environ.get('TARGET_WIDTH', None))
+    variants = os.environ.get('INPUT_VARIANTS', os.environ.get('VARIANTS', None))
+    output_format = os.environ.get('INPUT_OUTPUT_FORMAT', os.environ.get('OUTPUT_FORMAT', None))
+    data_source = os.environ.get('INPUT_DATA_SOURCE', os.environ.get('DATA_SOURCE', None))
+    repo_path = os.environ.get('INPUT_REPO_PATH', os.environ.get('GITHUB_WORKSPACE', '.'))
+    events_path = os.environ.get('INPUT_EVENTS_PATH', os.environ.get('EVENTS_PATH', None))
+    repos = os.environ.get('INPUT_REPOS', os.environ.get('REPOS', None))
+    trend_db = os.environ.get('INPUT_TREND_DB', os.environ.get('TREND_DB', None))
+    trend_periods = os.environ.get('INPUT_TREND_PERIODS', os.environ.get('TREND_PERIODS', None))
+    local_deltas = os.environ.get('INPUT_LOCAL_DELTAS', os.environ.get('LOCAL_DELTAS', 'false')).lower() == 'true'
+    avatar_cache = os.environ.get('INPUT_AVATAR_CACHE', os.environ.get('AVATAR_CACHE', None))
+    memory_ceiling_mb = os.environ.get('INPUT_MEMORY_CEILING_MB', os.environ.get('MEMORY_CEILING_MB', None))
     
     # These are standard GitHub Actions environment variables, not inputs
     actions_runtime_token = os.environ.get('ACTIONS_RUNTIME_TOKEN', None)
+
+    # Local benchmarking only: record the network traffic, or replay it offline
+    cassette_mode = os.environ.get('CASSETTE_MODE', None)
+    cassette_dir = os.environ.get('CASSETTE_DIR', CASSETTE_DIR)
+    profile_mode = os.environ.get('INPUT_PROFILE', os.environ.get('PROFILE', PROFILE_MODE))
+    history_file = os.environ.get('INPUT_HISTORY_FILE', os.environ.get('HISTORY_FILE', None))
+    history_threshold = os.environ.get('INPUT_HISTORY_THRESHOLD', os.environ.get('HISTORY_THRESHOLD', None))
     
     # Simple confirmation of execution
 
-    success = generate_dashboard(owner=owner, repo=repo, run_id=run_id, output_path=output_path, actions_runtime_token=actions_runtime_token)
+    # Profile reports are written next to the dashboard, ready to upload as an artifact
+    profile_dir = os.path.dirname(output_path) or "."
+
+    with use_cassette(cassette_dir, cassette_mode) if cassette_mode else nullcontext(), \
+            RunProfiler(profile_dir, mode=profile_mode) if profile_mode else nullcontext() as profiler:
+        result = generate_dashboard(owner=owner, repo=repo, run_id=run_id, output_path=output_path, actions_runtime_token=actions_runtime_token,
+                                     json_engine=json_engine, fast_figures=fast_figures,
+                                     render_watchdog=render_watchdog, render_timeout=float(render_timeout) if render_timeout else None,
+                                     run_deadline=float(run_deadline) if run_deadline else None, warm_up=warm_up,
+                                     target_width=int(target_width) if target_width else None,
+                                     variants=parse_dashboard_variants(variants) if variants else None,
+                                     output_format=output_format, data_source=data_source, repo_path=repo_path,
+                                     events_path=events_path, repos=parse_repo_list(repos) if repos else None,
+                                     trend_db=trend_db, trend_periods=int(trend_periods) if trend_periods else None,
+                                     local_deltas=local_deltas, avatar_cache=avatar_cache,
+                                     memory_gate=MemoryGate(ceiling_mb=float(memory_ceiling_mb)) if memory_ceiling_mb else None)
+        if profiler is not None:
+            profiler.stage_memory = result.memory_peaks
     
+    # Compare with previous runs and append this one to the latency history
+    if history_file:
+        try:
+            record_run(history_file, result, summary_path=os.environ.get('GITHUB_STEP_SUMMARY'),
+                       threshold=float(history_threshold) if history_threshold else HISTORY_REGRESSION_THRESHOLD)
+        except Exception as e:
+            print(f"Error updating the latency history: {e}")
+
+    # Expose the results as GitHub Actions outputs
+    if result:
+        _set_output("dashboard_image", result.output_path)
+        # Every variant is listed in one JSON output; only the names declared in
+        # action.yml also get their own dashboard_image_<name> output
+        if result.variant_paths:
+            _set_output("dashboard_variants", json.dumps(result.variant_paths))
+        for name in DECLARED_VARIANT_OUTPUTS:
+            if name in result.variant_paths:
+                _set_output(f"dashboard_image_{name}", result.variant_paths[name])
+        if result.image_url:
+            _set_output("image_url", result.image_url)
+
     # Exit with appropriate status code
-    if not success:
+    if not result:
         sys.exit(1)
 
 if __name__ == "__main__":
@@ -0,0 +1,86 @@
+# memory_gate.py
+"""
+Memory ceiling for parallel dashboard generations.
+
+Every generation holds decoded panels, the composited canvas and a Chromium
+renderer, so running too many at once in a batch can exhaust the host. The
+gate admits a generation only when the memory reserved by the running ones,
+plus its own estimate, stays under the ceiling; the others wait. The first
+generation is always admitted, even when its estimate alone exceeds the
+ceiling, so a low ceiling serializes runs instead of blocking them forever.
+
+Process pools (see loadtest) apply the same ceiling by sizing the pool
+with max_parallel.
+"""
+import threading
+from contextlib import contextmanager
+
+from config import GENERATION_MEMORY_CEILING_MB, GENERATION_MEMORY_ESTIMATE_MB
+
+
+class MemoryGate:
+    """
+    Admits generations while their estimated memory fits under a ceiling.
+
+    Usage:
+        gate = MemoryGate(ceiling_mb=4096)
+        with gate.admit():
+            ...
+    """
+
+    def __init__(self, ceiling_mb=GENERATION_MEMORY_CEILING_MB, estimate_mb=GENERATION_MEMORY_ESTIMATE_MB):
+        """
+        Args:
+            ceiling_mb (float): Memory available to generations. None disables the ceiling.
+            estimate_mb (float): Memory one generation is assumed to need.
+        """
+        self.ceiling_mb = ceiling_mb
+        self.estimate_mb = estimate_mb
+        self.reserved_mb = 0.0
+        self.running = 0
+        self.waits = 0
+        self._condition = threading.Condition()
+
+    def max_parallel(self):
+        """
+        Returns:
+            int: Generations that fit under the ceiling (at least 1), None when unlimited.
+        """
+        if not self.ceiling_mb:
+            return None
+        return max(1, int(self.ceiling_mb // self.estimate_mb))
+
+    def _fits(self, estimate_mb):
+        return self.running == 0 or self.reserved_mb + estimate_mb <= self.ceiling_mb
+
+    @contextmanager
+    def admit(self, estimate_mb=None):
+        """
+        Waits until the generation fits under the ceiling and reserves its memory for the block.
+
+        Args:
+            estimate_mb (float): Memory this generation needs. Defaults to the gate estimate.
+        """
+        if not self.ceiling_mb:
+            yield
+            return
+        estimate_mb = self.estimate_mb if estimate_mb is None else estimate_mb
+        with self._condition:
+            if not self._fits(estimate_mb):
+                self.waits += 1
+                print(f"Memory ceiling reached ({self.reserved_mb:.0f} of {self.ceiling_mb:.0f} MB reserved), "
+                      f"waiting for a running generation to finish")
+                self._condition.wait_for(lambda: self._fits(estimate_mb))
+            self.reserved_mb += estimate_mb
+            self.running += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self.reserved_mb -= estimate_mb
+                self.running -= 1
+                self._condition.notify_all()
+
+
+# Shared by every generate_dashboard call of the process
+GENERATION_GATE = MemoryGate()
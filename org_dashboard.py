@@ -0,0 +1,216 @@
+# org_dashboard.py
+"""
+Organization-wide dashboard from many repository payloads.
+
+The data API returns one payload per repository. This module fetches the
+payloads of several repositories concurrently and merges them into a single
+payload with the same structure, which is then rendered once:
+
+- indicator values are summed per title, whatever their order in each
+  payload, and the deltas recomputed from the summed previous values (each
+  repo's previous value is value / (1 + delta));
+- bar chart series are aligned on the union of their period labels, in
+  first-seen order, missing points counting as 0;
+- pie chart slices are summed per label;
+- ranking developers are summed per name and the top N picked with a heap.
+
+The merges work on numpy arrays (np.add.at over label indices) rather than
+Python loops over every label and developer.
+"""
+import heapq
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from config import API_URL, ORG_FETCH_WORKERS, ORG_TOP_DEVS
+from event_aggregation import relative_delta
+from http_utils import request_with_retries
+from json_utils import parse_response_json
+from payload_validation import validate_payload
+
+BAR_SERIES = ["commits", "prs", "comments", "reviews"]
+# Ranking order: most commits first, ties broken by the other activity counts
+RANKING_FIELDS = ["commits", "prs", "reviews", "comments"]
+
+
+def parse_repo_list(spec):
+    """
+    Parses a repository list such as "api, web,docs" or "api\\nweb".
+
+    Returns:
+        list: Repository names without duplicates, in the given order.
+    """
+    repos = []
+    for item in spec.replace("\n", ",").split(","):
+        name = item.strip()
+        if name and name not in repos:
+            repos.append(name)
+    return repos
+
+
+def fetch_repo_payload(owner, repo, run_id=None, actions_runtime_token=None, budget=None, engine="json"):
+    """
+    Fetches the dashboard payload of one repository from the data API.
+
+    Returns:
+        dict: The parsed payload.
+    """
+    params = {'owner': owner, 'repo': repo, 'run_id': run_id}
+    headers = {'Authorization': f"{actions_runtime_token}"} if actions_runtime_token else {}
+    response = request_with_retries("get", API_URL, budget=budget, params=params, headers=headers)
+    response.raise_for_status()
+    return parse_response_json(response, engine)
+
+
+def fetch_org_payloads(owner, repos, run_id=None, actions_runtime_token=None, budget=None, engine="json",
+                       max_workers=ORG_FETCH_WORKERS):
+    """
+    Fetches the payloads of several repositories concurrently.
+
+    Repositories whose request fails, or whose payload is invalid (see
+    payload_validation), are reported and left out of the dashboard; the run
+    only fails when none of them could be fetched.
+
+    Args:
+        owner (str): Organization or user owning the repositories.
+        repos (list): Repository names.
+        max_workers (int): Concurrent requests.
+
+    Returns:
+        dict: Repository name to payload, in the order of `repos`.
+
+    Raises:
+        RuntimeError: If no payload could be fetched.
+    """
+    def fetch(repo):
+        try:
+            payload = fetch_repo_payload(owner, repo, run_id, actions_runtime_token, budget, engine)
+        except Exception as e:
+            print(f"::warning title=Repository skipped::{owner}/{repo}: {e}")
+            return None
+        # A malformed payload would fail the merge with a bare KeyError, so it is dropped here
+        problems = validate_payload(payload)
+        if problems:
+            print(f"::warning title=Repository skipped::{owner}/{repo}: invalid payload "
+                  f"({'; '.join(f'{path}: {message}' for path, message in problems)})")
+            return None
+        return payload
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(repos)))) as executor:
+        results = list(executor.map(fetch, repos))
+    payloads = {repo: payload for repo, payload in zip(repos, results) if payload is not None}
+    if not payloads:
+        raise RuntimeError(f"No payload could be fetched for {owner} ({len(repos)} repositories)")
+    print(f"Fetched {len(payloads)} of {len(repos)} repository payloads for {owner}")
+    return payloads
+
+
+def _sum_by_label(labels, values, columns):
+    # Unique labels in first-seen order and the per-label sums of each row of `values`.
+    # Labels are not sorted: month names ("Jan", "Feb") would come out alphabetically
+    labels = [str(label) for label in labels]
+    unique = np.array(list(dict.fromkeys(labels)), dtype=object)
+    index = {label: i for i, label in enumerate(unique)}
+    inverse = np.fromiter((index[label] for label in labels), dtype=np.intp, count=len(labels))
+    sums = np.zeros((columns, len(unique)), dtype=np.float64)
+    for row in range(columns):
+        np.add.at(sums[row], inverse, values[row])
+    return unique, sums
+
+
+def _merge_indicators(payloads):
+    # Title to [current, previous] sums; titles keep their first-seen order
+    totals = {}
+    for payload in payloads:
+        indicators = payload["indicators"]
+        for title, value, delta in zip(indicators["titles"], indicators["values"], indicators["deltas"]):
+            before = value / (1 + delta) if delta != -1 else 0.0
+            total = totals.setdefault(title, [0.0, 0.0])
+            total[0] += value
+            total[1] += before
+    return {
+        "titles": list(totals),
+        "values": [int(cur) if float(cur).is_integer() else round(float(cur), 2) for cur, _ in totals.values()],
+        "deltas": [relative_delta(float(cur), float(prev)) for cur, prev in totals.values()],
+    }
+
+
+def _merge_bar_chart(payloads):
+    labels = np.concatenate([np.asarray(p["bar_chart"]["months"], dtype=object) for p in payloads])
+    series = np.vstack([np.concatenate([np.asarray(p["bar_chart"].get(name) or [0] * len(p["bar_chart"]["months"]),
+                                                   dtype=np.float64) for p in payloads])
+                        for name in BAR_SERIES])
+    series = np.nan_to_num(series)  # Missing points (None) count as 0
+    # Periods keep the order the repositories list them in, the first repository's periods first
+    months, sums = _sum_by_label(labels, series, len(BAR_SERIES))
+    merged = {"title": payloads[0]["bar_chart"]["title"], "months": months.tolist()}
+    merged.update({name: sums[i].astype(int).tolist() for i, name in enumerate(BAR_SERIES)})
+    return merged
+
+
+def _merge_pie_chart(payloads):
+    labels = np.concatenate([np.asarray(p["pie_chart"]["labels"], dtype=object) for p in payloads])
+    values = np.concatenate([np.asarray(p["pie_chart"]["values"], dtype=np.float64) for p in payloads])
+    unique, sums = _sum_by_label(labels, values[np.newaxis, :], 1)
+    order = np.argsort(-sums[0], kind="stable")
+    return {
+        "title": payloads[0]["pie_chart"]["title"],
+        "labels": unique[order].tolist(),
+        "values": [int(v) for v in sums[0][order]],
+    }
+
+
+def _merge_ranking(payloads, top_devs):
+    devs = [dev for payload in payloads for dev in payload["ranking"]["devs"]]
+    if not devs:
+        return {"title": payloads[0]["ranking"]["title"], "devs": []}
+    counts = np.array([[dev.get(field, 0) for dev in devs] for field in RANKING_FIELDS], dtype=np.float64)
+    names, sums = _sum_by_label([dev["name"] for dev in devs], counts, len(RANKING_FIELDS))
+
+    avatars = {}
+    for dev in devs:
+        if dev.get("avatar"):
+            avatars.setdefault(dev["name"], dev["avatar"])
+
+    # Only the top N developers are ordered, not the whole organization
+    top = heapq.nlargest(top_devs, range(len(names)), key=lambda i: tuple(sums[:, i]))
+    fields = dict(zip(RANKING_FIELDS, sums))
+    return {
+        "title": payloads[0]["ranking"]["title"],
+        "devs": [
+            {"name": str(names[i]), "avatar": avatars.get(names[i], ""),
+             **{field: int(fields[field][i]) for field in BAR_SERIES}}
+            for i in top
+        ],
+    }
+
+
+def merge_payloads(payloads, top_devs=ORG_TOP_DEVS):
+    """
+    Merges repository payloads into one organization payload.
+
+    Args:
+        payloads (list): Payloads with the data API structure, at least one.
+        top_devs (int): Developers listed in the merged ranking.
+
+    Returns:
+        dict: Payload with the same structure as the data API response.
+    """
+    if not payloads:
+        raise ValueError("No payloads to merge")
+    return {
+        "indicators": _merge_indicators(payloads),
+        "bar_chart": _merge_bar_chart(payloads),
+        "pie_chart": _merge_pie_chart(payloads),
+        "ranking": _merge_ranking(payloads, top_devs),
+        "watermark_text": payloads[0]["watermark_text"],
+    }
+
+
+def org_dashboard_payload(owner, repos, run_id=None, actions_runtime_token=None, budget=None, engine="json",
+                          top_devs=ORG_TOP_DEVS):
+    """
+    Fetches and merges the payloads of `repos` (see fetch_org_payloads and merge_payloads).
+    """
+    payloads = fetch_org_payloads(owner, repos, run_id, actions_runtime_token, budget, engine)
+    return merge_payloads(list(payloads.values()), top_devs=top_devs)
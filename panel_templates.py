@@ -0,0 +1,183 @@
+# panel_templates.py
+"""
+Registry of reusable panel layouts.
+
+Every dashboard panel shares the same static layout from one payload to the
+next (template, fonts, colours, legend placement and size). The registry
+builds each of those layouts once per process and produces new figures by
+shallow-cloning the stored layout and injecting only the data traces and the
+title, so batch and daemon runs do not rebuild them for every dashboard.
+"""
+import threading
+
+import plotly.io as pio
+
+from config import (
+    # Indicator chart config
+    INDICATOR_WIDTH, INDICATOR_HEIGHT, INDICATOR_FONT_FAMILY, INDICATOR_FONT_SIZE,
+    INDICATOR_FONT_COLOR,
+
+    # Bar chart config
+    BAR_CHART_WIDTH, BAR_CHART_HEIGHT, BAR_CHART_TITLE_FONT_SIZE,
+    BAR_CHART_LEGEND_FONT_SIZE, BAR_CHART_FONT_SIZE, BAR_CHART_FONT_FAMILY,
+    BAR_CHART_FONT_COLOR, BAR_CHART_LEGEND_Y_OFFSET,
+
+    # Pie chart config
+    PIE_CHART_WIDTH, PIE_CHART_HEIGHT,
+
+    # Ranking table config
+    RANKING_WIDTH, RANKING_HEIGHT, RANKING_AXIS_RANGE,
+    RANKING_TITLE_FONT_SIZE, RANKING_TITLE_FONT_COLOR,
+
+    # General plotly config
+    PLOTLY_TEMPLATE, BACKGROUND_COLOR
+)
+
+
+class PanelTemplateRegistry:
+    """
+    Lazily builds and caches the static layout of each registered panel.
+
+    Stored layouts are shared between figures and must be treated as
+    read-only. `new_figure` only replaces top-level layout keys, so nested
+    dicts of the stored layout are never modified.
+    """
+
+    def __init__(self):
+        self._builders = {}
+        self._layouts = {}
+        self._lock = threading.Lock()
+
+    def register(self, panel, builder):
+        """
+        Registers the layout builder of a panel.
+
+        Args:
+            panel (str): Panel name, e.g. "bars".
+            builder (callable): Function without arguments returning the layout dict.
+        """
+        with self._lock:
+            self._builders[panel] = builder
+            self._layouts.pop(panel, None)
+
+    def layout(self, panel):
+        """
+        Returns the shared layout of a panel, building it on first use.
+
+        Args:
+            panel (str): Registered panel name.
+
+        Returns:
+            dict: The cached layout. Do not modify it.
+        """
+        layout = self._layouts.get(panel)
+        if layout is None:
+            with self._lock:
+                layout = self._layouts.get(panel)
+                if layout is None:
+                    layout = self._builders[panel]()
+                    self._layouts[panel] = layout
+        return layout
+
+    def new_figure(self, panel, data, title=None, **layout_fields):
+        """
+        Creates a figure dict for a panel from its cached layout.
+
+        Args:
+            panel (str): Registered panel name.
+            data (list): Trace dicts of the figure.
+            title (str): Optional title text, merged into the layout's title settings.
+            **layout_fields: Extra top-level layout keys for this figure
+                (for example "annotations" or "images").
+
+        Returns:
+            dict: Figure dict with "data" and "layout" keys.
+        """
+        layout = dict(self.layout(panel))
+        if title is not None:
+            layout["title"] = dict(layout.get("title", {}), text=title)
+        layout.update(layout_fields)
+        return {"data": data, "layout": layout}
+
+    def clear(self):
+        """Drops every cached layout; they are rebuilt on next use."""
+        with self._lock:
+            self._layouts.clear()
+
+
+def resolved_plotly_template():
+    """The configured Plotly template as a plain dict (Plotly.js cannot resolve template names)."""
+    return pio.templates[PLOTLY_TEMPLATE].to_plotly_json()
+
+
+def _bar_font():
+    return {"family": BAR_CHART_FONT_FAMILY, "size": BAR_CHART_FONT_SIZE, "color": BAR_CHART_FONT_COLOR}
+
+
+def _bar_title():
+    return {"font": {"size": BAR_CHART_TITLE_FONT_SIZE, "color": BAR_CHART_FONT_COLOR}}
+
+
+def build_indicators_layout():
+    return {
+        "template": resolved_plotly_template(),
+        "width": INDICATOR_WIDTH,
+        "height": INDICATOR_HEIGHT,
+        "font": {"family": INDICATOR_FONT_FAMILY, "size": INDICATOR_FONT_SIZE, "color": INDICATOR_FONT_COLOR},
+        "paper_bgcolor": BACKGROUND_COLOR,
+        "plot_bgcolor": BACKGROUND_COLOR,
+    }
+
+
+def build_bars_layout():
+    return {
+        "template": resolved_plotly_template(),
+        "title": _bar_title(),
+        "legend": {
+            "orientation": "h",
+            "yanchor": "bottom",
+            "y": BAR_CHART_LEGEND_Y_OFFSET,
+            "xanchor": "center",
+            "x": 0.5,
+            "font": {"size": BAR_CHART_LEGEND_FONT_SIZE, "color": BAR_CHART_FONT_COLOR},
+        },
+        "barmode": "stack",
+        "paper_bgcolor": BACKGROUND_COLOR,
+        "plot_bgcolor": BACKGROUND_COLOR,
+        "width": BAR_CHART_WIDTH,
+        "height": BAR_CHART_HEIGHT,
+        "font": _bar_font(),
+    }
+
+
+def build_pie_layout():
+    return {
+        "template": resolved_plotly_template(),
+        "title": _bar_title(),
+        "paper_bgcolor": BACKGROUND_COLOR,
+        "plot_bgcolor": BACKGROUND_COLOR,
+        "width": PIE_CHART_WIDTH,
+        "height": PIE_CHART_HEIGHT,
+        "font": _bar_font(),
+    }
+
+
+def build_ranking_layout():
+    return {
+        "template": resolved_plotly_template(),
+        "xaxis": {"range": RANKING_AXIS_RANGE, "visible": False},
+        "yaxis": {"range": RANKING_AXIS_RANGE, "visible": False},
+        "title": {"font": {"size": RANKING_TITLE_FONT_SIZE, "color": RANKING_TITLE_FONT_COLOR}},
+        "paper_bgcolor": BACKGROUND_COLOR,
+        "plot_bgcolor": BACKGROUND_COLOR,
+        "width": RANKING_WIDTH,
+        "height": RANKING_HEIGHT,
+    }
+
+
+# Process-wide registry used by charts.py and fast_charts.py
+PANEL_TEMPLATES = PanelTemplateRegistry()
+PANEL_TEMPLATES.register("indicators", build_indicators_layout)
+PANEL_TEMPLATES.register("bars", build_bars_layout)
+PANEL_TEMPLATES.register("pie", build_pie_layout)
+PANEL_TEMPLATES.register("ranking", build_ranking_layout)
@@ -0,0 +1,156 @@
+# payload_model.py
+"""
+Parsed model of the dashboard payload.
+
+The JSON payload is turned into these objects in a single pass, right
+before the figures are built, and the chart builders read attributes
+instead of string-keyed lookups on nested dicts. Every class declares
+`__slots__`, so instances have no per-object `__dict__`, and the numeric
+series of the bar and pie charts are NumPy arrays rather than lists of
+Python numbers. This keeps many payloads held together (batch and daemon
+modes) small.
+
+`__slots__` is declared by hand rather than with `dataclass(slots=True)`,
+which needs Python 3.10 while the action image runs 3.9.
+
+The builders also accept the raw dicts through the `coerce` class methods,
+so callers holding a payload dict do not need to parse it first.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+
+BAR_SERIES_KEYS = ("commits", "prs", "comments", "reviews")
+
+
+def to_typed_array(series):
+    """
+    Converts a numeric series to a NumPy array once, before it reaches Plotly.
+
+    Plotly validates NumPy arrays in a single vectorized pass instead of element
+    by element, and Plotly >= 6 serializes them to the renderer as base64 typed
+    arrays instead of JSON number lists.
+
+    Args:
+        series (list): Numeric values. Missing values (None) become NaN.
+
+    Returns:
+        numpy.ndarray: Integer arrays are kept as integers, anything else is float64.
+    """
+    array = np.asarray(series)
+    if array.dtype.kind not in "iuf":
+        array = np.asarray(series, dtype=np.float64)
+    return array
+
+
+def _optional_array(series):
+    return None if series is None else to_typed_array(series)
+
+
+@dataclass
+class Indicators:
+    __slots__ = ("titles", "values", "deltas")
+    titles: tuple
+    values: tuple
+    deltas: tuple
+
+    @classmethod
+    def from_dict(cls, cfg):
+        return cls(tuple(cfg["titles"]), tuple(cfg["values"]), tuple(cfg["deltas"]))
+
+
+@dataclass(eq=False)  # Comparing arrays elementwise has no single truth value
+class BarChart:
+    """Bar chart; a series is None when it was folded into `other` (see categories)."""
+    __slots__ = ("title", "months", "commits", "prs", "comments", "reviews", "other")
+    title: str
+    months: tuple
+    commits: np.ndarray
+    prs: np.ndarray
+    comments: np.ndarray
+    reviews: np.ndarray
+    other: np.ndarray
+
+    @classmethod
+    def from_dict(cls, cfg):
+        return cls(cfg["title"], tuple(cfg["months"]),
+                   *(_optional_array(cfg[key]) for key in BAR_SERIES_KEYS), _optional_array(cfg.get("other")))
+
+    @classmethod
+    def coerce(cls, cfg):
+        return cfg if isinstance(cfg, cls) else cls.from_dict(cfg)
+
+
+@dataclass(eq=False)
+class PieChart:
+    __slots__ = ("title", "labels", "values")
+    title: str
+    labels: tuple
+    values: np.ndarray
+
+    @classmethod
+    def from_dict(cls, cfg):
+        return cls(cfg["title"], tuple(cfg["labels"]), to_typed_array(cfg["values"]))
+
+    @classmethod
+    def coerce(cls, cfg):
+        return cfg if isinstance(cfg, cls) else cls.from_dict(cfg)
+
+
+@dataclass
+class Developer:
+    __slots__ = ("name", "avatar", "commits", "prs", "comments", "reviews")
+    name: str
+    avatar: str
+    commits: int
+    prs: int
+    comments: int
+    reviews: int
+
+    @classmethod
+    def from_dict(cls, dev):
+        return cls(dev["name"], dev.get("avatar") or "", dev["commits"], dev["prs"], dev["comments"], dev["reviews"])
+
+
+@dataclass
+class Ranking:
+    __slots__ = ("title", "devs")
+    title: str
+    devs: tuple
+
+    @classmethod
+    def from_dict(cls, cfg):
+        return cls(cfg["title"], tuple(Developer.from_dict(dev) for dev in cfg["devs"]))
+
+    @classmethod
+    def coerce(cls, cfg):
+        return cfg if isinstance(cfg, cls) else cls.from_dict(cfg)
+
+
+@dataclass
+class DashboardPayload:
+    __slots__ = ("indicators", "bar_chart", "pie_chart", "ranking", "watermark_text")
+    indicators: Indicators
+    bar_chart: BarChart
+    pie_chart: PieChart
+    ranking: Ranking
+    watermark_text: str
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Parses a payload dict (already checked by payload_validation) into the model.
+
+        Args:
+            data (dict): Payload with the data API structure.
+
+        Returns:
+            DashboardPayload: The parsed payload.
+        """
+        return cls(
+            Indicators.from_dict(data["indicators"]),
+            BarChart.from_dict(data["bar_chart"]),
+            PieChart.from_dict(data["pie_chart"]),
+            Ranking.from_dict(data["ranking"]),
+            data["watermark_text"],
+        )
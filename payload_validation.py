@@ -0,0 +1,155 @@
+# payload_validation.py
+"""
+Schema and shape validation of the dashboard payload.
+
+Runs right after the payload is fetched, so a malformed payload fails the
+run in milliseconds with every problem listed, instead of partway through
+figure building, avatar downloads or rendering. Problems are reported with
+the JSON path of the offending value, e.g. `$.bar_chart.prs` or
+`$.ranking.devs[2].commits`.
+"""
+from numbers import Number
+
+from payload_model import BAR_SERIES_KEYS
+
+# Number of indicators the indicators panel draws
+INDICATOR_COUNT = 4
+RANKING_METRICS = ["commits", "prs", "comments", "reviews"]
+
+
+class PayloadValidationError(ValueError):
+    """Raised by check_payload; `problems` holds every (path, message) found."""
+
+    def __init__(self, problems):
+        self.problems = problems
+        super().__init__(format_problems(problems))
+
+
+def _is_number(value, allow_none=False):
+    if value is None:
+        return allow_none
+    return isinstance(value, Number) and not isinstance(value, bool)
+
+
+class _Checker:
+    def __init__(self):
+        self.problems = []
+
+    def fail(self, path, message):
+        self.problems.append((path, message))
+
+    def section(self, data, key):
+        value = data.get(key)
+        if not isinstance(value, dict):
+            self.fail(f"$.{key}", "missing" if value is None else f"expected an object, got {type(value).__name__}")
+            return None
+        return value
+
+    def list_of(self, data, path, key, kind, allow_none=False):
+        # Returns the list, or None after recording why it is not a usable list
+        value = data.get(key)
+        path = f"{path}.{key}"
+        if value is None and key not in data:
+            self.fail(path, "missing")
+            return None
+        if not isinstance(value, list):
+            self.fail(path, f"expected a list, got {type(value).__name__}")
+            return None
+        check = (lambda v: _is_number(v, allow_none)) if kind == "number" else (lambda v: isinstance(v, str))
+        bad = [i for i, item in enumerate(value) if not check(item)]
+        if bad:
+            self.fail(f"{path}[{bad[0]}]", f"expected a {kind}, got {type(value[bad[0]]).__name__}"
+                      + (f" ({len(bad)} invalid items)" if len(bad) > 1 else ""))
+        return value
+
+    def string(self, data, path, key, required=True):
+        value = data.get(key)
+        if value is None and not required:
+            return
+        if not isinstance(value, str):
+            self.fail(f"{path}.{key}", "missing" if value is None else f"expected a string, got {type(value).__name__}")
+
+    def same_length(self, path, reference_key, reference, others):
+        for key, value in others.items():
+            if reference is not None and value is not None and len(value) != len(reference):
+                self.fail(f"{path}.{key}", f"has {len(value)} items but {reference_key} has {len(reference)}")
+
+
+def validate_payload(data):
+    """
+    Checks that a payload has every key the dashboard needs, with the right types and lengths.
+
+    Args:
+        data (dict): Parsed payload.
+
+    Returns:
+        list: (JSON path, message) tuples, empty when the payload is valid.
+    """
+    checker = _Checker()
+    if not isinstance(data, dict):
+        checker.fail("$", f"expected an object, got {type(data).__name__}")
+        return checker.problems
+
+    indicators = checker.section(data, "indicators")
+    if indicators is not None:
+        titles = checker.list_of(indicators, "$.indicators", "titles", "string")
+        values = checker.list_of(indicators, "$.indicators", "values", "number")
+        deltas = checker.list_of(indicators, "$.indicators", "deltas", "number")
+        for key, value in (("titles", titles), ("values", values), ("deltas", deltas)):
+            if value is not None and len(value) < INDICATOR_COUNT:
+                checker.fail(f"$.indicators.{key}", f"has {len(value)} items, expected at least {INDICATOR_COUNT}")
+
+    bar = checker.section(data, "bar_chart")
+    if bar is not None:
+        checker.string(bar, "$.bar_chart", "title")
+        months = checker.list_of(bar, "$.bar_chart", "months", "string")
+        series = {key: checker.list_of(bar, "$.bar_chart", key, "number", allow_none=True) for key in BAR_SERIES_KEYS}
+        checker.same_length("$.bar_chart", "months", months, series)
+
+    pie = checker.section(data, "pie_chart")
+    if pie is not None:
+        checker.string(pie, "$.pie_chart", "title")
+        labels = checker.list_of(pie, "$.pie_chart", "labels", "string")
+        pie_values = checker.list_of(pie, "$.pie_chart", "values", "number")
+        checker.same_length("$.pie_chart", "labels", labels, {"values": pie_values})
+        if pie_values and any(_is_number(v) and v < 0 for v in pie_values):
+            checker.fail("$.pie_chart.values", "has negative values")
+
+    ranking = checker.section(data, "ranking")
+    if ranking is not None:
+        checker.string(ranking, "$.ranking", "title")
+        devs = ranking.get("devs")
+        if not isinstance(devs, list):
+            checker.fail("$.ranking.devs", "missing" if devs is None else f"expected a list, got {type(devs).__name__}")
+        else:
+            for i, dev in enumerate(devs):
+                path = f"$.ranking.devs[{i}]"
+                if not isinstance(dev, dict):
+                    checker.fail(path, f"expected an object, got {type(dev).__name__}")
+                    continue
+                checker.string(dev, path, "name")
+                checker.string(dev, path, "avatar", required=False)
+                for metric in RANKING_METRICS:
+                    if not _is_number(dev.get(metric)):
+                        checker.fail(f"{path}.{metric}", "missing" if metric not in dev else
+                                     f"expected a number, got {type(dev[metric]).__name__}")
+
+    checker.string(data, "$", "watermark_text")
+    return checker.problems
+
+
+def format_problems(problems):
+    """
+    Returns:
+        str: One line per problem, "path: message".
+    """
+    return "\n".join(f"{path}: {message}" for path, message in problems)
+
+
+def check_payload(data):
+    """
+    Raises PayloadValidationError listing every problem when the payload is invalid.
+    """
+    problems = validate_payload(data)
+    if problems:
+        raise PayloadValidationError(problems)
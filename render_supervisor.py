@@ -0,0 +1,360 @@
+# render_supervisor.py
+"""
+Supervised Kaleido rendering.
+
+Panels are rendered in a separate worker process that owns the Kaleido /
+Chromium subprocess. The supervisor gives every panel a deadline and a memory
+limit; when either is exceeded, or the worker dies, the whole worker process
+group is killed, a fresh worker is started and the panel is retried once.
+A panel that fails again raises PanelRenderError, so a hung renderer costs at
+most two deadlines instead of the runner's job timeout.
+"""
+import multiprocessing
+import os
+import signal
+import threading
+import time
+
+from config import RENDER_PANEL_TIMEOUT, RENDER_MEMORY_LIMIT_MB, RENDER_RETRIES, RSS_SAMPLE_INTERVAL
+
+# How often the supervisor checks the worker while a panel renders
+POLL_INTERVAL = 0.1
+
+# Smallest possible render, used to start Kaleido/Chromium ahead of the real panels
+WARM_UP_FIGURE = {"data": [], "layout": {"width": 10, "height": 10}}
+
+
+class PanelRenderError(Exception):
+    """Raised when a panel could not be rendered within its retries."""
+
+    def __init__(self, panel, reason):
+        super().__init__(f"Rendering panel '{panel}' failed: {reason}")
+        self.panel = panel
+        self.reason = reason
+
+
+def _render_worker(conn, json_engine):
+    """
+    Worker loop: renders (figure, path, kwargs) jobs until it receives None.
+    A job without a path renders in memory and discards the image (warm-up).
+
+    The worker starts its own session so the supervisor can kill it together
+    with the Chromium processes Kaleido spawns.
+    """
+    if hasattr(os, "setsid"):
+        os.setsid()
+
+    import plotly.io as pio
+    from json_utils import configure_plotly_json
+
+    configure_plotly_json(json_engine)
+    while True:
+        job = conn.recv()
+        if job is None:
+            break
+        fig, path, kwargs = job
+        try:
+            if path is None:
+                pio.to_image(fig, validate=False, **kwargs)
+            else:
+                pio.write_image(fig, path, validate=False, **kwargs)
+            conn.send(("ok", None))
+        except Exception as e:
+            conn.send(("error", f"{type(e).__name__}: {e}"))
+
+
+def _iter_proc_stats():
+    """
+    Yields (pid, ppid, pgid, rss_pages) for every process listed in /proc.
+    """
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat", "rb") as f:
+                stat = f.read()
+        except OSError:
+            continue  # The process exited while scanning
+        # Fields after the command name, which may itself contain spaces
+        fields = stat[stat.rfind(b")") + 2:].split()
+        try:
+            stats = int(entry), int(fields[1]), int(fields[2]), int(fields[21])
+        except (IndexError, ValueError):
+            continue  # Not a stat line we can read
+        yield stats
+
+
+def _page_size():
+    return os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def process_group_rss_mb(pgid):
+    """
+    Resident memory of every process in a process group, in MB.
+
+    Returns None when /proc is not available (non Linux hosts), in which case
+    the memory limit is not enforced.
+    """
+    if not os.path.isdir("/proc"):
+        return None
+    total_pages = sum(rss for _, _, group, rss in _iter_proc_stats() if group == pgid)
+    return total_pages * _page_size() / (1024 * 1024)
+
+
+def process_tree_rss_mb(pid):
+    """
+    Resident memory of a process and all of its descendants, in MB.
+
+    Returns None when /proc is not available.
+    """
+    if not os.path.isdir("/proc"):
+        return None
+    children, rss_pages = {}, {}
+    for proc_pid, ppid, _, rss in _iter_proc_stats():
+        children.setdefault(ppid, []).append(proc_pid)
+        rss_pages[proc_pid] = rss
+    total_pages, pending = 0, [pid]
+    while pending:
+        current = pending.pop()
+        total_pages += rss_pages.get(current, 0)
+        pending.extend(children.get(current, ()))
+    return total_pages * _page_size() / (1024 * 1024)
+
+
+class RssSampler:
+    """
+    Samples the RSS of a process and its descendants in a background thread.
+
+    Usage:
+        with RssSampler() as sampler:
+            ...
+        print(sampler.peak_mb)
+    """
+
+    def __init__(self, pid=None, interval=RSS_SAMPLE_INTERVAL):
+        """
+        Args:
+            pid (int): Root of the sampled process tree. Defaults to this process.
+            interval (float): Seconds between samples.
+        """
+        self.pid = pid or os.getpid()
+        self.interval = interval
+        self.peak_mb = 0.0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="rss-sampler", daemon=True)
+
+    def _sample(self):
+        rss = process_tree_rss_mb(self.pid)
+        if rss is not None:
+            self.peak_mb = max(self.peak_mb, rss)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def __enter__(self):
+        self._sample()
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._stop.set()
+        self._thread.join()
+        # A last sample, so short runs are measured too
+        self._sample()
+
+
+class RenderSupervisor:
+    """
+    Renders figures in a supervised worker process.
+
+    Usage:
+        with RenderSupervisor(json_engine="orjson") as supervisor:
+            supervisor.render("bars", fig_bars, "images/bars.png")
+    """
+
+    def __init__(self, panel_timeout=RENDER_PANEL_TIMEOUT, memory_limit_mb=RENDER_MEMORY_LIMIT_MB,
+                 retries=RENDER_RETRIES, json_engine="json", worker_target=_render_worker):
+        """
+        Args:
+            panel_timeout (float): Seconds allowed for each render attempt.
+            memory_limit_mb (float): Maximum RSS of the worker and its Chromium
+                processes. 0 or None disables the check.
+            retries (int): Extra attempts, each in a fresh worker, after a failure.
+            json_engine (str): JSON engine the worker uses to serialize figures.
+            worker_target (callable): Worker loop, replaceable in tests.
+        """
+        self.panel_timeout = panel_timeout
+        self.memory_limit_mb = memory_limit_mb
+        self.retries = retries
+        self.json_engine = json_engine
+        self.failures = []
+        self._worker_target = worker_target
+        self._context = multiprocessing.get_context("spawn")
+        self._process = None
+        self._conn = None
+        # Serializes jobs on the worker connection (warm-up runs in a background thread)
+        self._job_lock = threading.Lock()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def start(self):
+        """Starts the worker process if it is not running."""
+        if self._process is not None and self._process.is_alive():
+            return
+        parent_conn, child_conn = self._context.Pipe()
+        self._process = self._context.Process(
+            target=self._worker_target, args=(child_conn, self.json_engine), daemon=True
+        )
+        self._process.start()
+        child_conn.close()
+        self._conn = parent_conn
+
+    def close(self):
+        """Stops the worker, asking it to exit before killing it."""
+        if self._process is None:
+            return
+        # A warm-up still in flight is abandoned; the worker is stopped either way
+        if self._job_lock.acquire(timeout=0.1):
+            try:
+                self._conn.send(None)
+                self._process.join(timeout=5)
+            except (OSError, EOFError, AttributeError):
+                pass
+            finally:
+                self._job_lock.release()
+        self._kill()
+
+    def _kill(self):
+        process, self._process = self._process, None
+        if process is None:
+            return
+        if process.is_alive():
+            try:
+                os.killpg(process.pid, signal.SIGKILL)
+            except (AttributeError, OSError):
+                process.kill()
+            process.join(timeout=5)
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _attempt(self, fig, path, kwargs):
+        """
+        Runs one render attempt.
+
+        Returns:
+            str: None on success, otherwise the failure reason.
+        """
+        self.start()
+        # Local references: close() may tear the worker down from another thread
+        process, conn = self._process, self._conn
+        try:
+            conn.send((fig, path, kwargs))
+        except (OSError, EOFError) as e:
+            return f"worker unavailable ({e})"
+
+        deadline = time.monotonic() + self.panel_timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return f"timed out after {self.panel_timeout}s"
+            try:
+                if conn.poll(min(POLL_INTERVAL, remaining)):
+                    status, error = conn.recv()
+                    return None if status == "ok" else error
+            except (OSError, EOFError):
+                return f"worker exited with code {process.exitcode}"
+            if not process.is_alive():
+                return f"worker exited with code {process.exitcode}"
+            if self.memory_limit_mb:
+                rss = process_group_rss_mb(process.pid)
+                if rss is not None and rss > self.memory_limit_mb:
+                    return f"memory limit exceeded ({rss:.0f} MB > {self.memory_limit_mb} MB)"
+
+    def warm_up(self):
+        """
+        Starts the worker and renders a trivial figure in a background thread,
+        so Chromium's cold start overlaps with other work. Panels rendered
+        meanwhile wait for the warm-up to finish.
+
+        Returns:
+            threading.Thread: The started warm-up thread.
+        """
+        self.start()
+        # Taken here and released by the thread, so any later job queues behind the warm-up
+        self._job_lock.acquire()
+
+        def run():
+            start = time.perf_counter()
+            try:
+                reason = self._attempt(WARM_UP_FIGURE, None, {"format": "png"})
+                if reason is not None:
+                    print(f"Renderer warm-up failed: {reason}")
+                    self._kill()
+                    return
+            finally:
+                self._job_lock.release()
+            print(f"Renderer warm-up finished in {(time.perf_counter() - start) * 1000:.1f} ms (background)")
+
+        thread = threading.Thread(target=run, name="renderer-warm-up", daemon=True)
+        thread.start()
+        return thread
+
+    def render(self, panel, fig, path, **kwargs):
+        """
+        Renders a figure to `path`, restarting the worker and retrying on failure.
+
+        Args:
+            panel (str): Panel name, used in failure reports.
+            fig (plotly.graph_objects.Figure or dict): Figure to render.
+            path (str): Output image path.
+            **kwargs: Extra arguments for plotly.io.write_image (format, scale...).
+
+        Raises:
+            PanelRenderError: If every attempt failed.
+        """
+        if hasattr(fig, "to_plotly_json"):
+            fig = fig.to_plotly_json()
+
+        reason = None
+        with self._job_lock:
+            for attempt in range(1 + self.retries):
+                reason = self._attempt(fig, path, kwargs)
+                if reason is None:
+                    return
+                self.failures.append({"panel": panel, "attempt": attempt + 1, "reason": reason})
+                print(f"Rendering panel '{panel}' failed (attempt {attempt + 1}): {reason}")
+                # Start from a fresh worker; the current one may be hung or unhealthy
+                self._kill()
+        raise PanelRenderError(panel, reason)
+
+
+def warm_up_in_process():
+    """
+    Starts Kaleido in this process by rendering a trivial figure in a
+    background thread. Kaleido serializes renders internally, so a panel
+    rendered before the warm-up ends simply waits for it.
+
+    Returns:
+        threading.Thread: The started warm-up thread.
+    """
+    def run():
+        import plotly.io as pio
+
+        start = time.perf_counter()
+        try:
+            pio.to_image(WARM_UP_FIGURE, format="png", validate=False)
+        except Exception as e:
+            print(f"Renderer warm-up failed: {e}")
+            return
+        print(f"Renderer warm-up finished in {(time.perf_counter() - start) * 1000:.1f} ms (background)")
+
+    thread = threading.Thread(target=run, name="renderer-warm-up", daemon=True)
+    thread.start()
+    return thread
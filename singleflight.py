@@ -0,0 +1,91 @@
+# singleflight.py
+"""
+Request coalescing ("singleflight") for shared resources.
+
+In batch, concurrent or daemon use, many generations ask for the same
+resources at the same moment: the Gitlights logo, the JWKS document of
+GitHub Actions tokens, the avatars of popular contributors. A SingleFlight
+lets the first caller for a key run the fetch while every concurrent caller
+with the same key waits for it and receives the same result (or exception).
+Upstream requests then grow with the number of unique keys in flight, not
+with the number of callers.
+
+Nothing is cached: once a call completes, the next caller for its key runs
+a new one. Waiting callers can bound their wait with their own timeout (for
+example what is left of their run budget), so a hung execution does not hold
+them past it.
+"""
+import threading
+
+
+class SingleFlightTimeout(TimeoutError):
+    """Raised in a waiting caller when the shared execution outlasts its timeout."""
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls that share a key into one execution.
+
+    Attributes:
+        executions (int): Calls that actually ran.
+        coalesced (int): Calls that waited for another caller's execution instead.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self.executions = 0
+        self.coalesced = 0
+
+    def do(self, key, fn, timeout=None):
+        """
+        Runs `fn()`, unless a call with the same key is in flight.
+
+        Args:
+            key: Hashable identity of the call, e.g. the URL.
+            fn (callable): The fetch, without arguments. Callers sharing a key must be
+                interchangeable: only the first caller's function runs.
+            timeout (float): Seconds a coalesced caller waits for the execution in
+                flight. None waits until it completes. The caller running the
+                execution is not limited; bound the fetch itself.
+
+        Returns:
+            The result of the execution, shared by every coalesced caller.
+
+        Raises:
+            SingleFlightTimeout: If the execution in flight outlasts `timeout`.
+            Exception: Whatever the execution raised, re-raised in every caller.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.executions += 1
+            else:
+                self.coalesced += 1
+
+        if leader:
+            try:
+                call.result = fn()
+            except BaseException as e:
+                call.error = e
+            finally:
+                with self._lock:
+                    del self._calls[key]
+                call.done.set()
+        elif not call.done.wait(timeout):
+            raise SingleFlightTimeout(f"Shared call for {key!r} still in flight after {timeout:.1f}s")
+
+        if call.error is not None:
+            raise call.error
+        return call.result
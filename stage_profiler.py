@@ -0,0 +1,183 @@
+# stage_profiler.py
+"""
+Opt-in profiling of a dashboard generation.
+
+RunProfiler wraps a run in either a deterministic profiler (cProfile) or a
+low-overhead sampling profiler, and writes its results next to the dashboard
+so they can be uploaded as a workflow artifact:
+
+    profile.prof           cProfile stats (cprofile mode), for pstats/snakeviz
+    profile.folded         collapsed stacks (sampling mode), for flamegraph tools
+    profile_hotspots.txt   top-N hotspots and the tracemalloc peak of each stage
+
+tracemalloc runs for the whole profiled run, so timing.StageTimer records the
+peak Python memory of every stage.
+"""
+import cProfile
+import io
+import os
+import pstats
+import sys
+import threading
+import tracemalloc
+from collections import Counter
+
+from config import PROFILE_TOP_N, PROFILE_SAMPLE_INTERVAL
+
+PROFILE_MODES = ("cprofile", "sampling")
+
+
+def _frame_label(code):
+    # Last two path components keep labels short but tell apart the many __init__.py files
+    path = os.path.join(*code.co_filename.split(os.sep)[-2:]) if code.co_filename else "?"
+    return f"{code.co_name} ({path}:{code.co_firstlineno})"
+
+
+class SamplingProfiler:
+    """
+    Samples the stack of every thread at a fixed interval from a background thread.
+
+    Overhead is independent of how many Python calls the run makes, which keeps
+    Plotly's validator-heavy code paths close to their normal speed.
+    """
+
+    def __init__(self, interval=PROFILE_SAMPLE_INTERVAL):
+        """
+        Args:
+            interval (float): Seconds between samples.
+        """
+        self.interval = interval
+        self.stacks = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        own_id = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                stack = []
+                while frame is not None:
+                    stack.append(_frame_label(frame.f_code))
+                    frame = frame.f_back
+                self.stacks[tuple(reversed(stack))] += 1
+            self.samples += 1
+
+    def write_folded(self, path):
+        """Writes the samples as collapsed stacks ("root;...;leaf count" per line)."""
+        with open(path, "w") as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f"{';'.join(stack)} {count}\n")
+
+    def hotspot_lines(self, top_n=PROFILE_TOP_N):
+        """
+        Returns:
+            list: The functions with the most samples, by own (leaf) and by inclusive time.
+        """
+        own, inclusive = Counter(), Counter()
+        for stack, count in self.stacks.items():
+            own[stack[-1]] += count
+            for label in set(stack):
+                inclusive[label] += count
+        total = sum(self.stacks.values()) or 1
+        lines = [f"{self.samples} samples every {self.interval * 1000:.1f} ms", "", "Own samples:"]
+        lines += [f"  {count / total:6.1%}  {label}" for label, count in own.most_common(top_n)]
+        lines += ["", "Inclusive samples:"]
+        lines += [f"  {count / total:6.1%}  {label}" for label, count in inclusive.most_common(top_n)]
+        return lines
+
+
+class RunProfiler:
+    """
+    Context manager profiling the enclosed block and writing the reports to `output_dir`.
+
+    Usage:
+        with RunProfiler("images", mode="cprofile") as profiler:
+            result = generate_dashboard(...)
+            profiler.stage_memory = result.memory_peaks
+    """
+
+    def __init__(self, output_dir, mode="cprofile", top_n=PROFILE_TOP_N):
+        """
+        Args:
+            output_dir (str): Directory where the reports are written.
+            mode (str): "cprofile" (deterministic) or "sampling".
+            top_n (int): Number of hotspots listed in the summary.
+        """
+        if mode not in PROFILE_MODES:
+            raise ValueError(f"Unknown profile mode '{mode}', expected one of {PROFILE_MODES}")
+        self.output_dir = output_dir
+        self.mode = mode
+        self.top_n = top_n
+        # Stage name to peak bytes, filled by the caller from StageTimer.memory_peaks
+        self.stage_memory = {}
+        self.paths = {}
+        self._profiler = None
+        self._started_tracemalloc = False
+
+    def __enter__(self):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        if self.mode == "cprofile":
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+        else:
+            self._profiler = SamplingProfiler()
+            self._profiler.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if self.mode == "cprofile":
+            self._profiler.disable()
+        else:
+            self._profiler.stop()
+        traced_peak = tracemalloc.get_traced_memory()[1]
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+        self.write_reports(traced_peak)
+
+    def _hotspot_lines(self):
+        if self.mode == "sampling":
+            return self._profiler.hotspot_lines(self.top_n)
+        lines = []
+        for sort_key, title in (("tottime", "Own time"), ("cumulative", "Cumulative time")):
+            stream = io.StringIO()
+            pstats.Stats(self._profiler, stream=stream).sort_stats(sort_key).print_stats(self.top_n)
+            lines += [f"{title}:", stream.getvalue().strip(), ""]
+        return lines
+
+    def write_reports(self, traced_peak=None):
+        """Writes the profile and the hotspot summary to the output directory."""
+        os.makedirs(self.output_dir, exist_ok=True)
+        if self.mode == "cprofile":
+            self.paths["profile"] = os.path.join(self.output_dir, "profile.prof")
+            self._profiler.dump_stats(self.paths["profile"])
+        else:
+            self.paths["profile"] = os.path.join(self.output_dir, "profile.folded")
+            self._profiler.write_folded(self.paths["profile"])
+
+        lines = [f"Profile mode: {self.mode}", ""]
+        if self.stage_memory or traced_peak is not None:
+            lines.append("Python memory (tracemalloc peak):")
+            for stage, peak in self.stage_memory.items():
+                lines.append(f"  {stage:<20} {peak / (1024 * 1024):9.1f} MB")
+            if traced_peak is not None:
+                lines.append(f"  {'whole run':<20} {traced_peak / (1024 * 1024):9.1f} MB")
+            lines.append("")
+        lines += self._hotspot_lines()
+
+        self.paths["hotspots"] = os.path.join(self.output_dir, "profile_hotspots.txt")
+        with open(self.paths["hotspots"], "w") as f:
+            f.write("\n".join(lines) + "\n")
+        print(f"Profile written to {self.paths['profile']}, hotspots to {self.paths['hotspots']}")
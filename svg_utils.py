@@ -0,0 +1,108 @@
+# svg_utils.py
+"""
+Vector dashboard output.
+
+Assembles the four panels exported as SVG into a single SVG document with the
+same layout as image_utils.combine_dashboard_images: each panel is nested as
+an <svg> element at its dashboard position, followed by the watermark text and
+the Gitlights logo. Nothing is rasterized, so no Pillow canvas or PNG encoding
+is involved and the document is usually much smaller than the PNG.
+"""
+import xml.etree.ElementTree as ET
+
+from config import (
+    DASHBOARD_WIDTH, DASHBOARD_HEIGHT, DASHBOARD_PANEL_POSITIONS,
+    WATERMARK_FONT_SIZE, WATERMARK_TEXT_COLOR,
+    WATERMARK_POSITION_OFFSET_X, WATERMARK_POSITION_OFFSET_Y,
+    GITLIGHTS_LOGO_URL, LOGO_MAX_SIZE, LOGO_POSITION_X, LOGO_POSITION_Y,
+    SVG_LOGO_MODE
+)
+from image_utils import encode_image_from_url
+
+SVG_NS = "http://www.w3.org/2000/svg"
+XLINK_NS = "http://www.w3.org/1999/xlink"
+
+# Keep the default namespace on output instead of ElementTree's ns0: prefixes
+ET.register_namespace("", SVG_NS)
+ET.register_namespace("xlink", XLINK_NS)
+
+
+def _svg(tag):
+    return f"{{{SVG_NS}}}{tag}"
+
+
+def _logo_element(logo_mode, budget):
+    """<image> element for the logo, or None when it cannot be embedded."""
+    if logo_mode == "link":
+        href = GITLIGHTS_LOGO_URL
+    else:
+        # Same download path (and deadline handling) as the ranking avatars
+        href = encode_image_from_url(GITLIGHTS_LOGO_URL, budget=budget)
+        if not href:
+            return None
+    width, height = LOGO_MAX_SIZE
+    return ET.Element(_svg("image"), {
+        "x": str(LOGO_POSITION_X),
+        "y": str(LOGO_POSITION_Y),
+        "width": str(width),
+        "height": str(height),
+        "href": href,
+        f"{{{XLINK_NS}}}href": href,
+    })
+
+
+def combine_dashboard_svg(indicators_path, bar_path, pie_path, ranking_path,
+                          watermark_text, output_path="images/all_in_one.svg", budget=None, scale=1.0,
+                          logo_mode=SVG_LOGO_MODE):
+    """
+    Combines the 4 panel SVGs into a single SVG dashboard with the watermark and logo.
+
+    Args:
+        indicators_path (str): Path to the indicators SVG.
+        bar_path (str): Path to the bar chart SVG.
+        pie_path (str): Path to the pie chart SVG.
+        ranking_path (str): Path to the ranking SVG.
+        watermark_text (str): Text for the watermark.
+        output_path (str): Path where the final SVG will be saved.
+        budget (http_utils.DeadlineBudget): Shared run budget for the logo download.
+        scale (float): Display scale (see image_utils.dashboard_scale). Only the
+            document's width and height change; the drawing itself is vector.
+        logo_mode (str): "inline" embeds the logo as a data URI, "link" references
+            GITLIGHTS_LOGO_URL (smaller, but some viewers block external images).
+    """
+    root = ET.Element(_svg("svg"), {
+        "width": str(max(1, round(DASHBOARD_WIDTH * scale))),
+        "height": str(max(1, round(DASHBOARD_HEIGHT * scale))),
+        "viewBox": f"0 0 {DASHBOARD_WIDTH} {DASHBOARD_HEIGHT}",
+    })
+    ET.SubElement(root, _svg("rect"), {
+        "x": "0", "y": "0", "width": str(DASHBOARD_WIDTH), "height": str(DASHBOARD_HEIGHT), "fill": "white",
+    })
+
+    # Nest each panel document at its position; panel ids are unique per figure
+    panels = (("indicators", indicators_path), ("bars", bar_path), ("pie", pie_path), ("ranking", ranking_path))
+    for panel, path in panels:
+        x, y = DASHBOARD_PANEL_POSITIONS[panel]
+        panel_svg = ET.parse(path).getroot()
+        panel_svg.set("x", str(x))
+        panel_svg.set("y", str(y))
+        root.append(panel_svg)
+
+    # Watermark in the bottom right corner, anchored by its top-left corner like Pillow's text
+    watermark = ET.SubElement(root, _svg("text"), {
+        "x": str(DASHBOARD_WIDTH - WATERMARK_POSITION_OFFSET_X),
+        "y": str(DASHBOARD_HEIGHT - WATERMARK_POSITION_OFFSET_Y),
+        "dominant-baseline": "hanging",
+        "font-family": "DejaVu Sans, sans-serif",
+        "font-size": str(WATERMARK_FONT_SIZE),
+        "fill": "rgb({}, {}, {})".format(*WATERMARK_TEXT_COLOR),
+    })
+    watermark.text = watermark_text
+
+    # Gitlights logo in the top left corner (optional, skipped when out of time)
+    logo = _logo_element(logo_mode, budget)
+    if logo is not None:
+        root.append(logo)
+
+    ET.ElementTree(root).write(output_path, encoding="utf-8", xml_declaration=True)
+    print(f"Final SVG generated: {output_path}")
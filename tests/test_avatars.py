@@ -0,0 +1,106 @@
+import base64
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from io import BytesIO
+from unittest.mock import patch
+
+from PIL import Image
+
+# Add the parent directory to sys.path to import from the project
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from avatars import NegativeCache, fetch_avatars, placeholder_avatar
+from payload_model import Developer
+
+
+def _dev(name, avatar):
+    return Developer(name, avatar, 1, 0, 0, 0)
+
+
+def _decode(source):
+    return Image.open(BytesIO(base64.b64decode(source.split(",", 1)[1])))
+
+
+class TestAvatars(unittest.TestCase):
+    """Test cases for the avatars.py module."""
+
+    def test_placeholder_avatar(self):
+        """Placeholders are square PNGs, stable for a given name."""
+        source = placeholder_avatar("Jane Doe", size=64)
+        self.assertTrue(source.startswith("data:image/png;base64,"))
+        self.assertEqual(_decode(source).size, (64, 64))
+        self.assertEqual(placeholder_avatar("Jane Doe", size=64), source)
+        self.assertNotEqual(placeholder_avatar("John Roe", size=64), source)
+        self.assertTrue(placeholder_avatar("", size=64).startswith("data:image/png;base64,"))
+
+    def test_negative_cache_ttl(self):
+        """Failed URLs are skipped until their TTL expires."""
+        now = [1000.0]
+        cache = NegativeCache(ttl_seconds=60, clock=lambda: now[0])
+        cache.add("http://a/1.png")
+        self.assertIn("http://a/1.png", cache)
+        self.assertNotIn("http://a/2.png", cache)
+        now[0] += 61
+        self.assertNotIn("http://a/1.png", cache)
+        self.assertEqual(len(cache), 0)
+
+    def test_negative_cache_persists(self):
+        """With a file, live entries carry over to the next cache."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "cache", "avatars.json")
+            now = [1000.0]
+            cache = NegativeCache(path, ttl_seconds=60, clock=lambda: now[0])
+            cache.add("http://a/1.png")
+            cache.save()
+            self.assertIn("http://a/1.png", NegativeCache(path, clock=lambda: now[0]))
+            now[0] += 61
+            self.assertNotIn("http://a/1.png", NegativeCache(path, clock=lambda: now[0]))
+
+    @patch('avatars.encode_image_from_url')
+    def test_fetch_avatars_placeholders_and_negative_cache(self, mock_encode):
+        """Failed or missing avatars get placeholders, and failed URLs are not requested again."""
+        def encode(url, budget, negative_cache, *args):
+            if url.endswith("dead.png"):
+                negative_cache.add(url)
+                return ""
+            return "data:image/png;base64,AAAA"
+        mock_encode.side_effect = encode
+        cache = NegativeCache()
+        devs = [_dev("Ann", "http://a/ok.png"), _dev("Bob", "http://a/dead.png"),
+                _dev("Cid", "http://a/dead.png"), _dev("Dee", "")]
+
+        sources = fetch_avatars(devs, negative_cache=cache)
+        self.assertEqual(sources[0], "data:image/png;base64,AAAA")
+        self.assertEqual(sources[1], placeholder_avatar("Bob"))
+        self.assertEqual(sources[2], placeholder_avatar("Cid"))
+        self.assertEqual(sources[3], placeholder_avatar("Dee"))
+        self.assertEqual(mock_encode.call_count, 2)  # One request per distinct URL
+
+        fetch_avatars(devs, negative_cache=cache)
+        self.assertEqual(mock_encode.call_count, 3)  # The dead URL is skipped
+
+    @patch('avatars.encode_image_from_url')
+    def test_fetch_avatars_deadline(self, mock_encode):
+        """Avatars still pending at the deadline get the placeholder without waiting for them."""
+        release = threading.Event()
+
+        def encode(url, *args):
+            if url.endswith("slow.png"):
+                release.wait(5)
+            return "data:image/png;base64,AAAA"
+        mock_encode.side_effect = encode
+        cache = NegativeCache()
+        try:
+            sources = fetch_avatars([_dev("Ann", "http://a/ok.png"), _dev("Bob", "http://a/slow.png")],
+                                    deadline_seconds=0.2, negative_cache=cache)
+        finally:
+            release.set()
+        self.assertEqual(sources, ["data:image/png;base64,AAAA", placeholder_avatar("Bob")])
+        self.assertIn("http://a/slow.png", cache)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+import os
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch, MagicMock
+
+# Add the parent directory to sys.path to import from the project
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import http_utils
+from cassette import use_cassette, request_key
+from http_utils import request_with_retries
+
+
+class TestCassette(unittest.TestCase):
+    """Test cases for the cassette.py module."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.cassette_dir = os.path.join(self.tmp_dir.name, "cassette")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def _record(self, url, content, params=None, content_type="application/json"):
+        response = MagicMock(status_code=200, content=content, url=url, headers={"Content-Type": content_type})
+        with patch('http_utils.requests.get', return_value=response):
+            with use_cassette(self.cassette_dir, mode="record"):
+                request_with_retries("get", url, params=params)
+
+    def test_request_key_includes_query(self):
+        """Requests differing only in their query get different keys."""
+        self.assertEqual(request_key("get", "http://api/x", {"a": 1}), request_key("GET", "http://api/x?a=1"))
+        self.assertNotEqual(request_key("get", "http://api/x", {"a": 1}), request_key("get", "http://api/x"))
+
+    def test_record_then_replay(self):
+        """Recorded responses are served offline and uploads get a fake image_url."""
+        self._record("http://api.example.com/data", b'{"ok": true}', params={"owner": "octo"})
+        self._record("http://img.example.com/avatar.png", b'\x89PNG', content_type="image/png")
+        self.assertIsNone(http_utils._request_hook)
+
+        with use_cassette(self.cassette_dir, mode="replay") as server:
+            data = request_with_retries("get", "http://api.example.com/data", params={"owner": "octo"})
+            avatar = request_with_retries("get", "http://img.example.com/avatar.png")
+            missing = request_with_retries("get", "http://img.example.com/other.png")
+            upload = request_with_retries("post", "http://backend.example.com/upload",
+                                          files={"image": ("a.png", b"abc", "image/png")})
+
+        self.assertEqual(data.json(), {"ok": True})
+        self.assertEqual(avatar.content, b'\x89PNG')
+        self.assertEqual(avatar.headers["Content-Type"], "image/png")
+        self.assertEqual(missing.status_code, 404)
+        self.assertEqual(upload.status_code, 200)
+        self.assertTrue(upload.json()["image_url"].startswith(server.url))
+        self.assertEqual(len(server.uploads), 1)
+        self.assertIsNone(http_utils._request_hook)
+
+    def test_unknown_mode(self):
+        """Only record and replay are accepted."""
+        with self.assertRaises(ValueError):
+            with use_cassette(self.cassette_dir, mode="rewind"):
+                pass
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+import os
+import sys
+import unittest
+
+import plotly.graph_objects as go
+
+# Add the parent directory to sys.path to import from the project
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from categories import fold_long_tail, reduce_pie_categories, reduce_bar_series
+from fast_charts import build_bar_dict
+
+
+class TestCategories(unittest.TestCase):
+    """Test cases for the categories.py module."""
+
+    def test_fold_below_min_share(self):
+        """Categories below the minimum share are folded into Other, kept ones keep their order."""
+        labels, values = fold_long_tail(["a", "b", "c", "d"], [50, 1, 48, 1], min_share=0.02)
+        self.assertEqual(labels, ["a", "c", "Other"])
+        self.assertEqual(values, [50, 48, 2])
+
+    def test_fold_beyond_top_k(self):
+        """At most `max_categories` categories remain, Other included."""
+        labels, values = fold_long_tail(list("abcdef"), [6, 5, 4, 3, 2, 1], max_categories=3)
+        self.assertEqual(labels, ["a", "b", "Other"])
+        self.assertEqual(values, [6, 5, 10])
+
+    def test_single_small_category_is_not_folded(self):
+        """Replacing one category by Other gains nothing, so it is kept."""
+        labels, values = fold_long_tail(["a", "b", "c"], [90, 9, 1], min_share=0.02)
+        self.assertEqual(labels, ["a", "b", "c"])
+        self.assertEqual(values, [90, 9, 1])
+
+    def test_existing_other_is_merged(self):
+        """A category already named Other absorbs the folded ones."""
+        labels, values = fold_long_tail(["Other", "a", "b"], [5, 90, 1], min_share=0.02)
+        self.assertEqual(labels, ["a", "Other"])
+        self.assertEqual(values, [90, 6])
+
+    def test_reduce_pie_categories(self):
+        """The pie config gets at most `max_slices` slices and integer values."""
+        cfg_pie = {"title": "Balance", "labels": [f"type{i}" for i in range(40)], "values": list(range(40, 0, -1))}
+        reduced = reduce_pie_categories(cfg_pie, max_slices=8, min_share=0.0)
+        self.assertEqual(len(reduced["labels"]), 8)
+        self.assertEqual(reduced["labels"][-1], "Other")
+        self.assertEqual(sum(reduced["values"]), sum(cfg_pie["values"]))
+        self.assertIsInstance(reduced["values"][-1], int)
+        self.assertEqual(len(cfg_pie["labels"]), 40)  # The input is not modified
+        self.assertIs(reduce_pie_categories(reduced, max_slices=8, min_share=0.0), reduced)
+
+    def test_folding_is_opt_in(self):
+        """With the default config, every category is kept as it came."""
+        cfg_pie = {"title": "Balance", "labels": [f"type{i}" for i in range(40)], "values": list(range(40, 0, -1))}
+        self.assertIs(reduce_pie_categories(cfg_pie), cfg_pie)
+        cfg_bar = {"title": "Activity", "months": ["m1"], "commits": [500], "prs": [1], "comments": [1], "reviews": [1]}
+        self.assertIs(reduce_bar_series(cfg_bar), cfg_bar)
+
+    def test_reduce_bar_series(self):
+        """Folded bar series are replaced by a per-period "other" series the builder draws."""
+        cfg_bar = {"title": "Activity", "months": ["m1", "m2"], "commits": [50, 40],
+                   "prs": [20, 10], "comments": [1, 0], "reviews": [0, 1]}
+        reduced = reduce_bar_series(cfg_bar, max_series=None, min_share=0.05)
+        self.assertEqual(reduced["other"], [1, 1])
+        self.assertIsNone(reduced["comments"])
+        self.assertEqual(reduced["commits"], [50, 40])
+
+        fig = go.Figure(build_bar_dict(reduced))
+        self.assertEqual([trace.name for trace in fig.data], ["Commits", "Pull Requests", "Other"])
+        self.assertIs(reduce_bar_series(cfg_bar, max_series=None, min_share=0.0), cfg_bar)
+
+
+if __name__ == '__main__':
+    unittest.main()
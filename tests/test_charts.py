@@ -6,12 +6,15 @@ from unittest.mock import patch, MagicMock
 # Add the parent directory to sys.path to import from the project
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+import numpy as np
+
 from charts import (
     create_indicators_figure,
     create_bar_figure,
     create_pie_figure,
     create_ranking_figure
 )
+from avatars import NegativeCache
 
 
 class TestCharts(unittest.TestCase):
@@ -100,7 +103,25 @@ class TestCharts(unittest.TestCase):
         # Check title
         self.assertEqual(fig.layout.title.text, cfg_pie["title"])
 
-    @patch('charts.encode_image_from_url')
+    def test_bar_and_pie_use_typed_arrays(self):
+        """Bar and pie numeric data reach Plotly as NumPy arrays."""
+        cfg_bar = {
+            "title": "Activity",
+            "months": ["Jan", "Feb"],
+            "commits": [1, 2],
+            "prs": [3, 4],
+            "comments": [5, 6],
+            "reviews": [7, 8]
+        }
+        fig_bar = create_bar_figure(cfg_bar)
+        for trace in fig_bar.data:
+            self.assertIsInstance(trace.y, np.ndarray)
+
+        fig_pie = create_pie_figure({"title": "Pie", "labels": ["a", "b"], "values": [1.5, 2.5]})
+        self.assertIsInstance(fig_pie.data[0].values, np.ndarray)
+
+    @patch('avatars.FAILED_AVATAR_URLS', NegativeCache())
+    @patch('avatars.encode_image_from_url')
     def test_create_ranking_figure(self, mock_encode_image):
         """Test create_ranking_figure function."""
         # Mock the image encoding function
@@ -0,0 +1,111 @@
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+import pandas as pd
+
+# Add the parent directory to sys.path to import from the project
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from event_aggregation import aggregate_event_file, detect_format, relative_delta
+
+END = pd.Timestamp("2025-03-31 12:00", tz="UTC")
+EVENTS = [
+    {"type": "commit", "author": "Ann", "timestamp": "2025-03-31T09:00:00Z", "avatar": "https://a/ann.png"},
+    {"type": "commit", "author": "Ann", "timestamp": "2025-03-30T09:00:00Z"},
+    {"type": "pull_request", "author": "Ann", "timestamp": "2025-03-30T10:00:00Z"},
+    {"type": "commit", "author": "Bob", "timestamp": "2025-03-29T09:00:00Z"},
+    {"type": "review", "author": "Bob", "timestamp": "2025-03-29T11:00:00Z"},
+    {"type": "review", "author": "Cy", "timestamp": "2025-03-28T11:00:00Z"},
+    {"type": "comment", "author": "Cy", "timestamp": "2025-03-28T12:00:00Z"},
+    # Previous window
+    {"type": "commit", "author": "Ann", "timestamp": "2025-02-20T09:00:00Z"},
+    {"type": "comment", "author": "Bob", "timestamp": "2025-02-21T09:00:00Z"},
+    # Outside both windows, unknown type and unparseable timestamp
+    {"type": "commit", "author": "Ann", "timestamp": "2024-01-01T09:00:00Z"},
+    {"type": "star", "author": "Ann", "timestamp": "2025-03-31T09:00:00Z"},
+    {"type": "commit", "author": "Ann", "timestamp": "not a date"},
+]
+
+
+class TestEventAggregation(unittest.TestCase):
+    """Test cases for the event_aggregation.py module."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def _write_jsonl(self, events, name="events.jsonl"):
+        path = os.path.join(self.tmp_dir.name, name)
+        with open(path, "w") as f:
+            for event in events:
+                f.write(json.dumps(event) + "\n")
+        return path
+
+    def test_payload_from_jsonl_in_chunks(self):
+        """Chunked aggregation gives every section, with deltas against the previous window."""
+        path = self._write_jsonl(EVENTS)
+        payload = aggregate_event_file(path, end=END, window_days=30, chunk_rows=3)
+
+        self.assertEqual(payload["indicators"]["values"], [3, 1, 1, 2])
+        self.assertEqual(payload["indicators"]["deltas"], [2.0, 1.0, 0.0, 1.0])
+        bars = payload["bar_chart"]
+        self.assertEqual(len(bars["months"]), 30)
+        self.assertEqual(bars["months"][-1], "2025-03-31")
+        self.assertEqual(bars["commits"][-3:], [1, 1, 1])
+        self.assertEqual(bars["reviews"][-4:], [1, 1, 0, 0])
+        self.assertEqual(dict(zip(payload["pie_chart"]["labels"], payload["pie_chart"]["values"])),
+                         {"Commits": 3, "Pull Requests": 1, "Comments": 1, "Reviews": 2})
+        devs = payload["ranking"]["devs"]
+        self.assertEqual([(d["name"], d["commits"], d["prs"], d["reviews"]) for d in devs],
+                         [("Ann", 2, 1, 0), ("Bob", 1, 0, 1), ("Cy", 0, 0, 1)])
+        self.assertEqual(devs[0]["avatar"], "https://a/ann.png")
+        self.assertEqual(devs[1]["avatar"], "")
+
+    def test_chunk_size_does_not_change_the_result(self):
+        """CSV input with epoch timestamps matches the JSONL result for any chunk size."""
+        frame = pd.DataFrame(EVENTS[:9])
+        frame["timestamp"] = (pd.to_datetime(frame["timestamp"]) - pd.Timestamp(0, tz="UTC")) // pd.Timedelta(seconds=1)
+        path = os.path.join(self.tmp_dir.name, "events.csv")
+        frame.to_csv(path, index=False)
+
+        expected = aggregate_event_file(self._write_jsonl(EVENTS[:9]), end=END)
+        for chunk_rows in (1, 4, 100):
+            self.assertEqual(aggregate_event_file(path, end=END, chunk_rows=chunk_rows), expected)
+
+    def test_category_column_feeds_the_pie_chart(self):
+        """A category column replaces the event type mix in the pie chart."""
+        events = [dict(event, category="Bug fixing") for event in EVENTS[:3]]
+        events.append(dict(EVENTS[3], category="New features"))
+        payload = aggregate_event_file(self._write_jsonl(events), end=END)
+        self.assertEqual(payload["pie_chart"]["labels"], ["Bug fixing", "New features"])
+        self.assertEqual(payload["pie_chart"]["values"], [3, 1])
+
+    def test_no_events_in_window(self):
+        """Files without events in the window still give a complete, empty dashboard."""
+        payload = aggregate_event_file(self._write_jsonl(EVENTS[-3:]), end=END)
+        self.assertEqual(payload["indicators"]["values"], [0, 0, 0, 0])
+        self.assertEqual(payload["ranking"]["devs"], [])
+        self.assertEqual(sum(payload["bar_chart"]["commits"]), 0)
+
+    def test_detect_format(self):
+        """Formats come from the extension, compression suffixes included."""
+        self.assertEqual(detect_format("events.jsonl.gz"), "jsonl")
+        self.assertEqual(detect_format("Events.CSV"), "csv")
+        self.assertEqual(detect_format("events.parquet"), "parquet")
+        with self.assertRaises(ValueError):
+            detect_format("events.xlsx")
+
+    def test_relative_delta(self):
+        """Deltas are fractions of the previous value, growth from zero is +100%."""
+        self.assertEqual(relative_delta(15, 10), 0.5)
+        self.assertEqual(relative_delta(3, 0), 1.0)
+        self.assertEqual(relative_delta(0, 0), 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
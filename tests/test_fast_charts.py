@@ -0,0 +1,131 @@
+import json
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+# Add the parent directory to sys.path to import from the project
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+import plotly.graph_objects as go
+import plotly.io as pio
+from plotly.subplots import make_subplots
+
+from config import PLOTLY_TEMPLATE
+from charts import create_indicators_figure, create_bar_figure, create_pie_figure, create_ranking_figure
+from fast_charts import (
+    build_indicators_dict,
+    build_bar_dict,
+    build_pie_dict,
+    build_ranking_dict
+)
+from payload_model import to_typed_array
+
+
+def _as_json(fig):
+    """Serializes a validated figure so two figures can be compared."""
+    return json.loads(pio.to_json(fig, validate=True))
+
+
+# Figures built by the original make_subplots/update_layout builders of charts.py
+# for the inputs below, serialized with pio.to_json. The Plotly template is left
+# out (it depends on the Plotly version) and checked against config.PLOTLY_TEMPLATE instead.
+with open(os.path.join(os.path.dirname(__file__), "golden_figures.json")) as f:
+    GOLDEN_FIGURES = json.load(f)
+
+GOLDEN_INPUTS = {
+    "indicators": (["Commits", "PRs", "Comments", "Reviews"], [100, 200, 300, 400], [0.05, -0.1, 0.2, -1]),
+    "bar": {"title": "Monthly Activity", "months": ["Jan", "Feb", "Mar"], "commits": [1, 2, 3],
+            "prs": [2, 4, 6], "comments": [3, 6, 9], "reviews": [4, 8, 12]},
+    "pie": {"title": "Balance", "labels": ["a", "b", "c"], "values": [50, 30, 20]},
+}
+
+
+class TestFastCharts(unittest.TestCase):
+    """Test cases for the fast_charts.py module.
+
+    Figure dicts are validated by Plotly here, and only here.
+    """
+
+    def test_to_typed_array(self):
+        """Numeric series are converted to NumPy arrays once."""
+        ints = to_typed_array([1, 2, 3])
+        self.assertIsInstance(ints, np.ndarray)
+        self.assertEqual(ints.dtype.kind, "i")
+
+        with_missing = to_typed_array([1, None, 3])
+        self.assertEqual(with_missing.dtype, np.float64)
+        self.assertTrue(np.isnan(with_missing[1]))
+
+    def assertMatchesGolden(self, name, fig):
+        fig_json = _as_json(fig)
+        template = _as_json(go.Figure(layout={"template": PLOTLY_TEMPLATE}))["layout"]["template"]
+        self.assertEqual(fig_json["layout"].pop("template"), template)
+        self.assertEqual(fig_json, GOLDEN_FIGURES[name])
+
+    def test_fast_dicts_match_reference_figures(self):
+        """The fast figure dicts match the figures of the original validated builders."""
+        self.assertMatchesGolden("indicators", go.Figure(build_indicators_dict(*GOLDEN_INPUTS["indicators"])))
+        self.assertMatchesGolden("bar", go.Figure(build_bar_dict(GOLDEN_INPUTS["bar"])))
+        self.assertMatchesGolden("pie", go.Figure(build_pie_dict(GOLDEN_INPUTS["pie"])))
+
+    def test_validated_builders_match_reference_figures(self):
+        """The charts.py builders still produce the figures of the original builders."""
+        self.assertMatchesGolden("indicators", create_indicators_figure(*GOLDEN_INPUTS["indicators"]))
+        self.assertMatchesGolden("bar", create_bar_figure(GOLDEN_INPUTS["bar"]))
+        self.assertMatchesGolden("pie", create_pie_figure(GOLDEN_INPUTS["pie"]))
+
+    def test_indicators_match_subplot_grid(self):
+        """Indicator domains and titles match a 1x4 make_subplots grid."""
+        titles = ["Commits", "PRs", "Comments", "Reviews"]
+        fig = go.Figure(build_indicators_dict(titles, [100, 200, 300, 400], [0.05, -0.1, 0.2, -1]))
+
+        reference = make_subplots(rows=1, cols=4, subplot_titles=titles,
+                                  specs=[[{"type": "indicator"}] * 4])
+        for i in range(4):
+            reference.add_trace(go.Indicator(value=0), row=1, col=i + 1)
+
+        self.assertEqual([list(t.domain.x) for t in fig.data],
+                         [list(t.domain.x) for t in reference.data])
+        self.assertEqual(_as_json(fig)["layout"]["annotations"],
+                         _as_json(reference)["layout"]["annotations"])
+        self.assertEqual(fig.data[3].delta.reference, 0)
+
+    def test_bar_and_pie_dicts_are_valid(self):
+        """Bar and pie dicts pass Plotly validation and keep the payload data."""
+        cfg_bar = {
+            "title": "Monthly Activity",
+            "months": ["Jan", "Feb", "Mar"],
+            "commits": [10, 20, 30],
+            "prs": [5, 10, 15],
+            "comments": [3, 6, 9],
+            "reviews": [4, 8, 12]
+        }
+        fig_bar = go.Figure(build_bar_dict(cfg_bar))
+        self.assertEqual(fig_bar.layout.title.text, "Monthly Activity")
+        self.assertEqual(fig_bar.layout.barmode, "stack")
+        self.assertEqual(list(fig_bar.data[3].y), cfg_bar["reviews"])
+
+        cfg_pie = {"title": "Balance", "labels": ["a", "b", "c"], "values": [50, 30, 20]}
+        fig_pie = go.Figure(build_pie_dict(cfg_pie))
+        self.assertEqual(fig_pie.layout.title.text, "Balance")
+        self.assertEqual(list(fig_pie.data[0].labels), cfg_pie["labels"])
+
+    @patch('avatars.encode_image_from_url', return_value="data:image/png;base64,AAAA")
+    def test_ranking_matches_validated_path(self, mock_encode):
+        """The ranking dict matches the figure built with add_annotation/add_layout_image."""
+        cfg_rank = {
+            "title": "Top Contributors",
+            "devs": [
+                {"name": f"User {i}", "avatar": f"http://example.com/{i}.png",
+                 "commits": 10 - i, "prs": i, "comments": 2 * i, "reviews": 3}
+                for i in range(5)
+            ]
+        }
+        self.assertEqual(_as_json(go.Figure(build_ranking_dict(cfg_rank))),
+                         _as_json(create_ranking_figure(cfg_rank)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+# Add the parent directory to sys.path to import from the project
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import git_analytics
+from git_analytics import load_commits, build_local_payload, avatar_url
+
+DAY = 86400
+# 2025-03-31 12:00:00 UTC
+NOW = 1743422400
+
+
+class TestGitAnalytics(unittest.TestCase):
+    """Test cases for the git_analytics.py module."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.repo = os.path.join(self.tmp_dir.name, "repo")
+        self.checkpoint_dir = os.path.join(self.tmp_dir.name, "checkpoint")
+        os.makedirs(self.repo)
+        self._git("init", "-q")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def _git(self, *args, env=None):
+        subprocess.run(["git", "-C", self.repo, *args], check=True, capture_output=True,
+                       env=dict(os.environ, **(env or {})))
+
+    def _commit(self, subject, author, days_ago, lines=1):
+        with open(os.path.join(self.repo, "file.txt"), "a") as f:
+            f.write("x\n" * lines)
+        date = f"@{NOW - days_ago * DAY} +0000"
+        self._git("add", "file.txt")
+        self._git("commit", "-q", "-m", subject, env={
+            "GIT_AUTHOR_NAME": author, "GIT_AUTHOR_EMAIL": f"{author.lower()}@example.com",
+            "GIT_COMMITTER_NAME": author, "GIT_COMMITTER_EMAIL": f"{author.lower()}@example.com",
+            "GIT_AUTHOR_DATE": date, "GIT_COMMITTER_DATE": date,
+        })
+
+    def test_payload_from_local_history(self):
+        """Commits are aggregated per day and author, with deltas against the previous window."""
+        self._commit("ancient", "Ann", days_ago=200)
+        self._commit("feat: old work", "Ann", days_ago=45)
+        self._commit("fix: bug (#12)", "Ann", days_ago=3, lines=4)
+        self._commit("feat(ui): button", "Bob", days_ago=1, lines=2)
+        self._commit("update readme", "Ann", days_ago=1)
+
+        commits = load_commits(self.repo, checkpoint_dir=None, window_days=30, now=NOW)
+        payload = build_local_payload(commits, window_days=30, now=NOW)
+
+        self.assertEqual(len(commits), 4)  # The 200 days old commit is outside both windows
+        self.assertEqual(payload["indicators"]["values"], [3, 1, 2, 7])
+        self.assertEqual(payload["indicators"]["deltas"], [2.0, 1.0, 1.0, 6.0])
+        bars = payload["bar_chart"]
+        self.assertEqual(len(bars["months"]), 30)
+        self.assertEqual(bars["months"][-1], "2025-03-31")
+        self.assertEqual(bars["commits"][-2:], [2, 0])
+        self.assertEqual(sum(bars["prs"]), 1)
+        self.assertEqual(dict(zip(payload["pie_chart"]["labels"], payload["pie_chart"]["values"])),
+                         {"feat": 1, "fix": 1, "other": 1})
+        devs = payload["ranking"]["devs"]
+        self.assertEqual([(d["name"], d["commits"], d["prs"]) for d in devs], [("Ann", 2, 1), ("Bob", 1, 0)])
+
+    def test_checkpoint_reads_only_new_commits(self):
+        """A second run only streams the commits added after the checkpoint."""
+        self._commit("first", "Ann", days_ago=2)
+        first = load_commits(self.repo, checkpoint_dir=self.checkpoint_dir, now=NOW)
+        self._commit("second", "Bob", days_ago=1)
+
+        with patch('git_analytics.iter_commits', wraps=git_analytics.iter_commits) as mock_iter:
+            second = load_commits(self.repo, checkpoint_dir=self.checkpoint_dir, now=NOW)
+            revision_range = mock_iter.call_args.args[1]
+            third = load_commits(self.repo, checkpoint_dir=self.checkpoint_dir, now=NOW)
+
+        self.assertEqual(len(first), 1)
+        self.assertTrue(revision_range.endswith("..HEAD"))
+        self.assertEqual(sorted(second["author"]), ["Ann", "Bob"])
+        self.assertEqual(mock_iter.call_count, 1)  # Nothing new on the third run
+        self.assertEqual(len(third), 2)
+
+    def test_avatar_url(self):
+        """GitHub noreply emails map to GitHub avatars, others to Gravatar identicons."""
+        self.assertEqual(avatar_url("123+octo@users.noreply.github.com"),
+                         "https://avatars.githubusercontent.com/u/123?s=80")
+        self.assertIn("gravatar.com/avatar/", avatar_url("Someone@Example.com "))
+
+
+if __name__ == '__main__':
+    unittest.main()
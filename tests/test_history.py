@@ -0,0 +1,83 @@
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+# Add the parent directory to sys.path to import from the project
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from history import load_history, append_record, rolling_stats, detect_regressions, record_run
+from main import DashboardResult
+
+
+def _record(ok=True, **stages):
+    return {"ts": 0, "ok": ok, "stages": stages, "payload": {}, "output_bytes": None}
+
+
+class TestHistory(unittest.TestCase):
+    """Test cases for the history.py module."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.history_path = os.path.join(self.tmp_dir.name, "cache", "history.jsonl")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_append_keeps_latest_records(self):
+        """The history file is trimmed to the latest runs and skips corrupt lines."""
+        for i in range(5):
+            append_record(self.history_path, _record(fetch=i), max_runs=3)
+        with open(self.history_path, "a") as f:
+            f.write('{"truncated": ')
+
+        records = load_history(self.history_path)
+        self.assertEqual([r["stages"]["fetch"] for r in records], [2, 3, 4])
+
+    def test_rolling_stats_ignore_failed_runs(self):
+        """Percentiles only use successful runs within the window."""
+        records = [_record(render=1.0), _record(render=2.0), _record(render=3.0), _record(ok=False, render=50.0)]
+        stats = rolling_stats(records, window=10)
+        self.assertEqual(stats["render"], {"p50": 2.0, "p95": 2.9, "runs": 3})
+        self.assertEqual(rolling_stats(records, window=1)["render"]["runs"], 1)
+
+    def test_detect_regressions(self):
+        """Only stages well above their median, with enough history, are flagged."""
+        stats = {
+            "render": {"p50": 1.0, "p95": 1.2, "runs": 10},
+            "fetch": {"p50": 0.01, "p95": 0.02, "runs": 10},
+            "combine": {"p50": 0.5, "p95": 0.6, "runs": 2},
+        }
+        record = _record(render=2.0, fetch=0.05, combine=5.0)
+        regressions = detect_regressions(record, stats, threshold=0.5, min_runs=5, min_ms=100)
+        self.assertEqual(regressions, [("render", 2.0, 1.0, 2.0)])
+        self.assertEqual(detect_regressions(record, stats, threshold=1.5, min_runs=5, min_ms=100), [])
+
+    def test_record_run_writes_summary_and_history(self):
+        """A regressed run is reported in the step summary and appended to the history."""
+        for _ in range(5):
+            append_record(self.history_path, _record(render=1.0))
+        output_path = os.path.join(self.tmp_dir.name, "dashboard.png")
+        with open(output_path, "wb") as f:
+            f.write(b"x" * 10)
+        result = DashboardResult(output_path, success=True, timings={"render": 3.0},
+                                 payload_size={"devs": 3, "months": 12, "pie_slices": 4}, peak_rss_mb=512.34)
+        summary_path = os.path.join(self.tmp_dir.name, "summary.md")
+
+        regressions = record_run(self.history_path, result, summary_path=summary_path)
+
+        self.assertEqual([stage for stage, _, _, _ in regressions], ["render"])
+        with open(summary_path) as f:
+            summary = f.read()
+        self.assertIn("⚠️ regression", summary)
+        self.assertIn("Peak RSS: 512 MB", summary)
+        with open(self.history_path) as f:
+            last = json.loads(f.read().splitlines()[-1])
+        self.assertEqual(last["payload"], {"devs": 3, "months": 12, "pie_slices": 4})
+        self.assertEqual(last["output_bytes"], 10)
+        self.assertEqual(last["peak_rss_mb"], 512.3)
+
+
+if __name__ == '__main__':
+    unittest.main()
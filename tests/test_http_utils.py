@@ -0,0 +1,154 @@
+import os
+import sys
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch, MagicMock, ANY
+
+# Add the parent directory to sys.path to import from the project
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import requests
+
+from http_utils import DeadlineBudget, BudgetExhausted, backoff_delay, request_with_retries, coalesced_get, SHARED_GETS
+
+
+def _response(status_code):
+    response = MagicMock()
+    response.status_code = status_code
+    return response
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestHttpUtils(unittest.TestCase):
+    """Test cases for the http_utils.py module."""
+
+    def test_budget_remaining(self):
+        """The budget shrinks with the clock and never goes negative."""
+        clock = FakeClock()
+        budget = DeadlineBudget(10, clock=clock)
+        self.assertEqual(budget.remaining(), 10)
+        clock.now = 7
+        self.assertEqual(budget.remaining(), 3)
+        self.assertTrue(budget.nearly_exhausted(5))
+        clock.now = 20
+        self.assertEqual(budget.remaining(), 0)
+        self.assertEqual(DeadlineBudget().remaining(), float("inf"))
+
+    def test_backoff_delay_is_capped(self):
+        """Backoff grows exponentially but never exceeds the cap."""
+        for attempt in range(10):
+            delay = backoff_delay(attempt, base=0.5, cap=4)
+            self.assertGreaterEqual(delay, 0)
+            self.assertLessEqual(delay, min(4, 0.5 * 2 ** attempt))
+
+    @patch('http_utils.time.sleep')
+    @patch('http_utils.requests.get')
+    def test_get_retries_transient_errors(self, mock_get, mock_sleep):
+        """GET requests are retried on 502 and connection errors."""
+        mock_get.side_effect = [_response(502), requests.exceptions.ConnectionError("reset"), _response(200)]
+        budget = DeadlineBudget(60)
+
+        response = request_with_retries("get", "http://example.com", budget=budget, retries=3)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(mock_get.call_count, 3)
+        self.assertEqual(budget.requests, 3)
+        self.assertEqual(budget.retries, 2)
+        for call in mock_get.call_args_list:
+            self.assertLessEqual(call.kwargs["timeout"], 60)
+
+    @patch('http_utils.time.sleep')
+    @patch('http_utils.requests.get')
+    def test_last_response_returned_when_retries_run_out(self, mock_get, mock_sleep):
+        """The final 5xx response is returned for the caller to handle."""
+        mock_get.return_value = _response(503)
+        response = request_with_retries("get", "http://example.com", retries=2)
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(mock_get.call_count, 3)
+
+    @patch('http_utils.requests.post')
+    def test_post_is_not_retried(self, mock_post):
+        """Non-idempotent requests get a single attempt."""
+        mock_post.side_effect = requests.exceptions.ConnectionError("reset")
+        with self.assertRaises(requests.exceptions.ConnectionError):
+            request_with_retries("post", "http://example.com", retries=3)
+        self.assertEqual(mock_post.call_count, 1)
+
+    @patch('http_utils.requests.get')
+    def test_exhausted_budget_raises(self, mock_get):
+        """No request is sent once the budget is spent."""
+        clock = FakeClock()
+        budget = DeadlineBudget(5, clock=clock)
+        clock.now = 5
+        with self.assertRaises(BudgetExhausted):
+            request_with_retries("get", "http://example.com", budget=budget)
+        mock_get.assert_not_called()
+
+    @patch('http_utils.requests.get')
+    def test_timeout_is_bounded_by_budget(self, mock_get):
+        """Each attempt's timeout is the smaller of the cap and the remaining budget."""
+        mock_get.return_value = _response(200)
+        clock = FakeClock()
+        budget = DeadlineBudget(10, clock=clock)
+        clock.now = 8
+        request_with_retries("get", "http://example.com", budget=budget, timeout=30)
+        self.assertEqual(mock_get.call_args.kwargs["timeout"], 2)
+
+    @patch('http_utils.requests.get')
+    def test_coalesced_get_shares_in_flight_requests(self, mock_get):
+        """Concurrent GETs of one URL send a single request and share its response."""
+        release = threading.Event()
+        response = _response(200)
+
+        def get(url, timeout):
+            release.wait(5)
+            return response
+        mock_get.side_effect = get
+
+        coalesced_before = SHARED_GETS.coalesced
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            futures = [executor.submit(coalesced_get, "http://example.com/logo.png") for _ in range(6)]
+            for _ in range(500):
+                if SHARED_GETS.coalesced - coalesced_before == 5:
+                    break
+                threading.Event().wait(0.01)
+            release.set()
+            results = [future.result() for future in futures]
+
+        mock_get.assert_called_once_with("http://example.com/logo.png", timeout=ANY)
+        self.assertTrue(all(result is response for result in results))
+
+
+    @patch('http_utils.requests.get')
+    def test_coalesced_get_waits_within_budget(self, mock_get):
+        """A caller waiting on a shared request gives up when its own budget runs out."""
+        release, started = threading.Event(), threading.Event()
+
+        def get(url, timeout):
+            started.set()
+            release.wait(5)
+            return _response(200)
+        mock_get.side_effect = get
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            leader = executor.submit(coalesced_get, "http://example.com/hung.png")
+            self.assertTrue(started.wait(5))
+            with self.assertRaises(BudgetExhausted):
+                coalesced_get("http://example.com/hung.png", budget=DeadlineBudget(0.05))
+            release.set()
+            self.assertEqual(leader.result().status_code, 200)
+        mock_get.assert_called_once()
+
+
+if __name__ == '__main__':
+    unittest.main()
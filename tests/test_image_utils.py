@@ -1,18 +1,26 @@
 import os
 import sys
 import unittest
-from unittest.mock import patch, MagicMock, mock_open
+from unittest.mock import patch, MagicMock, mock_open, ANY
 
 # Add the parent directory to sys.path to import from the project
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from image_utils import encode_image_from_url, combine_dashboard_images
+import tempfile
+
+from PIL import Image
+
+from image_utils import (
+    encode_image_from_url, combine_dashboard_images, dashboard_scale, parse_dashboard_variants,
+    dashboard_variant_path
+)
+from avatars import NegativeCache
 
 
 class TestImageUtils(unittest.TestCase):
     """Test cases for the image_utils.py module."""
 
-    @patch('image_utils.requests.get')
+    @patch('http_utils.requests.get')
     def test_encode_image_from_url_success(self, mock_get):
         """Test encode_image_from_url with successful image retrieval."""
         # Mock response with binary content
@@ -26,9 +34,9 @@ class TestImageUtils(unittest.TestCase):
         
         # Assertions
         self.assertTrue(result.startswith('data:image/png;base64,'))
-        mock_get.assert_called_once_with("http://example.com/image.png")
+        mock_get.assert_called_once_with("http://example.com/image.png", timeout=ANY)
 
-    @patch('image_utils.requests.get')
+    @patch('http_utils.requests.get')
     def test_encode_image_from_url_failure(self, mock_get):
         """Test encode_image_from_url when image retrieval fails."""
         # Mock response to raise an exception
@@ -39,12 +47,35 @@ class TestImageUtils(unittest.TestCase):
         
         # Assertions
         self.assertEqual(result, "")
-        mock_get.assert_called_once_with("http://example.com/nonexistent.png")
+        mock_get.assert_called_once_with("http://example.com/nonexistent.png", timeout=ANY)
+
+    @patch('http_utils.requests.get')
+    def test_encode_image_from_url_negative_cache(self, mock_get):
+        """A failing URL is added to the negative cache and not requested again."""
+        mock_get.side_effect = Exception("Failed to download image")
+        negative_cache = NegativeCache()
+
+        self.assertEqual(encode_image_from_url("http://example.com/dead.png", negative_cache=negative_cache), "")
+        self.assertEqual(encode_image_from_url("http://example.com/dead.png", negative_cache=negative_cache), "")
+
+        self.assertIn("http://example.com/dead.png", negative_cache)
+        mock_get.assert_called_once()
+
+    @patch('http_utils.requests.get')
+    def test_encode_image_from_url_skipped_near_deadline(self, mock_get):
+        """Avatars are skipped when the run budget is nearly used up."""
+        budget = MagicMock()
+        budget.nearly_exhausted.return_value = True
+
+        result = encode_image_from_url("http://example.com/image.png", budget=budget)
+
+        self.assertEqual(result, "")
+        mock_get.assert_not_called()
 
     @patch('image_utils.Image.new')
     @patch('image_utils.ImageDraw.Draw')
     @patch('image_utils.ImageFont.truetype')
-    @patch('image_utils.requests.get')
+    @patch('http_utils.requests.get')
     def test_combine_dashboard_images(self, mock_get, mock_truetype, mock_draw, mock_image_new):
         """Test combine_dashboard_images function."""
         # Mock PIL Image and Draw objects
@@ -111,7 +142,7 @@ class TestImageUtils(unittest.TestCase):
     @patch('image_utils.Image.open')
     @patch('image_utils.ImageDraw.Draw')
     @patch('image_utils.ImageFont.truetype')
-    @patch('image_utils.requests.get')
+    @patch('http_utils.requests.get')
     def test_combine_dashboard_images_font_exception(self, mock_get, mock_truetype, 
                                                   mock_draw, mock_image_open, mock_image_new):
         """Test combine_dashboard_images when font loading fails."""
@@ -163,7 +194,7 @@ class TestImageUtils(unittest.TestCase):
     @patch('image_utils.Image.open')
     @patch('image_utils.ImageDraw.Draw')
     @patch('image_utils.ImageFont.truetype')
-    @patch('image_utils.requests.get')
+    @patch('http_utils.requests.get')
     def test_combine_dashboard_images_logo_exception(self, mock_get, mock_truetype, 
                                                   mock_draw, mock_image_open, mock_image_new):
         """Test combine_dashboard_images when logo retrieval fails."""
@@ -200,5 +231,87 @@ class TestImageUtils(unittest.TestCase):
         mock_dashboard.save.assert_called_once_with("test_output.png")
 
 
+    def test_dashboard_scale(self):
+        """The scale maps the full dashboard width to the target width."""
+        self.assertEqual(dashboard_scale(None), 1.0)
+        self.assertEqual(dashboard_scale(1200), 0.5)
+        with self.assertRaises(ValueError):
+            dashboard_scale(-10)
+
+    @patch('http_utils.requests.get')
+    def test_combine_dashboard_images_scaled(self, mock_get):
+        """Panels rendered at half scale are composited into a half size canvas."""
+        mock_get.side_effect = Exception("no network")
+        colors = {"indicators": "red", "bars": "green", "pie": "blue", "ranking": "yellow"}
+        sizes = {"indicators": (1200, 150), "bars": (1200, 400), "pie": (600, 400), "ranking": (600, 400)}
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            paths = {}
+            for panel, size in sizes.items():
+                paths[panel] = os.path.join(tmp_dir, f"{panel}.png")
+                Image.new("RGB", size, color=colors[panel]).save(paths[panel])
+            output_path = os.path.join(tmp_dir, "dashboard.png")
+
+            combine_dashboard_images(
+                indicators_path=paths["indicators"],
+                bar_path=paths["bars"],
+                pie_path=paths["pie"],
+                ranking_path=paths["ranking"],
+                watermark_text="",
+                output_path=output_path,
+                scale=0.5
+            )
+
+            with Image.open(output_path) as result:
+                self.assertEqual(result.size, (1200, 950))
+                self.assertEqual(result.getpixel((10, 10)), (255, 0, 0))
+                self.assertEqual(result.getpixel((10, 200)), (0, 128, 0))
+                self.assertEqual(result.getpixel((10, 600)), (0, 0, 255))
+                self.assertEqual(result.getpixel((700, 600)), (255, 255, 0))
+
+    def test_parse_dashboard_variants(self):
+        """Variant specs are parsed into name -> width."""
+        self.assertEqual(parse_dashboard_variants("readme:1000, social:1280"), {"readme": 1000, "social": 1280})
+        self.assertEqual(parse_dashboard_variants(""), {})
+        with self.assertRaises(ValueError):
+            parse_dashboard_variants("readme")
+        with self.assertRaises(ValueError):
+            parse_dashboard_variants("readme:0")
+
+    @patch('http_utils.requests.get')
+    def test_combine_dashboard_images_variants(self, mock_get):
+        """Variants are downscaled from the composited canvas and saved next to the output."""
+        mock_get.side_effect = Exception("no network")
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            paths = {}
+            for panel in ("indicators", "bars", "pie", "ranking"):
+                paths[panel] = os.path.join(tmp_dir, f"{panel}.png")
+                Image.new("RGB", (10, 10), color="red").save(paths[panel])
+            output_path = os.path.join(tmp_dir, "dashboard.png")
+
+            variant_paths = combine_dashboard_images(
+                indicators_path=paths["indicators"],
+                bar_path=paths["bars"],
+                pie_path=paths["pie"],
+                ranking_path=paths["ranking"],
+                watermark_text="",
+                output_path=output_path,
+                variants={"readme": 1200, "social": 600, "huge": 4800}
+            )
+
+            self.assertEqual(variant_paths, {
+                "readme": os.path.join(tmp_dir, "dashboard_readme.png"),
+                "social": os.path.join(tmp_dir, "dashboard_social.png"),
+            })
+            self.assertEqual(dashboard_variant_path(output_path, "readme"), variant_paths["readme"])
+            with Image.open(output_path) as full:
+                self.assertEqual(full.size, (2400, 1900))
+            with Image.open(variant_paths["readme"]) as readme:
+                self.assertEqual(readme.size, (1200, 950))
+            with Image.open(variant_paths["social"]) as social:
+                self.assertEqual(social.size, (600, 475))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,60 @@
+import os
+import sys
+import unittest
+from unittest.mock import patch, MagicMock
+
+# Add the parent directory to sys.path to import from the project
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import requests
+
+import json_utils
+from json_utils import resolve_json_engine, loads, parse_response_json
+
+
+class TestJsonUtils(unittest.TestCase):
+    """Test cases for the json_utils.py module."""
+
+    def test_resolve_json_engine_stdlib(self):
+        """The stdlib engine is always available."""
+        self.assertEqual(resolve_json_engine("json"), "json")
+
+    def test_resolve_json_engine_fallback(self):
+        """auto and orjson fall back to the stdlib when orjson is missing."""
+        with patch.object(json_utils, 'orjson', None):
+            self.assertEqual(resolve_json_engine("auto"), "json")
+            self.assertEqual(resolve_json_engine("orjson"), "json")
+
+    def test_resolve_json_engine_unknown(self):
+        """Unknown engine names are treated as auto."""
+        self.assertIn(resolve_json_engine("simdjson"), ("orjson", "json"))
+
+    def test_loads_engines(self):
+        """Both engines decode bytes and text."""
+        for engine in ("json", resolve_json_engine("orjson")):
+            self.assertEqual(loads(b'{"a": [1, 2]}', engine), {"a": [1, 2]})
+            self.assertEqual(loads('{"a": [1, 2]}', engine), {"a": [1, 2]})
+
+    def test_parse_response_json_stdlib(self):
+        """The stdlib engine delegates to response.json()."""
+        mock_response = MagicMock()
+        mock_response.json.return_value = {"ok": True}
+
+        self.assertEqual(parse_response_json(mock_response, "json"), {"ok": True})
+        mock_response.json.assert_called_once()
+
+    @unittest.skipIf(json_utils.orjson is None, "orjson not installed")
+    def test_parse_response_json_orjson(self):
+        """orjson parses the raw body and reports errors as requests JSONDecodeError."""
+        mock_response = MagicMock()
+        mock_response.content = b'{"ok": true}'
+        self.assertEqual(parse_response_json(mock_response, "orjson"), {"ok": True})
+        mock_response.json.assert_not_called()
+
+        mock_response.content = b'not json'
+        with self.assertRaises(requests.exceptions.JSONDecodeError):
+            parse_response_json(mock_response, "orjson")
+
+
+if __name__ == '__main__':
+    unittest.main()
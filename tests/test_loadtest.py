@@ -0,0 +1,54 @@
+import os
+import sys
+import tempfile
+import unittest
+
+# Add the parent directory to sys.path to import from the project
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from cassette import use_cassette
+from config import API_URL, GITLIGHTS_LOGO_URL
+from http_utils import request_with_retries
+from loadtest import (
+    synthetic_payload, write_stub_cassette, format_report, LOADTEST_OWNER, LOADTEST_REPO
+)
+
+
+class TestLoadTest(unittest.TestCase):
+    """Test cases for the loadtest.py module."""
+
+    def test_synthetic_payload_size(self):
+        """The payload has the requested number of developers and months."""
+        payload = synthetic_payload(devs=25, months=36)
+        self.assertEqual(len(payload["ranking"]["devs"]), 25)
+        self.assertEqual(len(payload["bar_chart"]["months"]), 36)
+        self.assertEqual(len(payload["bar_chart"]["reviews"]), 36)
+
+    def test_stub_cassette_serves_dashboard_requests(self):
+        """The stub server answers the requests generate_dashboard sends."""
+        payload = synthetic_payload(devs=2, months=3)
+        with tempfile.TemporaryDirectory() as cassette_dir:
+            write_stub_cassette(cassette_dir, payload)
+            with use_cassette(cassette_dir, mode="replay"):
+                params = {"owner": LOADTEST_OWNER, "repo": LOADTEST_REPO, "run_id": None}
+                data = request_with_retries("get", API_URL, params=params)
+                avatar = request_with_retries("get", payload["ranking"]["devs"][1]["avatar"])
+                logo = request_with_retries("get", GITLIGHTS_LOGO_URL)
+
+        self.assertEqual(data.json(), payload)
+        self.assertEqual(avatar.headers["Content-Type"], "image/png")
+        self.assertEqual(logo.status_code, 200)
+
+    def test_format_report(self):
+        """The report has a header and one line per level."""
+        level = {"concurrency": 2, "runs": 8, "failures": 0, "per_minute": 30.0, "p50": 3.1,
+                 "p95": 4.2, "p99": 4.5, "peak_rss_mb": 900.0, "dashboard_peak_rss_mb": 480.0, "cpu_percent": 95.0}
+        lines = format_report([level]).splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertIn("dash/min", lines[0])
+        self.assertIn("30.0", lines[1])
+        self.assertIn("480", lines[1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,3 +1,4 @@
+import json
 import os
 import sys
 import unittest
@@ -6,7 +7,7 @@ from unittest.mock import patch, MagicMock, mock_open
 # Add the parent directory to sys.path to import from the project
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from main import generate_dashboard, main
+from main import generate_dashboard, main, DashboardResult
 
 
 class TestMain(unittest.TestCase):
@@ -35,7 +36,7 @@ class TestMain(unittest.TestCase):
         
         # Setup mock response based on provided sample
         mock_get_response = MagicMock()
-        mock_get_response.json.return_value = {
+        mock_get_response.json.return_value = payload = {
             "indicators": {
                 "titles": ["Commits", "PRs", "Comments", "Reviews"],
                 "values": [165, 54, 14, 53],
@@ -67,6 +68,7 @@ class TestMain(unittest.TestCase):
             },
             "watermark_text": "Powered by Gitlights"
         }
+        mock_get_response.content = json.dumps(payload).encode("utf-8")
         mock_get_response.raise_for_status.return_value = None
         mock_get.return_value = mock_get_response
         
@@ -92,7 +94,8 @@ class TestMain(unittest.TestCase):
                 actions_runtime_token="test_token",
                 owner="test_owner",
                 repo="test_repo",
-                output_path=output_path
+                output_path=output_path,
+                fast_figures=False  # Validated figures, built by the charts.py functions patched above
             )
             
             # Assertions
@@ -106,12 +109,17 @@ class TestMain(unittest.TestCase):
             mock_rank.assert_called_once()
             mock_combine.assert_called_once()
             
-            # Verify image files were created (note: they're created in the root images/ directory, not tests/images/)
-            self.assertTrue(os.path.exists("images/indicators.png"))
-            self.assertTrue(os.path.exists("images/bars.png"))
-            self.assertTrue(os.path.exists("images/pie.png"))
-            self.assertTrue(os.path.exists("images/ranking.png"))
+            # The results are returned as a value instead of process-wide state
+            self.assertEqual(result.output_path, output_path)
+            self.assertEqual(result.image_url, "https://example.com/image.png")
+            self.assertIn("render_bars", result.timings)
+            self.assertNotIn("DASHBOARD_IMAGE_URL", os.environ)
             self.assertTrue(os.path.exists(output_path))
+
+            # Panel images were rendered to a private workspace, removed after the run
+            indicators_path = mock_combine.call_args.kwargs["indicators_path"]
+            self.assertNotEqual(os.path.dirname(indicators_path), "images")
+            self.assertFalse(os.path.exists(os.path.dirname(indicators_path)))
             
             print(f"\nImages generated in {self.test_img_dir}/")
             
@@ -135,6 +143,24 @@ class TestMain(unittest.TestCase):
         # Assertions
         self.assertFalse(result)
 
+    @patch('main.requests.get')
+    def test_generate_dashboard_invalid_payload(self, mock_get):
+        """A malformed payload fails the run before any figure is built."""
+        mock_response = MagicMock()
+        mock_response.content = json.dumps({"indicators": {"titles": ["A"], "values": [1], "deltas": [0]}}).encode("utf-8")
+        mock_response.raise_for_status.return_value = None
+        mock_get.return_value = mock_response
+
+        with patch('main.build_indicators_dict') as mock_build, \
+             patch('main.create_indicators_figure') as mock_create:
+            result = generate_dashboard(owner="test_owner", repo="test_repo", warm_up=False)
+
+        self.assertFalse(result)
+        self.assertIn("$.indicators.values", result.error)
+        self.assertIn("$.bar_chart: missing", result.error)
+        mock_build.assert_not_called()
+        mock_create.assert_not_called()
+
     @patch('main.requests.get')
     def test_generate_dashboard_json_decode_error(self, mock_get):
         """Test dashboard generation when JSON decoding fails."""
@@ -142,6 +168,7 @@ class TestMain(unittest.TestCase):
         from requests.exceptions import JSONDecodeError
         mock_response = MagicMock()
         mock_response.json.side_effect = JSONDecodeError("JSON Decode Error", "", 0)
+        mock_response.content = b"not json"
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
         
@@ -160,14 +187,21 @@ class TestMain(unittest.TestCase):
     def test_main_success(self, mock_exit, mock_generate_dashboard):
         """Test main function with successful dashboard generation."""
         # Setup mock
-        mock_generate_dashboard.return_value = True
+        mock_generate_dashboard.return_value = DashboardResult(
+            "test_output.png", success=True, image_url="https://example.com/image.png",
+            variant_paths={"readme": "test_output_readme.png", "social": "test_output_social.png"}
+        )
+        github_output = os.path.join(self.test_img_dir, "github_output.txt")
+        if os.path.exists(github_output):
+            os.remove(github_output)
         
         # Setup environment variables
         with patch.dict(os.environ, {
             'GITHUB_TOKEN': 'test_token',
             'OWNER': 'test_owner',
             'REPO': 'test_repo',
-            'OUTPUT_PATH': 'test_output.png'
+            'OUTPUT_PATH': 'test_output.png',
+            'GITHUB_OUTPUT': github_output
         }):
             # Call main function
             main()
@@ -177,12 +211,45 @@ class TestMain(unittest.TestCase):
             mock_generate_dashboard.assert_called_once()
             mock_exit.assert_not_called()
 
+        # main() publishes the returned results as action outputs
+        with open(github_output) as f:
+            outputs = f.read().splitlines()
+        os.remove(github_output)
+        self.assertEqual(outputs, [
+            "dashboard_image=test_output.png",
+            'dashboard_variants={"readme": "test_output_readme.png", "social": "test_output_social.png"}',
+            "dashboard_image_readme=test_output_readme.png",
+            "image_url=https://example.com/image.png",
+        ])
+
+    @patch('main.generate_dashboard')
+    @patch('main.sys.exit')
+    def test_main_builds_fast_figures_by_default(self, mock_exit, mock_generate_dashboard):
+        """Figures skip Plotly's validators unless the fast_figures input is false."""
+        mock_generate_dashboard.return_value = DashboardResult("test_output.png", success=True)
+        with patch.dict(os.environ, {'GITHUB_OUTPUT': os.devnull}):
+            main()
+            self.assertTrue(mock_generate_dashboard.call_args.kwargs["fast_figures"])
+            with patch.dict(os.environ, {'INPUT_FAST_FIGURES': 'false'}):
+                main()
+            self.assertFalse(mock_generate_dashboard.call_args.kwargs["fast_figures"])
+
+    @patch('main.generate_dashboard')
+    @patch('main.sys.exit')
+    def test_main_memory_ceiling_input(self, mock_exit, mock_generate_dashboard):
+        """The memory_ceiling_mb input configures the memory gate of the generation."""
+        mock_generate_dashboard.return_value = DashboardResult("test_output.png", success=True)
+        with patch.dict(os.environ, {'INPUT_MEMORY_CEILING_MB': '2048', 'GITHUB_OUTPUT': os.devnull}):
+            main()
+        gate = mock_generate_dashboard.call_args.kwargs["memory_gate"]
+        self.assertEqual(gate.ceiling_mb, 2048)
+
     @patch('main.generate_dashboard')
     @patch('main.sys.exit')
     def test_main_failure(self, mock_exit, mock_generate_dashboard):
         """Test main function with failed dashboard generation."""
         # Setup mock
-        mock_generate_dashboard.return_value = False
+        mock_generate_dashboard.return_value = DashboardResult("test_output.png", error="Request error")
         
         # Setup environment variables
         with patch.dict(os.environ, {
@@ -203,7 +270,7 @@ class TestMain(unittest.TestCase):
         with patch('main.requests.get') as mock_get:
             # Setup mock response for the initial API call
             mock_response_get = MagicMock()
-            mock_response_get.json.return_value = {
+            mock_response_get.json.return_value = payload = {
                 "indicators": {
                     "titles": ["Commits", "PRs", "Comments", "Reviews"],
                     "values": [165, 54, 14, 53],
@@ -231,6 +298,7 @@ class TestMain(unittest.TestCase):
                 },
                 "watermark_text": "Powered by GitLights"
             }
+            mock_response_get.content = json.dumps(payload).encode("utf-8")
             mock_response_get.raise_for_status.return_value = None
             mock_get.return_value = mock_response_get
             
@@ -0,0 +1,58 @@
+import os
+import sys
+import threading
+import time
+import unittest
+
+# Add the parent directory to sys.path to import from the project
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from memory_gate import MemoryGate
+
+
+class TestMemoryGate(unittest.TestCase):
+    """Test cases for the memory_gate.py module."""
+
+    def _run_parallel(self, gate, count):
+        running, peak = [0], [0]
+        lock = threading.Lock()
+
+        def generation():
+            with gate.admit():
+                with lock:
+                    running[0] += 1
+                    peak[0] = max(peak[0], running[0])
+                time.sleep(0.05)
+                with lock:
+                    running[0] -= 1
+
+        threads = [threading.Thread(target=generation) for _ in range(count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return peak[0]
+
+    def test_ceiling_limits_parallel_generations(self):
+        """Only the generations whose estimates fit under the ceiling run together."""
+        gate = MemoryGate(ceiling_mb=1000, estimate_mb=400)
+        self.assertEqual(self._run_parallel(gate, 6), 2)
+        self.assertEqual(gate.max_parallel(), 2)
+        self.assertEqual(gate.reserved_mb, 0)
+        self.assertGreater(gate.waits, 0)
+
+    def test_first_generation_is_always_admitted(self):
+        """A ceiling below one estimate serializes generations instead of blocking them."""
+        gate = MemoryGate(ceiling_mb=100, estimate_mb=400)
+        self.assertEqual(self._run_parallel(gate, 3), 1)
+        self.assertEqual(gate.max_parallel(), 1)
+
+    def test_no_ceiling(self):
+        """Without a ceiling every generation is admitted at once."""
+        gate = MemoryGate(ceiling_mb=None)
+        self.assertEqual(self._run_parallel(gate, 4), 4)
+        self.assertIsNone(gate.max_parallel())
+
+
+if __name__ == '__main__':
+    unittest.main()
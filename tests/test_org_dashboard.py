@@ -0,0 +1,138 @@
+import json
+import os
+import sys
+import unittest
+from unittest.mock import patch, MagicMock
+
+# Add the parent directory to sys.path to import from the project
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from org_dashboard import merge_payloads, fetch_org_payloads, parse_repo_list
+
+
+def _payload(months, commits, devs, values, deltas, pie):
+    return {
+        "indicators": {"titles": ["Commits", "PRs"], "values": values, "deltas": deltas},
+        "bar_chart": {"title": "Activity", "months": months, "commits": commits,
+                      "prs": [1] * len(months), "comments": [0] * len(months), "reviews": [0] * len(months)},
+        "pie_chart": {"title": "Balance", "labels": list(pie), "values": list(pie.values())},
+        "ranking": {"title": "Top", "devs": [
+            {"name": name, "avatar": f"http://a/{name}.png", "commits": c, "prs": p, "comments": 0, "reviews": 0}
+            for name, c, p in devs
+        ]},
+        "watermark_text": "Powered by Gitlights",
+    }
+
+
+API = _payload(["2025-01", "2025-02"], [10, 20], [("Ann", 20, 5), ("Bob", 10, 1)],
+               values=[30, 2], deltas=[0.5, 0.0], pie={"testing": 3, "refactoring": 1})
+WEB = _payload(["2025-02", "2025-03"], [5, 7], [("Bob", 15, 2), ("Cy", 4, 9)],
+               values=[12, 2], deltas=[-0.25, 1.0], pie={"refactoring": 4})
+
+# The data API serves the four indicators the dashboard draws
+FETCHED = dict(API, indicators={"titles": ["Commits", "PRs", "Comments", "Reviews"],
+                                "values": [30, 2, 0, 0], "deltas": [0.5, 0.0, 0.0, 0.0]})
+
+
+class TestOrgDashboard(unittest.TestCase):
+    """Test cases for the org_dashboard.py module."""
+
+    def test_merge_aligns_months_and_recomputes_deltas(self):
+        """Series are aligned by month and deltas come from the summed previous values."""
+        merged = merge_payloads([API, WEB])
+
+        bars = merged["bar_chart"]
+        self.assertEqual(bars["months"], ["2025-01", "2025-02", "2025-03"])
+        self.assertEqual(bars["commits"], [10, 25, 7])
+        self.assertEqual(bars["prs"], [1, 2, 1])
+        # Previous commits: 30 / 1.5 + 12 / 0.75 = 36; PRs: 2 + 1 = 3
+        self.assertEqual(merged["indicators"]["values"], [42, 4])
+        self.assertEqual(merged["indicators"]["deltas"], [0.167, 0.333])
+        self.assertEqual(merged["pie_chart"]["labels"], ["refactoring", "testing"])
+        self.assertEqual(merged["pie_chart"]["values"], [5, 3])
+
+    def test_merge_ranking_sums_developers_and_keeps_top_n(self):
+        """Developers present in several repositories are summed before picking the top N."""
+        merged = merge_payloads([API, WEB], top_devs=2)
+        devs = merged["ranking"]["devs"]
+        self.assertEqual([(d["name"], d["commits"], d["prs"]) for d in devs], [("Bob", 25, 3), ("Ann", 20, 5)])
+        self.assertEqual(devs[0]["avatar"], "http://a/Bob.png")
+        json.dumps(merged)  # Plain Python types only
+
+    def test_merge_single_payload_is_unchanged(self):
+        """Merging one payload keeps its values."""
+        merged = merge_payloads([API])
+        self.assertEqual(merged["indicators"]["values"], API["indicators"]["values"])
+        self.assertEqual(merged["indicators"]["deltas"], API["indicators"]["deltas"])
+        self.assertEqual(merged["bar_chart"]["commits"], API["bar_chart"]["commits"])
+
+    def test_merge_bar_chart_with_missing_points(self):
+        """A None point in a series counts as 0 instead of corrupting the merged series."""
+        web = dict(WEB, bar_chart=dict(WEB["bar_chart"], commits=[None, 7]))
+        merged = merge_payloads([API, web])
+        self.assertEqual(merged["bar_chart"]["commits"], [10, 20, 7])
+
+    def test_merge_bar_chart_keeps_label_order(self):
+        """Period labels that do not sort chronologically (month names) keep their first-seen order."""
+        api = dict(API, bar_chart=dict(API["bar_chart"], months=["Jan", "Feb"]))
+        web = dict(WEB, bar_chart=dict(WEB["bar_chart"], months=["Feb", "Mar"]))
+        merged = merge_payloads([api, web])
+        self.assertEqual(merged["bar_chart"]["months"], ["Jan", "Feb", "Mar"])
+        self.assertEqual(merged["bar_chart"]["commits"], [10, 25, 7])
+
+    def test_merge_indicators_by_title(self):
+        """Indicators are summed per title even when repositories list them in another order."""
+        web = dict(WEB, indicators={"titles": ["PRs", "Commits", "Reviews"], "values": [2, 12, 5],
+                                    "deltas": [1.0, -0.25, 0.0]})
+        merged = merge_payloads([API, web])
+        self.assertEqual(merged["indicators"]["titles"], ["Commits", "PRs", "Reviews"])
+        self.assertEqual(merged["indicators"]["values"], [42, 4, 5])
+        self.assertEqual(merged["indicators"]["deltas"], [0.167, 0.333, 0.0])
+
+    @patch('requests.get')
+    def test_fetch_skips_failed_repositories(self, mock_get):
+        """Failed repositories are left out; the others are fetched concurrently."""
+        def respond(url, params=None, **kwargs):
+            response = MagicMock()
+            if params["repo"] == "broken":
+                response.raise_for_status.side_effect = Exception("404")
+            response.content = json.dumps(FETCHED).encode("utf-8")
+            response.json.return_value = json.loads(response.content)
+            return response
+        mock_get.side_effect = respond
+
+        payloads = fetch_org_payloads("acme", ["api", "broken", "web"])
+        self.assertEqual(list(payloads), ["api", "web"])
+        self.assertEqual(mock_get.call_count, 3)
+
+    @patch('requests.get')
+    def test_fetch_skips_invalid_payloads(self, mock_get):
+        """Repositories returning a malformed payload are reported by name and left out."""
+        def respond(url, params=None, **kwargs):
+            response = MagicMock()
+            payload = {k: v for k, v in FETCHED.items() if k != "bar_chart"} if params["repo"] == "bad" else FETCHED
+            response.content = json.dumps(payload).encode("utf-8")
+            response.json.return_value = json.loads(response.content)
+            return response
+        mock_get.side_effect = respond
+
+        with patch('builtins.print') as mock_print:
+            payloads = fetch_org_payloads("acme", ["api", "bad"])
+        self.assertEqual(list(payloads), ["api"])
+        warning = next(call.args[0] for call in mock_print.call_args_list if "acme/bad" in call.args[0])
+        self.assertIn("$.bar_chart: missing", warning)
+
+    @patch('requests.get')
+    def test_fetch_fails_when_nothing_is_fetched(self, mock_get):
+        """The run fails when no repository could be fetched."""
+        mock_get.return_value.raise_for_status.side_effect = Exception("500")
+        with self.assertRaises(RuntimeError):
+            fetch_org_payloads("acme", ["api"])
+
+    def test_parse_repo_list(self):
+        """Comma and newline separated lists are accepted, duplicates dropped."""
+        self.assertEqual(parse_repo_list("api, web\ndocs,,api"), ["api", "web", "docs"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+import os
+import sys
+import unittest
+from unittest.mock import MagicMock
+
+# Add the parent directory to sys.path to import from the project
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from panel_templates import PanelTemplateRegistry, PANEL_TEMPLATES
+
+
+class TestPanelTemplates(unittest.TestCase):
+    """Test cases for the panel_templates.py module."""
+
+    def test_layout_is_built_once(self):
+        """A panel layout is built on first use and reused afterwards."""
+        builder = MagicMock(return_value={"width": 10, "title": {"font": {"size": 1}}})
+        registry = PanelTemplateRegistry()
+        registry.register("panel", builder)
+
+        registry.new_figure("panel", [], title="A")
+        registry.new_figure("panel", [], title="B")
+        self.assertEqual(builder.call_count, 1)
+
+        registry.clear()
+        registry.layout("panel")
+        self.assertEqual(builder.call_count, 2)
+
+    def test_new_figure_clones_layout(self):
+        """Titles and extra fields go into a clone, never into the cached layout."""
+        registry = PanelTemplateRegistry()
+        registry.register("panel", lambda: {"width": 10, "title": {"font": {"size": 1}}})
+
+        fig = registry.new_figure("panel", [{"type": "bar"}], title="Hello", annotations=[{"text": "x"}])
+
+        self.assertEqual(fig["data"], [{"type": "bar"}])
+        self.assertEqual(fig["layout"]["title"], {"font": {"size": 1}, "text": "Hello"})
+        self.assertEqual(fig["layout"]["annotations"], [{"text": "x"}])
+        self.assertEqual(registry.layout("panel"), {"width": 10, "title": {"font": {"size": 1}}})
+
+    def test_default_panels_registered(self):
+        """All four dashboard panels have a template with the resolved Plotly template."""
+        for panel in ("indicators", "bars", "pie", "ranking"):
+            layout = PANEL_TEMPLATES.layout(panel)
+            self.assertIsInstance(layout["template"], dict)
+            self.assertIn("width", layout)
+
+
+if __name__ == '__main__':
+    unittest.main()
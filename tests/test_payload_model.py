@@ -0,0 +1,70 @@
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+import plotly.graph_objects as go
+
+# Add the parent directory to sys.path to import from the project
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from payload_model import DashboardPayload, BarChart, Developer
+from fast_charts import build_bar_dict, build_pie_dict, build_ranking_dict
+
+PAYLOAD = {
+    "indicators": {"titles": ["Commits", "PRs", "Comments", "Reviews"], "values": [165, 54, 14, 53],
+                   "deltas": [0.3, 0.3, 0.8, 0.4]},
+    "bar_chart": {"title": "Daily Activity", "months": ["2025-03-03", "2025-03-04"],
+                  "commits": [5, 7], "prs": [3, 2], "comments": [0, None], "reviews": [3, 2]},
+    "pie_chart": {"title": "Balance", "labels": ["a", "b"], "values": [89, 40]},
+    "ranking": {"title": "Top", "devs": [
+        {"name": "User A", "avatar": "", "commits": 77, "prs": 25, "comments": 9, "reviews": 6},
+        {"name": "User B", "commits": 49, "prs": 18, "comments": 0, "reviews": 11},
+    ]},
+    "watermark_text": "Powered by Gitlights",
+}
+
+
+class TestPayloadModel(unittest.TestCase):
+    """Test cases for the payload_model.py module."""
+
+    def test_from_dict(self):
+        """The payload is parsed into slotted objects with array-backed series."""
+        payload = DashboardPayload.from_dict(PAYLOAD)
+
+        self.assertEqual(payload.indicators.values, (165, 54, 14, 53))
+        self.assertEqual(payload.bar_chart.months, ("2025-03-03", "2025-03-04"))
+        self.assertIsInstance(payload.bar_chart.commits, np.ndarray)
+        self.assertTrue(np.isnan(payload.bar_chart.comments[1]))
+        self.assertIsNone(payload.bar_chart.other)
+        self.assertEqual(payload.pie_chart.values.tolist(), [89, 40])
+        self.assertEqual(payload.ranking.devs[1], Developer("User B", "", 49, 18, 0, 11))
+        self.assertEqual(payload.watermark_text, "Powered by Gitlights")
+
+    def test_objects_have_no_instance_dict(self):
+        """Every model class uses __slots__."""
+        payload = DashboardPayload.from_dict(PAYLOAD)
+        for obj in (payload, payload.indicators, payload.bar_chart, payload.pie_chart,
+                    payload.ranking, payload.ranking.devs[0]):
+            self.assertFalse(hasattr(obj, "__dict__"), type(obj).__name__)
+
+    def test_builders_accept_model_and_dicts(self):
+        """Chart builders give the same figures from the model and from the raw dicts."""
+        payload = DashboardPayload.from_dict(PAYLOAD)
+        self.assertIs(BarChart.coerce(payload.bar_chart), payload.bar_chart)
+
+        fig_from_model = go.Figure(build_bar_dict(payload.bar_chart))
+        fig_from_dict = go.Figure(build_bar_dict(PAYLOAD["bar_chart"]))
+        self.assertEqual(fig_from_model.to_json(), fig_from_dict.to_json())
+        self.assertEqual(list(go.Figure(build_pie_dict(payload.pie_chart)).data[0].labels), ["a", "b"])
+
+        with patch('avatars.encode_image_from_url', return_value=""):
+            ranking = build_ranking_dict(payload.ranking)
+        texts = [annotation["text"] for annotation in ranking["layout"]["annotations"]]
+        self.assertIn("<b>User B</b>", texts)
+        self.assertIn("49", texts)
+
+
+if __name__ == '__main__':
+    unittest.main()
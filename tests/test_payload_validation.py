@@ -0,0 +1,67 @@
+import copy
+import os
+import sys
+import unittest
+
+# Add the parent directory to sys.path to import from the project
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from payload_validation import validate_payload, check_payload, PayloadValidationError
+
+VALID = {
+    "indicators": {"titles": ["Commits", "PRs", "Comments", "Reviews"], "values": [165, 54, 14, 53],
+                   "deltas": [0.3, 0.3, 0.8, -0.4]},
+    "bar_chart": {"title": "Daily Activity", "months": ["2025-03-03", "2025-03-04"],
+                  "commits": [5, 7], "prs": [3, 2], "comments": [0, None], "reviews": [3, 2]},
+    "pie_chart": {"title": "Balance", "labels": ["a", "b"], "values": [89, 40.5]},
+    "ranking": {"title": "Top", "devs": [
+        {"name": "User A", "avatar": "http://example.com/a.png", "commits": 77, "prs": 25, "comments": 9, "reviews": 6},
+    ]},
+    "watermark_text": "Powered by Gitlights",
+}
+
+
+class TestPayloadValidation(unittest.TestCase):
+    """Test cases for the payload_validation.py module."""
+
+    def test_valid_payload(self):
+        """A complete payload has no problems."""
+        self.assertEqual(validate_payload(VALID), [])
+        check_payload(VALID)
+
+    def test_reports_every_problem_with_json_paths(self):
+        """All problems are reported at once, each with the path of the offending value."""
+        payload = copy.deepcopy(VALID)
+        payload["indicators"]["deltas"] = [0.1, 0.2]
+        payload["bar_chart"]["prs"] = [1]
+        payload["pie_chart"]["values"] = [1, "2"]
+        payload["ranking"]["devs"][0]["commits"] = None
+        payload["ranking"]["devs"].append("User B")
+        del payload["watermark_text"]
+
+        paths = dict(validate_payload(payload))
+        self.assertEqual(paths["$.indicators.deltas"], "has 2 items, expected at least 4")
+        self.assertEqual(paths["$.bar_chart.prs"], "has 1 items but months has 2")
+        self.assertEqual(paths["$.pie_chart.values[1]"], "expected a number, got str")
+        self.assertEqual(paths["$.ranking.devs[0].commits"], "expected a number, got NoneType")
+        self.assertEqual(paths["$.ranking.devs[1]"], "expected an object, got str")
+        self.assertEqual(paths["$.watermark_text"], "missing")
+        self.assertEqual(len(paths), 6)
+
+    def test_missing_sections(self):
+        """Missing sections are reported once each, not once per key."""
+        problems = validate_payload({"indicators": [], "watermark_text": "x"})
+        self.assertEqual([path for path, _ in problems],
+                         ["$.indicators", "$.bar_chart", "$.pie_chart", "$.ranking"])
+        self.assertEqual(validate_payload([]), [("$", "expected an object, got list")])
+
+    def test_check_payload_raises(self):
+        """check_payload raises with the problems attached and one line per problem."""
+        with self.assertRaises(PayloadValidationError) as context:
+            check_payload({"watermark_text": 1})
+        self.assertEqual(len(context.exception.problems), 5)
+        self.assertEqual(len(str(context.exception).splitlines()), 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
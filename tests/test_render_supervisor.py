@@ -0,0 +1,132 @@
+import os
+import sys
+import tempfile
+import time
+import unittest
+
+# Add the parent directory to sys.path to import from the project
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from render_supervisor import (
+    RenderSupervisor, PanelRenderError, RssSampler, process_group_rss_mb, process_tree_rss_mb
+)
+
+
+def _hanging_worker(conn, json_engine):
+    """Worker that accepts jobs but never answers."""
+    while True:
+        if conn.recv() is None:
+            break
+        time.sleep(60)
+
+
+def _hang_once_worker(conn, json_engine):
+    """Worker that hangs unless its marker file exists, then writes the output path."""
+    while True:
+        job = conn.recv()
+        if job is None:
+            break
+        fig, path, kwargs = job
+        marker = path + ".marker"
+        if not os.path.exists(marker):
+            open(marker, "w").close()
+            time.sleep(60)
+        with open(path, "w") as f:
+            f.write("rendered")
+        conn.send(("ok", None))
+
+
+def _recording_worker(conn, json_engine):
+    """Worker that answers every job and writes the jobs it saw next to the output path."""
+    seen = []
+    while True:
+        job = conn.recv()
+        if job is None:
+            break
+        fig, path, kwargs = job
+        seen.append("warm-up" if path is None else "panel")
+        if path is not None:
+            with open(path, "w") as f:
+                f.write(",".join(seen))
+        conn.send(("ok", None))
+
+
+def _crashing_worker(conn, json_engine):
+    """Worker that dies as soon as it receives a job."""
+    conn.recv()
+    os._exit(3)
+
+
+class TestRenderSupervisor(unittest.TestCase):
+    """Test cases for the render_supervisor.py module."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, "panel.png")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_timeout_is_retried_in_fresh_worker(self):
+        """A hung render is killed and the panel succeeds on retry."""
+        with RenderSupervisor(panel_timeout=2, worker_target=_hang_once_worker) as supervisor:
+            supervisor.render("bars", {"data": [], "layout": {}}, self.path)
+
+        self.assertTrue(os.path.exists(self.path))
+        self.assertEqual(len(supervisor.failures), 1)
+        self.assertEqual(supervisor.failures[0]["panel"], "bars")
+        self.assertIn("timed out", supervisor.failures[0]["reason"])
+
+    def test_permanent_hang_raises(self):
+        """A panel failing every attempt raises PanelRenderError within the deadlines."""
+        start = time.monotonic()
+        with RenderSupervisor(panel_timeout=0.5, worker_target=_hanging_worker) as supervisor:
+            with self.assertRaises(PanelRenderError) as ctx:
+                supervisor.render("pie", {"data": [], "layout": {}}, self.path)
+
+        self.assertEqual(ctx.exception.panel, "pie")
+        self.assertEqual([f["attempt"] for f in supervisor.failures], [1, 2])
+        self.assertLess(time.monotonic() - start, 20)
+
+    def test_worker_crash_is_reported(self):
+        """A worker that dies is detected without waiting for the deadline."""
+        with RenderSupervisor(panel_timeout=30, retries=0, worker_target=_crashing_worker) as supervisor:
+            with self.assertRaises(PanelRenderError) as ctx:
+                supervisor.render("ranking", {"data": [], "layout": {}}, self.path)
+
+        self.assertIn("exited", ctx.exception.reason)
+
+    def test_warm_up_runs_before_first_panel(self):
+        """The warm-up job reaches the worker before the first real panel."""
+        with RenderSupervisor(panel_timeout=10, worker_target=_recording_worker) as supervisor:
+            thread = supervisor.warm_up()
+            supervisor.render("indicators", {"data": [], "layout": {}}, self.path)
+            thread.join(timeout=10)
+
+        with open(self.path) as f:
+            self.assertEqual(f.read(), "warm-up,panel")
+        self.assertEqual(supervisor.failures, [])
+
+    @unittest.skipUnless(os.path.isdir("/proc"), "requires /proc")
+    def test_process_group_rss(self):
+        """The RSS of this test's process group is measurable."""
+        self.assertGreater(process_group_rss_mb(os.getpgrp()), 0)
+
+    @unittest.skipUnless(os.path.isdir("/proc"), "requires /proc")
+    def test_process_tree_rss(self):
+        """The RSS of a process tree includes at least the process itself."""
+        self.assertGreater(process_tree_rss_mb(os.getpid()), 0)
+        self.assertEqual(process_tree_rss_mb(2 ** 22 + 1), 0)
+
+    @unittest.skipUnless(os.path.isdir("/proc"), "requires /proc")
+    def test_rss_sampler_records_peak(self):
+        """The sampler keeps the peak RSS seen while the block runs, short blocks included."""
+        with RssSampler(interval=0.01) as sampler:
+            buffer = bytearray(64 * 1024 * 1024)
+            time.sleep(0.05)
+            del buffer
+        self.assertGreater(sampler.peak_mb, 64)
+
+
+if __name__ == '__main__':
+    unittest.main()
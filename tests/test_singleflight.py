@@ -0,0 +1,93 @@
+import os
+import sys
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+# Add the parent directory to sys.path to import from the project
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from singleflight import SingleFlight, SingleFlightTimeout
+
+
+def _wait_for(predicate, timeout=5):
+    event = threading.Event()
+    for _ in range(int(timeout / 0.01)):
+        if predicate():
+            return True
+        event.wait(0.01)
+    return False
+
+
+class TestSingleFlight(unittest.TestCase):
+    """Test cases for the singleflight.py module."""
+
+    def _run_concurrently(self, flight, callers, key, fn):
+        # Holds the first execution until every other caller is waiting on it
+        with ThreadPoolExecutor(max_workers=callers) as executor:
+            futures = [executor.submit(flight.do, key, fn) for _ in range(callers)]
+            self.assertTrue(_wait_for(lambda: flight.coalesced == callers - 1))
+            self.release.set()
+            return futures
+
+    def setUp(self):
+        self.release = threading.Event()
+
+    def test_concurrent_calls_share_one_execution(self):
+        """Concurrent callers with the same key get the result of a single execution."""
+        flight = SingleFlight()
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            self.release.wait(5)
+            return {"logo": b"png"}
+
+        futures = self._run_concurrently(flight, 8, "http://a/logo.png", fetch)
+        results = [future.result() for future in futures]
+        self.assertEqual(len(calls), 1)
+        self.assertTrue(all(result is results[0] for result in results))
+        self.assertEqual((flight.executions, flight.coalesced), (1, 7))
+
+    def test_error_is_shared(self):
+        """An exception of the execution is raised in every coalesced caller."""
+        flight = SingleFlight()
+
+        def fetch():
+            self.release.wait(5)
+            raise ConnectionError("host down")
+
+        for future in self._run_concurrently(flight, 4, "http://a/dead.png", fetch):
+            with self.assertRaises(ConnectionError):
+                future.result()
+        self.assertEqual(flight.executions, 1)
+
+    def test_waiting_caller_times_out(self):
+        """A coalesced caller stops waiting after its timeout; the execution carries on."""
+        flight = SingleFlight()
+        started = threading.Event()
+
+        def fetch():
+            started.set()
+            self.release.wait(5)
+            return "logo"
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            leader = executor.submit(flight.do, "http://a/logo.png", fetch)
+            self.assertTrue(started.wait(5))
+            with self.assertRaises(SingleFlightTimeout):
+                flight.do("http://a/logo.png", fetch, timeout=0.05)
+            self.release.set()
+            self.assertEqual(leader.result(), "logo")
+
+    def test_completed_calls_are_not_cached(self):
+        """Sequential calls and different keys each run their own execution."""
+        flight = SingleFlight()
+        self.assertEqual(flight.do("a", lambda: 1), 1)
+        self.assertEqual(flight.do("a", lambda: 2), 2)
+        self.assertEqual(flight.do("b", lambda: 3), 3)
+        self.assertEqual((flight.executions, flight.coalesced), (3, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
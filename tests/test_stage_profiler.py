@@ -0,0 +1,72 @@
+import os
+import pstats
+import sys
+import tempfile
+import time
+import tracemalloc
+import unittest
+
+# Add the parent directory to sys.path to import from the project
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from stage_profiler import RunProfiler
+from timing import StageTimer
+
+
+def _busy_stage(seconds):
+    end = time.perf_counter() + seconds
+    total = 0
+    while time.perf_counter() < end:
+        total += sum(range(100))
+    return total
+
+
+class TestProfiling(unittest.TestCase):
+    """Test cases for the stage_profiler.py module."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def _read_hotspots(self, profiler):
+        with open(profiler.paths["hotspots"]) as f:
+            return f.read()
+
+    def test_cprofile_mode_writes_stats_and_stage_memory(self):
+        """cProfile stats are loadable and the summary lists hotspots and stage memory."""
+        timer = StageTimer()
+        with RunProfiler(self.tmp_dir.name, mode="cprofile", top_n=5) as profiler:
+            with timer.stage("busy"):
+                _busy_stage(0.05)
+            profiler.stage_memory = timer.memory_peaks
+
+        self.assertFalse(tracemalloc.is_tracing())
+        self.assertIn("busy", timer.memory_peaks)
+        self.assertEqual(profiler.paths["profile"], os.path.join(self.tmp_dir.name, "profile.prof"))
+        stats = pstats.Stats(profiler.paths["profile"])
+        self.assertTrue(any(func[2] == "_busy_stage" for func in stats.stats))
+        hotspots = self._read_hotspots(profiler)
+        self.assertIn("_busy_stage", hotspots)
+        self.assertIn("busy", hotspots)
+        self.assertIn("whole run", hotspots)
+
+    def test_sampling_mode_writes_folded_stacks(self):
+        """The sampling profiler records the stacks of the profiled thread."""
+        with RunProfiler(self.tmp_dir.name, mode="sampling") as profiler:
+            _busy_stage(0.2)
+
+        with open(os.path.join(self.tmp_dir.name, "profile.folded")) as f:
+            folded = f.read()
+        self.assertIn("_busy_stage", folded)
+        self.assertIn("Own samples:", self._read_hotspots(profiler))
+
+    def test_unknown_mode(self):
+        """Only the supported profilers are accepted."""
+        with self.assertRaises(ValueError):
+            RunProfiler(self.tmp_dir.name, mode="perf")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+import os
+import sys
+import tempfile
+import unittest
+import xml.etree.ElementTree as ET
+from unittest.mock import patch, MagicMock
+
+# Add the parent directory to sys.path to import from the project
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from config import GITLIGHTS_LOGO_URL
+from svg_utils import combine_dashboard_svg, SVG_NS, XLINK_NS
+
+PANEL_SVG = ('<svg xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" '
+             'width="{w}" height="{h}" viewBox="0 0 {w} {h}"><rect width="{w}" height="{h}"/></svg>')
+
+
+class TestSvgUtils(unittest.TestCase):
+    """Test cases for the svg_utils.py module."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.paths = {}
+        sizes = {"indicators": (2400, 300), "bars": (2400, 800), "pie": (1200, 800), "ranking": (1200, 800)}
+        for panel, (w, h) in sizes.items():
+            self.paths[panel] = os.path.join(self.tmp_dir.name, f"{panel}.svg")
+            with open(self.paths[panel], "w") as f:
+                f.write(PANEL_SVG.format(w=w, h=h))
+        self.output_path = os.path.join(self.tmp_dir.name, "dashboard.svg")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def _combine(self, **kwargs):
+        combine_dashboard_svg(
+            indicators_path=self.paths["indicators"],
+            bar_path=self.paths["bars"],
+            pie_path=self.paths["pie"],
+            ranking_path=self.paths["ranking"],
+            watermark_text="Test Watermark",
+            output_path=self.output_path,
+            **kwargs
+        )
+        return ET.parse(self.output_path).getroot()
+
+    def test_panels_nested_at_dashboard_positions(self):
+        """Each panel is nested at the same position as in the PNG dashboard."""
+        root = self._combine(logo_mode="link", scale=0.5)
+
+        self.assertEqual(root.tag, f"{{{SVG_NS}}}svg")
+        self.assertEqual((root.get("width"), root.get("height")), ("1200", "950"))
+        self.assertEqual(root.get("viewBox"), "0 0 2400 1900")
+        panels = root.findall(f"{{{SVG_NS}}}svg")
+        self.assertEqual([(p.get("x"), p.get("y")) for p in panels],
+                         [("0", "0"), ("0", "300"), ("0", "1100"), ("1200", "1100")])
+        self.assertEqual(root.find(f"{{{SVG_NS}}}text").text, "Test Watermark")
+        with open(self.output_path) as f:
+            self.assertNotIn("ns0:", f.read())
+
+    def test_logo_link_mode(self):
+        """The logo can be referenced by URL without downloading it."""
+        with patch('http_utils.requests.get') as mock_get:
+            root = self._combine(logo_mode="link")
+        mock_get.assert_not_called()
+        logo = root.find(f"{{{SVG_NS}}}image")
+        self.assertEqual(logo.get(f"{{{XLINK_NS}}}href"), GITLIGHTS_LOGO_URL)
+
+    @patch('http_utils.requests.get')
+    def test_logo_inline_mode(self, mock_get):
+        """The inlined logo is embedded as a data URI and skipped when the download fails."""
+        mock_response = MagicMock()
+        mock_response.content = b'logo_content'
+        mock_response.raise_for_status.return_value = None
+        mock_get.return_value = mock_response
+
+        logo = self._combine(logo_mode="inline").find(f"{{{SVG_NS}}}image")
+        self.assertTrue(logo.get("href").startswith("data:image/png;base64,"))
+
+        mock_get.side_effect = Exception("no network")
+        self.assertIsNone(self._combine(logo_mode="inline").find(f"{{{SVG_NS}}}image"))
+
+
+if __name__ == '__main__':
+    unittest.main()
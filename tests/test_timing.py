@@ -0,0 +1,86 @@
+import os
+import sys
+import tracemalloc
+import unittest
+
+# Add the parent directory to sys.path to import from the project
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from timing import StageTimer, percentile
+
+
+class TestTiming(unittest.TestCase):
+    """Test cases for the timing.py module."""
+
+    def test_stage_records_duration_and_label(self):
+        """Stages are recorded in order, with optional labels."""
+        timer = StageTimer()
+        with timer.stage("fetch"):
+            pass
+        with timer.stage("render", label="orjson"):
+            pass
+
+        self.assertEqual(list(timer.durations), ["fetch", "render"])
+        self.assertEqual(timer.labels, {"render": "orjson"})
+        lines = timer.summary_lines()
+        self.assertEqual(len(lines), 3)
+        self.assertIn("(orjson)", lines[1])
+        self.assertTrue(lines[-1].strip().startswith("total"))
+
+    def test_stage_accumulates_and_survives_errors(self):
+        """Repeated stages accumulate and failing blocks are still timed."""
+        timer = StageTimer()
+        with timer.stage("render"):
+            pass
+        with self.assertRaises(ValueError):
+            with timer.stage("render"):
+                raise ValueError("boom")
+
+        self.assertEqual(len(timer.durations), 1)
+        self.assertGreaterEqual(timer.total(), 0.0)
+
+    def test_stage_memory_peaks_while_tracing(self):
+        """Peak memory per stage is recorded only while tracemalloc is tracing."""
+        timer = StageTimer()
+        with timer.stage("untraced"):
+            pass
+        tracemalloc.start()
+        try:
+            with timer.stage("allocate"):
+                block = bytearray(5 * 1024 * 1024)
+                del block
+        finally:
+            tracemalloc.stop()
+
+        self.assertNotIn("untraced", timer.memory_peaks)
+        self.assertGreaterEqual(timer.memory_peaks["allocate"], 5 * 1024 * 1024)
+        self.assertIn("peak", timer.summary_lines()[1])
+
+    def test_overlapping_stages_have_no_memory_peak(self):
+        """Stages of concurrent generations share the tracemalloc peak, so none is recorded."""
+        first, second = StageTimer(), StageTimer()
+        tracemalloc.start()
+        try:
+            with first.stage("render"):
+                with second.stage("fetch"):
+                    pass
+            with first.stage("combine"):
+                pass
+        finally:
+            tracemalloc.stop()
+
+        self.assertEqual(set(first.memory_peaks), {"combine"})
+        self.assertEqual(second.memory_peaks, {})
+        self.assertIn("render", first.durations)
+
+    def test_percentile(self):
+        """Percentiles interpolate between closest ranks."""
+        values = [4, 1, 3, 2]
+        self.assertEqual(percentile(values, 0), 1)
+        self.assertEqual(percentile(values, 50), 2.5)
+        self.assertEqual(percentile(values, 100), 4)
+        self.assertIsNone(percentile([], 50))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+import os
+import sys
+import tempfile
+import unittest
+
+# Add the parent directory to sys.path to import from the project
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from trend_store import TrendStore, apply_trends
+
+
+def _payload(values, months, commits):
+    return {
+        "indicators": {"titles": ["Commits", "PRs"], "values": values, "deltas": [0.9, 0.9]},
+        "bar_chart": {"title": "Activity", "months": months, "commits": commits,
+                      "prs": [1] * len(months), "comments": [0] * len(months), "reviews": [0] * len(months)},
+    }
+
+
+class TestTrendStore(unittest.TestCase):
+    """Test cases for the trend_store.py module."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, "cache", "trends.sqlite")
+        self.store = TrendStore(self.path)
+
+    def tearDown(self):
+        self.store.close()
+        self.tmp_dir.cleanup()
+
+    def test_indicators_by_repo_and_date(self):
+        """Runs are recorded per repository and day, a later run of the day replaces the earlier one."""
+        self.store.record_payload("acme/api", _payload([10, 2], [], []), date="2025-03-01")
+        self.store.record_payload("acme/api", _payload([12, 3], [], []), date="2025-03-01")
+        self.store.record_payload("acme/api", _payload([20, 4], [], []), date="2025-03-05")
+        self.store.record_payload("acme/web", _payload([99, 9], [], []), date="2025-03-05")
+
+        history = self.store.indicator_history("acme/api")
+        self.assertEqual(history, [("2025-03-01", "Commits", 12), ("2025-03-01", "PRs", 3),
+                                   ("2025-03-05", "Commits", 20), ("2025-03-05", "PRs", 4)])
+        self.assertEqual(self.store.indicators_on("acme/api", "2025-03-04"), {"Commits": 12, "PRs": 3})
+        self.assertEqual(self.store.indicators_on("acme/api", "2025-02-28"), {})
+
+    def test_local_deltas(self):
+        """Deltas compare with the latest run at least `days` days old."""
+        self.store.record_payload("acme/api", _payload([10, 0], [], []), date="2025-02-27")
+        deltas = self.store.local_deltas("acme/api", ["Commits", "PRs", "Reviews"], [15, 2, 1],
+                                         days=30, today="2025-03-31")
+        self.assertEqual(deltas, [0.5, 1.0, None])
+        self.assertEqual(self.store.local_deltas("acme/api", ["Commits"], [15], days=60, today="2025-03-31"), [None])
+
+    def test_series_history_spans_runs(self):
+        """Periods from several runs are merged, latest values win, and `limit` keeps the newest."""
+        self.store.record_payload("acme/api", _payload([1, 1], ["2025-01", "2025-02"], [5, 6]), date="2025-02-15")
+        self.store.record_payload("acme/api", _payload([1, 1], ["2025-02", "2025-03"], [8, 9]), date="2025-03-15")
+
+        chart = self.store.series_history("acme/api")
+        self.assertEqual(chart["months"], ["2025-01", "2025-02", "2025-03"])
+        self.assertEqual(chart["commits"], [5, 8, 9])
+        self.assertEqual(self.store.series_history("acme/api", limit=2)["months"], ["2025-02", "2025-03"])
+        self.assertEqual(self.store.series_history("acme/web")["months"], [])
+
+    def test_missing_points_are_skipped(self):
+        """None points are not recorded and keep the value stored by an earlier run."""
+        self.store.record_payload("acme/api", _payload([1, 1], ["2025-01", "2025-02"], [5, 6]), date="2025-02-15")
+        self.store.record_payload("acme/api", _payload([1, 1], ["2025-02", "2025-03"], [None, 9]), date="2025-03-15")
+        self.assertEqual(self.store.series_history("acme/api")["commits"], [5, 6, 9])
+
+    def test_apply_trends(self):
+        """The payload is recorded and its bar chart extended from the store."""
+        self.store.record_payload("acme/api", _payload([1, 1], ["2025-01"], [3]), date="2025-01-31")
+        payload = apply_trends(self.store, "acme/api", _payload([7, 1], ["2025-02"], [4]), periods=12)
+        self.assertEqual(payload["bar_chart"]["months"], ["2025-01", "2025-02"])
+        self.assertEqual(payload["bar_chart"]["commits"], [3, 4])
+        self.assertEqual(payload["bar_chart"]["title"], "Activity")
+        self.assertEqual(payload["indicators"]["deltas"], [0.9, 0.9])
+
+    def test_store_persists(self):
+        """Records survive reopening the file."""
+        self.store.record_payload("acme/api", _payload([10, 2], [], []), date="2025-03-01")
+        self.store.close()
+        self.store = TrendStore(self.path)
+        self.assertEqual(self.store.indicators_on("acme/api", "2025-03-01"), {"Commits": 10, "PRs": 2})
+
+
+if __name__ == '__main__':
+    unittest.main()
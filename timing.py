@@ -0,0 +1,122 @@
+# timing.py
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+# Traced stages running in this process, across every StageTimer. The tracemalloc
+# peak is process-wide, so a stage peak is only recorded when no other stage ran
+# alongside it (see StageTimer)
+_traced_stages_lock = threading.Lock()
+_traced_stages_active = 0
+_traced_stages_started = 0
+
+
+def percentile(values, q):
+    """
+    Percentile with linear interpolation between closest ranks.
+
+    Args:
+        values (list): Samples.
+        q (float): Percentile between 0 and 100.
+
+    Returns:
+        float: The percentile, or None without samples.
+    """
+    if not values:
+        return None
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * q / 100
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+class StageTimer:
+    """
+    Collects wall-clock durations for the stages of a dashboard generation.
+
+    Stages are recorded in the order they first run. Running a stage with the
+    same name more than once accumulates its duration.
+
+    While tracemalloc is tracing (see stage_profiler.py), the peak of Python
+    memory allocated during each stage is recorded as well. Memory of the
+    Kaleido and Chromium subprocesses is not included. The tracemalloc peak is
+    process-wide, so a stage that overlapped a stage of another generation
+    (batch workers, load tests) gets no memory peak rather than a wrong one.
+    """
+
+    def __init__(self):
+        self.durations = {}
+        self.labels = {}
+        self.memory_peaks = {}
+
+    @contextmanager
+    def stage(self, name, label=None):
+        """
+        Context manager that times the enclosed block as stage `name`.
+
+        Args:
+            name (str): Stage name, e.g. "fetch" or "render_bars".
+            label (str): Optional detail shown next to the duration in the summary
+                (for example the JSON engine used by the stage).
+        """
+        global _traced_stages_active, _traced_stages_started
+        counted = tracemalloc.is_tracing()
+        tracing = False
+        if counted:
+            with _traced_stages_lock:
+                _traced_stages_active += 1
+                _traced_stages_started += 1
+                started = _traced_stages_started
+                # Resetting the peak would corrupt the measure of a stage already running
+                tracing = _traced_stages_active == 1
+            if tracing:
+                tracemalloc.reset_peak()
+                baseline = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self.durations[name] = self.durations.get(name, 0.0) + elapsed
+            if label:
+                self.labels[name] = label
+            if counted:
+                with _traced_stages_lock:
+                    _traced_stages_active -= 1
+                    # Another stage started meanwhile and may have reset the peak
+                    alone = _traced_stages_started == started
+                if tracing and alone and tracemalloc.is_tracing():
+                    # Peak above what was already allocated when the stage started
+                    peak = tracemalloc.get_traced_memory()[1] - baseline
+                    self.memory_peaks[name] = max(self.memory_peaks.get(name, 0), peak)
+
+    def total(self):
+        """
+        Returns:
+            float: Sum of all recorded stage durations, in seconds.
+        """
+        return sum(self.durations.values())
+
+    def summary_lines(self):
+        """
+        Returns:
+            list: One human readable line per stage plus a total line.
+        """
+        lines = []
+        for name, seconds in self.durations.items():
+            line = f"  {name:<20} {seconds * 1000:9.1f} ms"
+            if name in self.memory_peaks:
+                line += f"  peak {self.memory_peaks[name] / (1024 * 1024):7.1f} MB"
+            if name in self.labels:
+                line += f"  ({self.labels[name]})"
+            lines.append(line)
+        lines.append(f"  {'total':<20} {self.total() * 1000:9.1f} ms")
+        return lines
+
+    def print_summary(self):
+        """Prints the stage timings to stdout."""
+        print("Stage timings:")
+        for line in self.summary_lines():
+            print(line)
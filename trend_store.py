@@ -0,0 +1,220 @@
+# trend_store.py
+"""
+Local time-series store of dashboard payloads.
+
+Every run records its indicator values and bar chart series per repository
+in a small SQLite file that workflows persist with actions/cache. The data
+API only serves the current window, so the store is what allows deltas
+computed locally against any earlier run and bar charts longer than the
+window the API returns.
+
+Both tables are WITHOUT ROWID tables clustered on their primary key, which
+starts with the repository and the date. Lookups by repository and date
+range are index range scans, and a run only upserts one row per indicator
+and per (period, series), so the file grows with the number of distinct
+days, not with the number of runs.
+"""
+import datetime
+import os
+import sqlite3
+
+from config import TREND_DELTA_DAYS
+from event_aggregation import relative_delta
+
+BAR_SERIES = ["commits", "prs", "comments", "reviews"]
+SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS indicators (
+    repo TEXT NOT NULL,
+    date TEXT NOT NULL,
+    title TEXT NOT NULL,
+    value REAL NOT NULL,
+    PRIMARY KEY (repo, date, title)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS series (
+    repo TEXT NOT NULL,
+    period TEXT NOT NULL,
+    name TEXT NOT NULL,
+    value REAL NOT NULL,
+    PRIMARY KEY (repo, period, name)
+) WITHOUT ROWID;
+"""
+
+
+def _today():
+    return datetime.datetime.now(datetime.timezone.utc).date().isoformat()
+
+
+def _number(value):
+    return int(value) if float(value).is_integer() else value
+
+
+class TrendStore:
+    """
+    SQLite store of indicator values per run day and bar series per period.
+
+    Usage:
+        with TrendStore(".gitlights-cache/trends.sqlite") as store:
+            store.record_payload("acme/api", payload)
+            deltas = store.local_deltas("acme/api", titles, values, days=30)
+    """
+
+    def __init__(self, path):
+        """
+        Args:
+            path (str): SQLite file, created with its directory when missing.
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        version = self.connection.execute("PRAGMA user_version").fetchone()[0]
+        if version not in (0, SCHEMA_VERSION):
+            self.connection.close()
+            raise ValueError(f"Unsupported trend store version {version} in {path}")
+        self.connection.executescript(_SCHEMA)
+        self.connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def close(self):
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+    def record_payload(self, repo, payload, date=None):
+        """
+        Records the indicator values and bar series of a payload.
+
+        A later run on the same day replaces the indicator values of that
+        day, and periods served again replace their stored values. Missing
+        points (None) are not stored, so they keep any value stored earlier.
+
+        Args:
+            repo (str): Repository key, e.g. "owner/repo".
+            payload (dict): Payload with the data API structure.
+            date (str): Run day as YYYY-MM-DD. Defaults to today (UTC).
+        """
+        date = date or _today()
+        indicators = payload["indicators"]
+        bars = payload["bar_chart"]
+        with self.connection:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO indicators VALUES (?, ?, ?, ?)",
+                [(repo, date, title, float(value)) for title, value in zip(indicators["titles"], indicators["values"])
+                 if value is not None]
+            )
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO series VALUES (?, ?, ?, ?)",
+                [(repo, period, name, float(value))
+                 for name in BAR_SERIES if bars.get(name) is not None
+                 for period, value in zip(bars["months"], bars[name]) if value is not None]
+            )
+
+    def indicator_history(self, repo, since=None, until=None):
+        """
+        Indicator values recorded for a repository.
+
+        Returns:
+            list: (date, title, value) tuples ordered by date.
+        """
+        rows = self.connection.execute(
+            "SELECT date, title, value FROM indicators WHERE repo = ? AND date >= ? AND date <= ? ORDER BY date",
+            (repo, since or "", until or "9999-12-31")
+        ).fetchall()
+        return [(date, title, _number(value)) for date, title, value in rows]
+
+    def indicators_on(self, repo, date):
+        """
+        Indicator values of the latest run on or before `date`.
+
+        Returns:
+            dict: Title to value; empty when nothing was recorded by then.
+        """
+        rows = self.connection.execute(
+            "SELECT title, value FROM indicators WHERE repo = ? AND date = "
+            "(SELECT MAX(date) FROM indicators WHERE repo = ? AND date <= ?)",
+            (repo, repo, date)
+        ).fetchall()
+        return {title: _number(value) for title, value in rows}
+
+    def local_deltas(self, repo, titles, values, days=TREND_DELTA_DAYS, today=None):
+        """
+        Deltas of `values` against the values recorded `days` days earlier.
+
+        Args:
+            repo (str): Repository key.
+            titles (list): Indicator titles.
+            values (list): Current indicator values.
+            days (int): How far back the reference run is.
+            today (str): Current day as YYYY-MM-DD. Defaults to today (UTC).
+
+        Returns:
+            list: One delta per title (as fractions), None where no reference was recorded.
+        """
+        today = datetime.date.fromisoformat(today or _today())
+        reference = self.indicators_on(repo, (today - datetime.timedelta(days=days)).isoformat())
+        return [relative_delta(value, reference[title]) if title in reference else None
+                for title, value in zip(titles, values)]
+
+    def series_history(self, repo, since=None, until=None, limit=None):
+        """
+        Bar chart series stored for a repository, in the bar chart payload layout.
+
+        Args:
+            limit (int): Keep only the latest `limit` periods.
+
+        Returns:
+            dict: "months" plus one list per series, oldest period first.
+        """
+        query = "SELECT DISTINCT period FROM series WHERE repo = ? AND period >= ? AND period <= ? ORDER BY period DESC"
+        args = [repo, since or "", until or "9999-12-31"]
+        if limit:
+            query += " LIMIT ?"
+            args.append(int(limit))
+        periods = [row[0] for row in self.connection.execute(query, args)][::-1]
+        chart = {"months": periods}
+        chart.update({name: [0] * len(periods) for name in BAR_SERIES})
+        if not periods:
+            return chart
+        position = {period: i for i, period in enumerate(periods)}
+        rows = self.connection.execute(
+            "SELECT period, name, value FROM series WHERE repo = ? AND period >= ? AND period <= ?",
+            (repo, periods[0], periods[-1])
+        )
+        for period, name, value in rows:
+            if name in chart:
+                chart[name][position[period]] = _number(value)
+        return chart
+
+
+def apply_trends(store, repo, payload, periods=None, local_deltas=False, delta_days=TREND_DELTA_DAYS):
+    """
+    Records a payload and optionally enriches it from the stored history.
+
+    Args:
+        store (TrendStore): Open store.
+        repo (str): Repository key.
+        payload (dict): Payload with the data API structure, updated in place.
+        periods (int): Replace the bar chart with the latest `periods` stored periods,
+            which can reach further back than the window served by the API.
+        local_deltas (bool): Replace the indicator deltas with deltas against the run
+            recorded `delta_days` days earlier, where one exists.
+
+    Returns:
+        dict: The payload.
+    """
+    store.record_payload(repo, payload)
+    if periods:
+        payload["bar_chart"].update(store.series_history(repo, limit=periods))
+    if local_deltas:
+        indicators = payload["indicators"]
+        deltas = store.local_deltas(repo, indicators["titles"], indicators["values"], days=delta_days)
+        indicators["deltas"] = [local if local is not None else served
+                                for local, served in zip(deltas, indicators["deltas"])]
+    return payload